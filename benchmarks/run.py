@@ -0,0 +1,272 @@
+"""
+Benchmarks the Standings pipeline on synthetic leagues and writes the results
+as JSON, so that runs from different releases can be compared
+
+Drawing writes a real image through Kaleido, which takes about half a second
+per board, so `draw_h2h_plot` only runs in the single-league cases; batch
+cases time the stages which scale with the number of leagues
+
+Example:
+    python -m benchmarks.run --output reports/benchmarks/benchmark.json
+    python -m benchmarks.run --compare baseline.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas
+import plotly
+
+from sleeper_h2h import graphics, synthetic, utils
+from sleeper_h2h.standings import Standings
+
+RESULTS_VERSION = 1
+
+# drawing is timed through to the written image, since Kaleido's export is
+# most of its cost; `run()` removes the image once every case has finished
+IMAGE = Path(tempfile.gettempdir()) / "sleeper_h2h_benchmark.png"
+
+# stages which only run for a single league
+SINGLE_LEAGUE_STAGES = {"draw_h2h_plot"}
+
+
+def _reset_board(std: Standings) -> None:
+
+    """
+    Discards every computed week so that the board is rebuilt from week 1
+    """
+
+    std.board_state = None
+
+
+STAGES: dict[str, tuple[Callable, Callable]] = {
+    "_get_standings_df_exact_points": (
+        _reset_board,
+        lambda std: std._get_standings_df_exact_points() # pylint: disable=W0212
+    ),
+    "make_h2h_board_df": (
+        _reset_board,
+        lambda std: std.make_h2h_board_df()
+    ),
+    "make_h2h_standings_df": (
+        lambda std: None,
+        lambda std: std.make_h2h_standings_df()
+    ),
+    "stringify_h2h_standings_df": (
+        lambda std: None,
+        lambda std: utils.stringify_h2h_standings_df(std.h2h_standings_df)
+    ),
+    "draw_h2h_plot": (
+        lambda std: None,
+        lambda std: graphics.draw_h2h_plot(std.h2h_board_df, IMAGE)
+    ),
+}
+
+
+def time_case(
+        n_teams: int,
+        n_weeks: int,
+        n_leagues: int,
+        repeat: int,
+        seed: int = 0
+    ) -> list[dict]:
+
+    """
+    Times every stage in `STAGES` over `n_leagues` synthetic leagues, then
+    measures each stage's peak memory in a separate pass under `tracemalloc`;
+    stages in `SINGLE_LEAGUE_STAGES` are left out of batches
+
+    Stages run in order for each league, so each stage starts from the output
+    of the stage before it; a case is repeated `ceil(repeat / n_leagues)`
+    times, since large batches already average over many leagues
+
+    RETURNS
+    -------
+    results : list[dict]
+        one result per stage, with the total seconds of each repetition
+    """
+
+    stages = {
+        stage: functions
+        for stage, functions in STAGES.items()
+        if n_leagues == 1 or stage not in SINGLE_LEAGUE_STAGES
+    }
+    snapshots = [
+        synthetic.make_snapshot(
+            n_teams,
+            n_weeks,
+            tie_sizes=(3, 2) if n_teams >= 8 else (),
+            seed=seed + i,
+            league_id=str(i)
+        )
+        for i in range(n_leagues)
+    ]
+    seconds = {stage: [] for stage in stages}
+    peaks = dict.fromkeys(stages, 0)
+
+    for _ in range(math.ceil(repeat / n_leagues)):
+        totals = dict.fromkeys(stages, 0.0)
+        for snapshot in snapshots:
+            std = Standings.from_snapshot(snapshot)
+            for stage, (reset, run) in stages.items():
+                reset(std)
+                start = time.perf_counter()
+                run(std)
+                totals[stage] += time.perf_counter() - start
+        for stage, total in totals.items():
+            seconds[stage].append(total)
+
+    tracemalloc.start()
+    for snapshot in snapshots:
+        std = Standings.from_snapshot(snapshot)
+        for stage, (reset, run) in stages.items():
+            reset(std)
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            run(std)
+            peaks[stage] = max(
+                peaks[stage],
+                tracemalloc.get_traced_memory()[1] - base
+            )
+    tracemalloc.stop()
+
+    return [
+        {
+            "stage": stage,
+            "teams": n_teams,
+            "weeks": n_weeks,
+            "leagues": n_leagues,
+            "seconds": seconds[stage],
+            "min_seconds": min(seconds[stage]),
+            "median_seconds": statistics.median(seconds[stage]),
+            "peak_bytes": peaks[stage],
+        }
+        for stage in stages
+    ]
+
+
+def run(args: argparse.Namespace) -> dict:
+
+    """
+    Runs every case of the teams x weeks grid for a single league, then every
+    batch size in `args.leagues` at `args.batch_teams` and `args.batch_weeks`
+    """
+
+    cases = [(teams, weeks, 1) for teams in args.teams for weeks in args.weeks]
+    cases += [
+        (args.batch_teams, args.batch_weeks, leagues)
+        for leagues in args.leagues
+        if leagues > 1
+    ]
+
+    results = []
+    try:
+        for teams, weeks, leagues in cases:
+            print(
+                f"teams={teams} weeks={weeks} leagues={leagues}",
+                file=sys.stderr
+            )
+            results += time_case(
+                teams,
+                weeks,
+                leagues,
+                args.repeat,
+                args.seed
+            )
+    finally:
+        IMAGE.unlink(missing_ok=True)
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pandas.__version__,
+            "plotly": plotly.__version__,
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+
+    """
+    Lists every stage and case whose median time in `report` exceeds the
+    baseline's by more than `tolerance`, as a fraction of the baseline
+    """
+
+    key = lambda r: (r["stage"], r["teams"], r["weeks"], r["leagues"])
+    medians = {key(r): r["median_seconds"] for r in baseline["results"]}
+    regressions = []
+
+    for result in report["results"]:
+        before = medians.get(key(result))
+        after = result["median_seconds"]
+        if before and after > before * (1 + tolerance):
+            stage, teams, weeks, leagues = key(result)
+            regressions.append(
+                f"{stage} teams={teams} weeks={weeks} leagues={leagues}:" +\
+                f" {before:.6f}s -> {after:.6f}s ({after / before - 1:+.0%})"
+            )
+
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+
+    """
+    Parses arguments, runs the benchmarks and writes the JSON report; returns
+    1 if `--compare` finds a regression
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ints = lambda s: [int(i) for i in s.split(",")]
+    parser.add_argument("--teams", type=ints, default=[8, 12, 16, 24, 32])
+    parser.add_argument("--weeks", type=ints, default=[1, 6, 12, 18])
+    parser.add_argument(
+        "--leagues",
+        type=ints,
+        default=[1, 10, 100, 1000, 10000]
+    )
+    parser.add_argument("--batch-teams", type=int, default=10)
+    parser.add_argument("--batch-weeks", type=int, default=14)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    text = json.dumps(report, indent=2)
+
+    if args.output is None:
+        print(text)
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
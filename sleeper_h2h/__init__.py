@@ -0,0 +1,9 @@
+"""
+A Python API for calculating head-to-head metrics in Sleeper Fantasy Football
+leagues and publishing to Discord
+
+Submodules are not imported here, so that importing one module does not pull
+in the dependencies of every other
+"""
+
+SLEEPER_API_URL = "https://api.sleeper.app/v1"
@@ -0,0 +1,139 @@
+"""
+Fetch layer between sleeper-h2h-tools and the Sleeper API
+"""
+
+import re
+from typing import Callable
+
+from sleeper_wrapper import League
+
+from . import SLEEPER_API_URL, telemetry
+from .cache import ResponseCache
+from .transport import http_get
+
+MATCHUPS_URL = re.compile(r"/matchups/(\d+)$")
+
+
+class SleeperLeague(League):
+
+    """
+    A `League` whose requests are optionally served through a `ResponseCache`
+
+    Matchups of completed weeks are cached permanently, since they can no
+    longer change; a week is completed when the league's status is "complete"
+    or the week is at or before the league's `last_scored_leg` setting. Every
+    response of a complete league, such as a past season, is cached
+    permanently too. Every other response, including rosters, users and the
+    current week's matchups, expires after the cache's TTL
+
+    ATTRIBUTES
+    ----------
+    league_id : int | str
+        the ID of the Sleeper Fantasy Football league
+
+    cache : ResponseCache, default=None
+        `ResponseCache` object instance; every request goes to Sleeper when
+        None
+
+    base_url : str, default=SLEEPER_API_URL
+        root of the Sleeper API, such as the `url` of a local `StandIn`
+        server
+
+    transport : Callable[[str], list | dict | Exception], default=None
+        function which requests a URL and returns its decoded JSON, or the
+        error for an unsuccessful request as `sleeper_wrapper` does, such as
+        a `Recorder` or `Replayer`; requests are made with
+        `transport.http_get()` when None
+    """
+
+    def __init__(
+            self,
+            league_id: int | str,
+            cache: ResponseCache = None,
+            base_url: str = SLEEPER_API_URL,
+            transport: Callable[[str], list | dict | Exception] = None
+        ) -> None:
+
+        # League.__init__() hardcodes the Sleeper URL, so its attributes are
+        # assigned here instead
+        self.cache = cache
+        self.transport = transport
+        self.league_id = league_id
+        self._base_url = f"{base_url.rstrip('/')}/league/{league_id}"
+        self._league = self._call(self._base_url)
+
+    @property
+    def previous_league_id(self) -> str | None:
+
+        """
+        The ID of the league's previous season, or None for its first season
+        """
+
+        league = self._league if isinstance(self._league, dict) else {}
+        previous = league.get("previous_league_id")
+
+        return None if previous in (None, "0", 0) else str(previous)
+
+    def _call(self, url: str) -> list | dict | Exception:
+
+        """
+        Requests `url` through `self.transport`, reading from and writing to
+        `self.cache` if set
+        """
+
+        if self.cache is None:
+            return self.__request(url)
+
+        return self.cache.fetch(
+            url,
+            lambda: self.__request(url),
+            permanent=self.__is_permanent(url)
+        )
+
+    def __request(self, url: str) -> list | dict | Exception:
+
+        """
+        Requests `url` with `self.transport`, or with `http_get()` when None
+        """
+
+        telemetry.count("api_requests")
+
+        with telemetry.span("api_request", url=url):
+            return (self.transport or http_get)(url)
+
+    def __is_permanent(self, url: str) -> bool | Callable[[dict], bool]:
+
+        """
+        Checks if the response to `url` can no longer change: any response of
+        a complete league, or the matchups of a completed week, judged by the
+        league response requested on construction; the league response itself
+        is judged once it arrives
+        """
+
+        league = getattr(self, "_league", None)
+
+        if league is None:
+            return _is_complete
+
+        if not isinstance(league, dict):
+            return False
+
+        if _is_complete(league):
+            return True
+
+        match = MATCHUPS_URL.search(url)
+        if match is None:
+            return False
+
+        last_scored = (league.get("settings") or {}).get("last_scored_leg")
+
+        return last_scored is not None and int(match[1]) <= int(last_scored)
+
+
+def _is_complete(league: list | dict) -> bool:
+
+    """
+    Checks if a league response belongs to a season which is over
+    """
+
+    return isinstance(league, dict) and league.get("status") == "complete"
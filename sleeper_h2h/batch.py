@@ -0,0 +1,173 @@
+"""
+Functions for computing head-to-head standings of many leagues at once
+"""
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait
+)
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from . import SLEEPER_API_URL
+from .cache import ResponseCache
+from .result import StandingsResult
+from .snapshot import SeasonSnapshot
+from .standings import BoardState, Standings
+
+
+@dataclass
+class LeagueResult:
+
+    """
+    Outcome of computing a single league within a batch
+
+    ATTRIBUTES
+    ----------
+    league_id : int | str
+        the ID of the Sleeper Fantasy Football league
+
+    standings : Standings, default=None
+        `Standings` object instance with `board_state` and `result` assigned
+        from the worker process, so `h2h_standings_df` is generated; None if
+        the league failed
+
+    error : Exception, default=None
+        exception raised while fetching or computing the league; None if the
+        league succeeded
+    """
+
+    league_id: int | str
+    standings: Standings = field(default=None)
+    error: Exception = field(default=None)
+
+
+def _fetch(
+        league_id: int | str,
+        max_workers: int,
+        cache: ResponseCache,
+        base_url: str,
+        transport: Callable[[str], list | dict | Exception]
+    ) -> tuple[Standings, SeasonSnapshot]:
+
+    """
+    Instantiates a Standings object, fetches every past week's matchups and
+    takes a snapshot of them; runs in a thread since it is bound by network
+    I/O
+    """
+
+    standings = Standings(
+        league_id,
+        max_workers=max_workers,
+        cache=cache,
+        base_url=base_url,
+        transport=transport
+    )
+
+    return standings, standings.to_snapshot()
+
+
+def _compute(snapshot: SeasonSnapshot) -> tuple[BoardState, StandingsResult]:
+
+    """
+    Generates the head-to-head board and standings of a fetched season; runs
+    in a worker process since it is bound by CPU, and only exchanges NumPy
+    arrays with it rather than the `Standings` object with its client, cache
+    and matchup payloads
+    """
+
+    standings = Standings.from_snapshot(snapshot)
+    standings.make_h2h_standings_df()
+
+    return standings.board_state, standings.result
+
+
+def compute_many(
+        league_ids: Iterable[int | str],
+        workers: int = None,
+        fetch_workers: int = 8,
+        max_workers: int = None,
+        cache: ResponseCache = None,
+        base_url: str = SLEEPER_API_URL,
+        transport: Callable[[str], list | dict | Exception] = None
+    ) -> Iterator[LeagueResult]:
+
+    """
+    Computes the head-to-head standings of many leagues, fetching in a thread
+    pool and computing boards and standings in a process pool
+
+    A league is handed to the process pool as a `SeasonSnapshot` as soon as
+    its data is fetched and is yielded as soon as its board and result come
+    back, so one slow league does not hold up the rest; failures are yielded
+    as results rather than raised
+
+    PARAMETERS
+    ----------
+    league_ids : Iterable[int | str]
+        IDs of the Sleeper Fantasy Football leagues to compute
+
+    workers : int, default=None
+        number of worker processes; defaults to the number of CPUs
+
+    fetch_workers : int, default=8
+        number of leagues fetched concurrently
+
+    max_workers : int, default=None
+        maximum number of concurrent requests within each league, see
+        `Standings`
+
+    cache : ResponseCache, default=None
+        `ResponseCache` object instance shared by every fetch
+
+    base_url : str, default=SLEEPER_API_URL
+        root of the Sleeper API, such as the `url` of a local `StandIn`
+        server
+
+    transport : Callable[[str], list | dict | Exception], default=None
+        function which makes every Sleeper API request, such as a `Replayer`;
+        requests are made with `requests` when None
+
+    RETURNS
+    -------
+    results : Iterator[LeagueResult]
+        one `LeagueResult` per league, in order of completion
+    """
+
+    threads = ThreadPoolExecutor(fetch_workers)
+    processes = ProcessPoolExecutor(workers)
+
+    try:
+        pending = {
+            threads.submit(
+                _fetch,
+                league_id,
+                max_workers,
+                cache,
+                base_url,
+                transport
+            ): (league_id, None)
+            for league_id in league_ids
+        }
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                league_id, standings = pending.pop(future)
+
+                if future.exception() is not None:
+                    yield LeagueResult(league_id, error=future.exception())
+                elif standings is None:
+                    standings, snapshot = future.result()
+                    pending[
+                        processes.submit(_compute, snapshot)
+                    ] = (league_id, standings)
+                else:
+                    standings.board_state, standings.result = future.result()
+                    yield LeagueResult(league_id, standings=standings)
+
+    finally:
+        threads.shutdown(cancel_futures=True)
+        processes.shutdown(cancel_futures=True)
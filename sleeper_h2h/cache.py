@@ -0,0 +1,489 @@
+"""
+Persistent on-disk caches for Sleeper API responses and rendered boards
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from . import telemetry
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+# bump whenever the drawing code changes what a board looks like, so that
+# images rendered by older versions are not served
+RENDER_CACHE_VERSION = 1
+
+# name of a stored image, `<key>.<extension>`; temporary files still being
+# drawn never match
+STORED_IMAGE = re.compile(r"[0-9a-f]{32}\.\w+")
+
+@dataclass
+class ResponseCache:
+
+    """
+    Stores JSON responses in a SQLite database keyed by request URL; entries
+    either expire after `ttl` seconds or, for data which can no longer change
+    such as completed weeks, are kept permanently
+
+    A new SQLite connection is opened for every operation, so a single
+    instance may be shared between threads and pickled into other processes
+
+    ATTRIBUTES
+    ----------
+    path : str | Path, default="~/.cache/sleeper_h2h/responses.sqlite3"
+        path to the SQLite database; parent directories are created as needed
+
+    ttl : float, default=3600
+        number of seconds a non-permanent entry is served before it is
+        fetched again
+
+    hits : int, default=0
+        number of `fetch()` calls served from disk
+
+    misses : int, default=0
+        number of `fetch()` calls which required a request
+
+    METHODS
+    -------
+    get(url)
+        returns the stored response for `url`, or None if absent or expired
+
+    set(url, payload, permanent=False)
+        stores a response for `url`
+
+    fetch(url, call, permanent=False)
+        returns the stored response for `url`, otherwise calls `call()` and
+        stores its response
+
+    clear(prefix=None)
+        deletes every stored response, or those of URLs starting with
+        `prefix`
+    """
+
+    path: str | Path = "~/.cache/sleeper_h2h/responses.sqlite3"
+    ttl: float = 3600
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+
+        """
+        Create the database and its table if they do not exist yet
+        """
+
+        self.path = Path(self.path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.__connect() as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS responses (" +\
+                "url TEXT PRIMARY KEY, payload TEXT NOT NULL, expires REAL)"
+            )
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+
+        """
+        Opens a new connection to the database at `self.path`, committing on
+        success and closing it afterwards
+        """
+
+        con = sqlite3.connect(self.path, timeout=30)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def get(self, url: str) -> list | dict | None:
+
+        """
+        Returns the stored response for a URL
+
+        PARAMETERS
+        ----------
+        url : str
+            request URL the response was stored under
+
+        RETURNS
+        -------
+        payload : list | dict | None
+            decoded JSON response, or None if nothing is stored for `url` or
+            the stored entry has expired
+        """
+
+        with self.__connect() as con:
+            row = con.execute(
+                "SELECT payload, expires FROM responses WHERE url = ?",
+                (url,)
+            ).fetchone()
+
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+
+        return json.loads(row[0])
+
+    def set(
+            self,
+            url: str,
+            payload: list | dict,
+            permanent: bool = False
+        ) -> None:
+
+        """
+        Stores a response for a URL, replacing any existing entry
+
+        PARAMETERS
+        ----------
+        url : str
+            request URL to store the response under
+
+        payload : list | dict
+            JSON-serializable response
+
+        permanent : bool, default=False
+            store the response without an expiry instead of for `self.ttl`
+            seconds
+        """
+
+        expires = None if permanent else time.time() + self.ttl
+
+        with self.__connect() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (url, json.dumps(payload), expires)
+            )
+
+    def fetch(
+            self,
+            url: str,
+            call: Callable[[], list | dict],
+            permanent: bool | Callable[[list | dict], bool] = False
+        ) -> list | dict | Exception:
+
+        """
+        Returns the stored response for a URL, only calling `call()` when
+        nothing is stored or the entry has expired; errors returned by `call()`
+        are passed through without being stored
+
+        PARAMETERS
+        ----------
+        url : str
+            request URL the response is stored under
+
+        call : Callable[[], list | dict]
+            function which requests `url`
+
+        permanent : bool | Callable[[list | dict], bool], default=False
+            store a new response without an expiry; may be a function which
+            decides from the new response, such as whether a league's season
+            is complete
+
+        RETURNS
+        -------
+        payload : list | dict | Exception
+            stored or newly requested response
+        """
+
+        payload = self.get(url)
+
+        if payload is not None:
+            self.hits += 1
+            telemetry.count("cache_hits")
+            return payload
+
+        self.misses += 1
+        telemetry.count("cache_misses")
+        payload = call()
+
+        if not isinstance(payload, Exception):
+            if callable(permanent):
+                permanent = permanent(payload)
+            self.set(url, payload, permanent)
+
+        return payload
+
+    def clear(self, prefix: str = None) -> None:
+
+        """
+        Deletes every stored response, including permanent ones
+
+        PARAMETERS
+        ----------
+        prefix : str, default=None
+            only delete the responses of URLs starting with `prefix`, such as
+            every week of a league's matchups; every response when None
+        """
+
+        with self.__connect() as con:
+            if prefix is None:
+                con.execute("DELETE FROM responses")
+            else:
+                con.execute(
+                    "DELETE FROM responses WHERE substr(url, 1, ?) = ?",
+                    (len(prefix), prefix)
+                )
+
+
+@dataclass
+class RenderCache:
+
+    """
+    Stores rendered board images in a directory, named by a hash of the
+    board's labels and values plus the render options, so that a board which
+    has not changed since it was last drawn is never drawn again
+
+    Files are written atomically and the least recently used are deleted once
+    the directory holds more than `max_bytes`; a single instance may be
+    shared between threads, and several instances or processes may share a
+    directory, since eviction only touches files named `<key>.<extension>`
+
+    ATTRIBUTES
+    ----------
+    path : str | Path, default="~/.cache/sleeper_h2h/renders"
+        directory holding the images; created as needed
+
+    max_bytes : int, default=268435456
+        total size of stored images above which the least recently used are
+        deleted
+
+    hits : int, default=0
+        number of `render()` calls served from disk
+
+    misses : int, default=0
+        number of `render()` calls which drew the board
+
+    METHODS
+    -------
+    key(h2h_board_df, **options)
+        returns the hash a board and its render options are stored under
+
+    get(key, extension)
+        returns the path of a stored image, or None if absent
+
+    render(h2h_board_df, write_dest=None, backend="plotly", extension=None)
+        returns the path of the board's image, drawing it only on a miss
+
+    clear()
+        deletes every stored image
+    """
+
+    path: str | Path = "~/.cache/sleeper_h2h/renders"
+    max_bytes: int = 256 * 2**20
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+
+        """
+        Create the directory if it does not exist yet
+        """
+
+        self.path = Path(self.path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(h2h_board_df: "DataFrame", **options) -> str:
+
+        """
+        Returns a stable hash of a board's team labels, winrates and points,
+        and of the render options
+
+        PARAMETERS
+        ----------
+        h2h_board_df : DataFrame
+            a DataFrame generated by `Standings.make_h2h_board_df()`
+
+        **options
+            JSON-serializable render options, such as the backend
+
+        RETURNS
+        -------
+        key : str
+            hexadecimal BLAKE2b digest
+        """
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(
+            [
+                RENDER_CACHE_VERSION,
+                [str(i) for i in h2h_board_df.index],
+                [str(c) for c in h2h_board_df.columns],
+                options
+            ],
+            sort_keys=True
+        ).encode())
+        digest.update(h2h_board_df.to_numpy(dtype=float).tobytes())
+
+        return digest.hexdigest()
+
+    def get(self, key: str, extension: str) -> Path | None:
+
+        """
+        Returns the path of the image stored under `key`, marking it as
+        recently used, or None if nothing is stored
+        """
+
+        path = self.path / f"{key}.{extension}"
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return path
+
+    def render(
+            self,
+            h2h_board_df: "DataFrame",
+            write_dest: str | Path = None,
+            backend: str = "plotly",
+            extension: str = None
+        ) -> Path:
+
+        """
+        Returns the stored image of a board, drawing it with
+        `graphics.draw_h2h_plot()` only when no image of the same board and
+        options is stored
+
+        PARAMETERS
+        ----------
+        h2h_board_df : DataFrame
+            a DataFrame generated by `Standings.make_h2h_board_df()`
+
+        write_dest : str | Path, default=None
+            path the image is copied to; the stored image's path is returned
+            when None, which may be deleted by a later eviction
+
+        backend : str, default="plotly"
+            `draw_h2h_plot()` backend
+
+        extension : str, default=None
+            image format; "svg" for the "svg" backend and "png" otherwise when
+            None, or the suffix of `write_dest` when supplied
+
+        RETURNS
+        -------
+        path : Path
+            `write_dest`, or the stored image when `write_dest` is None
+        """
+
+        if extension is None:
+            if write_dest is not None:
+                extension = Path(write_dest).suffix.lstrip(".")
+            else:
+                extension = "svg" if backend == "svg" else "png"
+
+        key = self.key(h2h_board_df, backend=backend, extension=extension)
+        path = self.get(key, extension)
+
+        if path is not None:
+            self.hits += 1
+            telemetry.count("render_cache_hits")
+        else:
+            self.misses += 1
+            telemetry.count("render_cache_misses")
+            path = self.__draw(h2h_board_df, key, backend, extension)
+
+        if write_dest is None:
+            return path
+
+        shutil.copyfile(path, write_dest)
+
+        return Path(write_dest)
+
+    def __draw(
+            self,
+            h2h_board_df: "DataFrame",
+            key: str,
+            backend: str,
+            extension: str
+        ) -> Path:
+
+        """
+        Draws a board to a temporary file, moves it into place, then evicts
+        the least recently used images
+        """
+
+        from .graphics import draw_h2h_plot # pylint: disable=C0415
+
+        fd, tmp = tempfile.mkstemp(suffix=f".{extension}", dir=self.path)
+        os.close(fd)
+        path = self.path / f"{key}.{extension}"
+
+        try:
+            draw_h2h_plot(h2h_board_df, tmp, backend=backend)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+        self.__evict(keep=path)
+
+        return path
+
+    def __evict(self, keep: Path) -> None:
+
+        """
+        Deletes the least recently used images, other than `keep`, until the
+        directory holds at most `self.max_bytes`
+        """
+
+        files = []
+        for entry in self.__stored():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if Path(path) == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def __stored(self) -> list[os.DirEntry]:
+
+        """
+        Returns the directory entries of stored images, skipping temporary
+        files which other threads or processes are still drawing and anything
+        else in the directory
+        """
+
+        return [
+            entry for entry in os.scandir(self.path)
+            if STORED_IMAGE.fullmatch(entry.name) and \
+                entry.is_file(follow_symlinks=False)
+        ]
+
+    def clear(self) -> None:
+
+        """
+        Deletes every stored image
+        """
+
+        for entry in self.__stored():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
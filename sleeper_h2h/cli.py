@@ -0,0 +1,380 @@
+"""
+The `sleeper-h2h` command line interface
+
+Only what a subcommand needs is imported: `standings`, `board` and a text-only
+`post` never import Plotly or start Kaleido
+"""
+
+import argparse
+import contextlib
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import telemetry
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+def _load(args: argparse.Namespace):
+
+    """
+    Builds a Standings object from a league ID, or from a snapshot path when
+    `--snapshot` is passed, and generates its head-to-head standings
+    """
+
+    from .standings import Standings # pylint: disable=C0415
+
+    if args.snapshot:
+        standings = Standings.from_snapshot(args.league, mmap=True)
+    else:
+        cache = None
+        if args.cache is not None:
+            from .cache import ResponseCache # pylint: disable=C0415
+            cache = ResponseCache(args.cache, args.ttl)
+
+        standings = Standings(
+            args.league,
+            max_workers=args.max_workers,
+            cache=cache
+        )
+
+    standings.make_h2h_standings_df()
+
+    return standings
+
+
+def _standings(args: argparse.Namespace) -> int:
+
+    """
+    Prints the head-to-head adjusted standings
+    """
+
+    df = _load(args).h2h_standings_df
+
+    if args.format == "text":
+        from .utils import stringify_h2h_standings_df # pylint: disable=C0415
+        print(stringify_h2h_standings_df(df), end="")
+    elif args.format == "csv":
+        print(df.to_csv(index=False), end="")
+    else:
+        print(df.to_json(orient="records"))
+
+    return 0
+
+
+def _board(args: argparse.Namespace) -> int:
+
+    """
+    Prints the head-to-head winrate board
+    """
+
+    df = _load(args).h2h_board_df
+
+    if args.format == "text":
+        print(df.to_string())
+    elif args.format == "csv":
+        print(df.to_csv(), end="")
+    else:
+        print(df.to_json(orient="index"))
+
+    return 0
+
+
+def _render(args: argparse.Namespace) -> int:
+
+    """
+    Writes the head-to-head winrate board to an image
+    """
+
+    _draw(args, _load(args).h2h_board_df, args.output, args.backend)
+
+    return 0
+
+
+def _draw(
+        args: argparse.Namespace,
+        h2h_board_df: "DataFrame",
+        output: Path,
+        backend: str
+    ) -> None:
+
+    """
+    Writes a board image, through a `RenderCache` when `--render-cache` is
+    passed
+    """
+
+    if args.render_cache is not None:
+        from .cache import RenderCache # pylint: disable=C0415
+        RenderCache(args.render_cache).render(h2h_board_df, output, backend)
+    else:
+        from .graphics import draw_h2h_plot # pylint: disable=C0415
+        draw_h2h_plot(h2h_board_df, output, backend=backend)
+
+
+def _post(args: argparse.Namespace) -> int:
+
+    """
+    Posts the head-to-head adjusted standings to a Discord webhook, with the
+    board image attached when `--image` or `--render` is passed
+    """
+
+    from .discord import DeliveryQueue, Message # pylint: disable=C0415
+    from .utils import stringify_h2h_standings_df # pylint: disable=C0415
+
+    standings = _load(args)
+    image = args.image
+
+    with contextlib.ExitStack() as stack:
+        if args.render is not None:
+            from tempfile import TemporaryDirectory # pylint: disable=C0415
+
+            # the rendered image is only needed until it has been sent
+            tmp_dir = stack.enter_context(TemporaryDirectory())
+            extension = "svg" if args.render == "svg" else "png"
+            image = Path(tmp_dir) / f"h2h_board.{extension}"
+            _draw(args, standings.h2h_board_df, image, args.render)
+
+        message = Message(
+            args.webhook,
+            stringify_h2h_standings_df(standings.h2h_standings_df),
+            image
+        )
+
+        with DeliveryQueue(max_workers=1) as deliveries:
+            delivery = deliveries.send_many([message])[0]
+
+    if delivery.ok:
+        return 0
+
+    reason = delivery.error or f"HTTP {delivery.response.status_code}"
+    print(f"sleeper-h2h: delivery failed: {reason}", file=sys.stderr)
+
+    return 1
+
+
+def _serve(args: argparse.Namespace) -> int:
+
+    """
+    Serves standings queries over HTTP until interrupted
+    """
+
+    import threading # pylint: disable=C0415
+    from .service import QueryService # pylint: disable=C0415
+
+    cache = None
+    if args.cache is not None:
+        from .cache import ResponseCache # pylint: disable=C0415
+        cache = ResponseCache(args.cache, args.ttl)
+
+    service = QueryService(
+        args.host,
+        args.port,
+        args.max_size,
+        args.max_age,
+        args.max_workers,
+        cache
+    )
+
+    with service:
+        print(f"Serving head-to-head standings at {service.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+
+    """
+    Returns the argument parser of every subcommand
+    """
+
+    league = argparse.ArgumentParser(add_help=False)
+    league.add_argument(
+        "league",
+        help="Sleeper league ID, or a snapshot path with --snapshot"
+    )
+    league.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="read the league from a SeasonSnapshot .npz file"
+    )
+    league.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="maximum number of concurrent Sleeper API requests"
+    )
+    league.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="path of a SQLite response cache"
+    )
+    league.add_argument(
+        "--ttl",
+        type=float,
+        default=3600,
+        help="seconds before cached rosters, users and the current week expire"
+    )
+    league.add_argument(
+        "--telemetry",
+        type=Path,
+        default=None,
+        help="write per-stage timings and counters to this JSON, or .prom, file"
+    )
+
+    render_cache = argparse.ArgumentParser(add_help=False)
+    render_cache.add_argument(
+        "--render-cache",
+        type=Path,
+        default=None,
+        help="directory of rendered boards reused when a board is unchanged"
+    )
+
+    formats = argparse.ArgumentParser(add_help=False)
+    formats.add_argument(
+        "--format",
+        choices=["text", "csv", "json"],
+        default="text"
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="sleeper-h2h",
+        description="Head-to-head standings for Sleeper Fantasy Football"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser(
+        "standings",
+        parents=[league, formats],
+        help="print the head-to-head adjusted standings"
+    )
+    command.set_defaults(func=_standings)
+
+    command = commands.add_parser(
+        "board",
+        parents=[league, formats],
+        help="print the head-to-head winrate board"
+    )
+    command.set_defaults(func=_board)
+
+    command = commands.add_parser(
+        "render",
+        parents=[league, render_cache],
+        help="write the head-to-head winrate board to an image"
+    )
+    command.add_argument("output", type=Path, help="image path to write")
+    command.add_argument(
+        "--backend",
+        choices=["plotly", "svg", "raster"],
+        default="plotly"
+    )
+    command.set_defaults(func=_render)
+
+    command = commands.add_parser(
+        "post",
+        parents=[league, render_cache],
+        help="post the head-to-head adjusted standings to a Discord webhook"
+    )
+    command.add_argument("webhook", help="Discord webhook URL")
+    image = command.add_mutually_exclusive_group()
+    image.add_argument(
+        "--image",
+        type=Path,
+        default=None,
+        help="attach an existing image"
+    )
+    image.add_argument(
+        "--render",
+        choices=["plotly", "svg", "raster"],
+        default=None,
+        help="render the board with this backend and attach it"
+    )
+    command.set_defaults(func=_post)
+
+    command = commands.add_parser(
+        "serve",
+        help="serve standings, boards and images over HTTP"
+    )
+    command.add_argument("--host", default="127.0.0.1")
+    command.add_argument("--port", type=int, default=8000)
+    command.add_argument(
+        "--max-size",
+        type=int,
+        default=256,
+        help="maximum number of computed boards kept in memory"
+    )
+    command.add_argument(
+        "--max-age",
+        type=float,
+        default=300,
+        help="seconds for which current standings are served from memory"
+    )
+    command.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="maximum number of concurrent Sleeper API requests"
+    )
+    command.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="path of a SQLite response cache"
+    )
+    command.add_argument(
+        "--ttl",
+        type=float,
+        default=3600,
+        help="seconds before cached rosters, users and the current week expire"
+    )
+    command.add_argument(
+        "--telemetry",
+        type=Path,
+        default=None,
+        help="write per-stage timings and counters to this JSON, or .prom, file"
+    )
+    command.set_defaults(func=_serve)
+
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+
+    """
+    Runs the `sleeper-h2h` command line interface
+
+    PARAMETERS
+    ----------
+    argv : list[str], default=None
+        command line arguments; `sys.argv[1:]` when None
+
+    RETURNS
+    -------
+    status : int
+        exit status of the subcommand
+    """
+
+    args = _parser().parse_args(argv)
+
+    if args.telemetry is not None:
+        report = telemetry.enable()
+
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"sleeper-h2h: error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.telemetry is not None:
+            telemetry.disable()
+            report.save(args.telemetry)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,567 @@
+"""
+Long-running scheduler which polls many leagues and only recomputes, renders
+and posts a league when its matchup data changes
+
+Example:
+    python -m sleeper_h2h.daemon leagues.txt --backend raster --out-dir boards
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable
+from zoneinfo import ZoneInfo
+
+from . import SLEEPER_API_URL, telemetry, utils
+from .cache import RenderCache, ResponseCache
+from .standings import Standings, _raise_for_error
+
+if TYPE_CHECKING:
+    from .api import SleeperLeague
+    from .discord import DeliveryQueue
+    from .standings import BoardState
+
+# (weekday, start hour, end hour) in US Eastern time, Monday being 0; Tuesday
+# morning is when Sleeper scores the week and applies stat corrections
+GAME_WINDOWS = (
+    (3, 19, 24),
+    (6, 9, 24),
+    (0, 19, 24),
+    (1, 0, 12)
+)
+
+
+def fingerprint(rosters: list[dict], records: list[tuple]) -> str:
+
+    """
+    Returns a digest of every roster's record and one week of matchups, which
+    changes whenever the standings or that week's scores do
+
+    PARAMETERS
+    ----------
+    rosters : list[dict]
+        `League.get_rosters()` instance
+
+    records : list[tuple]
+        `(roster_id, matchup_id, points)` tuples of a week
+
+    RETURNS
+    -------
+    digest : str
+        hexadecimal BLAKE2b digest
+    """
+
+    settings = ("wins", "losses", "ties", "fpts", "fpts_decimal")
+    payload = [
+        sorted(
+            [roster["roster_id"]] +
+            [(roster.get("settings") or {}).get(key) for key in settings]
+            for roster in rosters
+        ),
+        sorted(records, key=lambda record: record[0])
+    ]
+
+    return hashlib.blake2b(
+        json.dumps(payload).encode(),
+        digest_size=16
+    ).hexdigest()
+
+
+@dataclass
+class Schedule:
+
+    """
+    Polling intervals tuned to NFL game windows: leagues are polled often
+    while games are played or scored, and rarely otherwise
+
+    ATTRIBUTES
+    ----------
+    active : float, default=300
+        seconds between polls during a game window
+
+    idle : float, default=3600
+        maximum seconds between polls outside game windows; a poll is never
+        scheduled past the start of the next window
+
+    windows : tuple, default=GAME_WINDOWS
+        `(weekday, start hour, end hour)` tuples, Monday being 0
+
+    timezone : str, default="America/New_York"
+        time zone of `windows`
+
+    METHODS
+    -------
+    interval(now=None)
+        returns the seconds to wait before the next poll
+    """
+
+    active: float = 300
+    idle: float = 3600
+    windows: tuple = GAME_WINDOWS
+    timezone: str = "America/New_York"
+
+    def interval(self, now: datetime = None) -> float:
+
+        """
+        Returns the seconds to wait before the next poll
+
+        PARAMETERS
+        ----------
+        now : datetime, default=None
+            time zone aware time to schedule from; the current time when None
+
+        RETURNS
+        -------
+        seconds : float
+            `self.active` inside a game window, otherwise `self.idle` or the
+            time until the next window starts, whichever is sooner
+        """
+
+        zone = ZoneInfo(self.timezone)
+        now = datetime.now(zone) if now is None else now.astimezone(zone)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        wait = self.idle
+        for days in range(8):
+            day = midnight + timedelta(days=days)
+            for weekday, start, end in self.windows:
+                if day.weekday() != weekday:
+                    continue
+                opens = day + timedelta(hours=start)
+                closes = day + timedelta(hours=end)
+                if opens <= now < closes:
+                    return self.active
+                if now < opens:
+                    wait = min(wait, (opens - now).total_seconds())
+
+        return wait
+
+
+@dataclass
+class LeagueJob:
+
+    """
+    A league polled by a `Daemon`, with the state kept between polls
+
+    ATTRIBUTES
+    ----------
+    league_id : int | str
+        the ID of the Sleeper Fantasy Football league
+
+    webhook_url : str, default=None
+        Discord webhook to post to whenever the league changes; nothing is
+        posted when None
+
+    fingerprints : dict, default={}
+        dictionary mapping week to the `fingerprint()` last seen for it
+
+    standings : Standings, default=None
+        `Standings` object instance from the last recompute, whose
+        `board_state` lets the next recompute apply only new weeks
+
+    image_path : Path, default=None
+        board image written by the last recompute
+
+    updates : int, default=0
+        number of recomputes
+
+    error : Exception, default=None
+        exception raised by the last poll; None if it succeeded
+    """
+
+    league_id: int | str
+    webhook_url: str = field(default=None)
+    fingerprints: dict = field(init=False, default_factory=dict)
+    standings: Standings = field(init=False, default=None)
+    image_path: Path = field(init=False, default=None)
+    updates: int = field(init=False, default=0)
+    error: Exception = field(init=False, default=None)
+
+
+@dataclass
+class Daemon:
+
+    """
+    Polls every league on a `Schedule`, keeping each league's state in
+    memory between ticks
+
+    Each poll requests only the league, its rosters and the matchups of its
+    most recently played week, and compares their `fingerprint()` with the
+    last one; since rosters carry each team's season points, a correction to
+    any week changes the fingerprint. A league is recomputed, rendered and
+    posted only when it changed, applying just the new week to its board
+    unless a week already applied was corrected
+
+    ATTRIBUTES
+    ----------
+    jobs : Iterable[LeagueJob]
+        `LeagueJob` object instances to poll
+
+    schedule : Schedule, default=Schedule()
+        `Schedule` object instance deciding the time between ticks
+
+    poll_workers : int, default=8
+        number of leagues polled concurrently
+
+    max_workers : int, default=None
+        maximum number of concurrent requests within each league, see
+        `Standings`
+
+    cache : ResponseCache, default=None
+        `ResponseCache` object instance shared by every recompute; polls
+        always go to Sleeper and replace the cached rosters, and a league's
+        cached matchups are dropped when a past week was corrected
+
+    base_url : str, default=SLEEPER_API_URL
+        root of the Sleeper API, such as the `url` of a local `StandIn`
+        server
+
+    transport : Callable[[str], list | dict | Exception], default=None
+        function which makes every Sleeper API request; requests are made
+        with `requests` when None
+
+    backend : str, default=None
+        `draw_h2h_plot()` backend used to render each changed board; nothing
+        is rendered when None
+
+    out_dir : str | Path, default="boards"
+        directory rendered boards are written to
+
+    render_cache : RenderCache, default=None
+        `RenderCache` object instance; a board identical to one already
+        rendered is copied from it rather than drawn again
+
+    on_update : Callable[[LeagueJob], None], default=None
+        function called with every job which was recomputed
+
+    METHODS
+    -------
+    poll(job)
+        polls one league, recomputing it if it changed
+
+    tick()
+        polls every league once
+
+    run(stop=None)
+        ticks on the schedule until `stop` is set or the process is
+        interrupted
+    """
+
+    jobs: Iterable[LeagueJob]
+    schedule: Schedule = field(default_factory=Schedule)
+    poll_workers: int = 8
+    max_workers: int = None
+    cache: ResponseCache = field(default=None)
+    base_url: str = field(default=SLEEPER_API_URL)
+    transport: Callable[[str], list | dict | Exception] = field(default=None)
+    backend: str = field(default=None)
+    out_dir: str | Path = field(default="boards")
+    render_cache: RenderCache = field(default=None)
+    on_update: Callable[[LeagueJob], None] = field(default=None)
+    __deliveries: "DeliveryQueue" = field(init=False, default=None, repr=False)
+    __lock: threading.Lock = field(
+        init=False,
+        default_factory=threading.Lock,
+        repr=False
+    )
+
+    def __post_init__(self) -> None:
+
+        """
+        Store the jobs as a list
+        """
+
+        self.jobs = list(self.jobs)
+        self.out_dir = Path(self.out_dir).expanduser()
+
+    def poll(self, job: LeagueJob) -> bool:
+
+        """
+        Fingerprints the league's rosters and most recently played week and
+        recomputes, renders and posts the league if the fingerprint is new; a
+        league which has not played a week yet is never recomputed
+
+        PARAMETERS
+        ----------
+        job : LeagueJob
+            `LeagueJob` object instance to poll
+
+        RETURNS
+        -------
+        changed : bool
+            whether the league was recomputed
+
+        RAISES
+        ------
+        exception : Exception
+            errors while requesting or computing are raised to the caller
+        """
+
+        from .api import SleeperLeague # pylint: disable=C0415
+
+        with telemetry.span("daemon_poll", league_id=str(job.league_id)):
+            league = SleeperLeague(
+                job.league_id,
+                base_url=self.base_url,
+                transport=self.transport
+            )
+            rosters = _raise_for_error(league.get_rosters())
+            week = max(
+                (
+                    sum(
+                        (roster.get("settings") or {}).get(key) or 0
+                        for key in ("wins", "losses", "ties")
+                    )
+                    for roster in rosters
+                ),
+                default=0
+            )
+
+            # nothing has been played yet
+            if week == 0:
+                return False
+
+            records = [
+                (i["roster_id"], i["matchup_id"], i["points"])
+                for i in _raise_for_error(league.get_matchups(week))
+            ]
+            digest = fingerprint(rosters, records)
+            if job.fingerprints.get(week) == digest:
+                return False
+
+            self.__recompute(job, league, week, rosters, records)
+            job.fingerprints[week] = digest
+
+        return True
+
+    def __recompute(
+            self,
+            job: LeagueJob,
+            league: "SleeperLeague",
+            week: int,
+            rosters: list[dict],
+            records: list[tuple]
+        ) -> None:
+
+        """
+        Rebuilds the league's standings, renders the board and queues a post
+
+        The previous board is only extended when exactly one week was played
+        since, and is applied to a copy so that a failed recompute leaves the
+        job as it was. When any team's points then differ from its roster
+        total, a week already applied or cached was corrected, so the
+        league's cached matchups are dropped and the season is replayed
+        """
+
+        base_url = league._base_url # pylint: disable=W0212
+
+        # the polled rosters decide the current week, so a stale cached copy
+        # must not be read
+        if self.cache is not None:
+            self.cache.set(f"{base_url}/rosters", rosters)
+
+        board_state = None
+        if job.standings is not None and \
+                job.standings.board_state.week == week:
+            board_state = copy.deepcopy(job.standings.board_state)
+
+        standings = self.__standings(job, week, records, board_state)
+
+        if (board_state is not None or self.cache is not None) and \
+                not _totals_match(standings, rosters):
+            if self.cache is not None:
+                self.cache.clear(f"{base_url}/matchups/")
+            standings = self.__standings(job, week, records, None)
+
+        job.standings = standings
+        job.updates += 1
+
+        if self.backend is not None:
+            from .graphics import draw_h2h_plot # pylint: disable=C0415
+
+            extension = "svg" if self.backend == "svg" else "png"
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            job.image_path = self.out_dir / f"{job.league_id}.{extension}"
+            if self.render_cache is not None:
+                self.render_cache.render(
+                    standings.h2h_board_df,
+                    job.image_path,
+                    backend=self.backend
+                )
+            else:
+                draw_h2h_plot(
+                    standings.h2h_board_df,
+                    job.image_path,
+                    backend=self.backend
+                )
+
+        if job.webhook_url is not None:
+            self.__post(job)
+
+        if self.on_update is not None:
+            self.on_update(job)
+
+    def __standings(
+            self,
+            job: LeagueJob,
+            week: int,
+            records: list[tuple],
+            board_state: "BoardState"
+        ) -> Standings:
+
+        """
+        Returns the league's ranked standings, built on `board_state` when
+        given, with the polled matchups of `week`
+        """
+
+        standings = Standings(
+            job.league_id,
+            max_workers=self.max_workers,
+            cache=self.cache,
+            board_state=board_state,
+            base_url=self.base_url,
+            transport=self.transport
+        )
+        # the polled week is fresher than any cached copy
+        # pylint: disable-next=W0212
+        standings._metadata.matchups.put(week, records)
+        standings.make_h2h_standings_df()
+
+        return standings
+
+    def __post(self, job: LeagueJob) -> None:
+
+        """
+        Queues the league's standings, and board if rendered, on a shared
+        `DeliveryQueue` without waiting for Discord
+        """
+
+        # pylint: disable-next=C0415
+        from .discord import DeliveryQueue, Message
+
+        with self.__lock:
+            if self.__deliveries is None:
+                self.__deliveries = DeliveryQueue()
+
+        self.__deliveries.submit(Message(
+            job.webhook_url,
+            utils.stringify_h2h_standings_df(job.standings.h2h_standings_df),
+            job.image_path
+        ))
+
+    def tick(self) -> list[LeagueJob]:
+
+        """
+        Polls every league once; a league which fails keeps its state and
+        records the error in `LeagueJob.error`
+
+        RETURNS
+        -------
+        changed : list[LeagueJob]
+            jobs which were recomputed
+        """
+
+        def poll(job: LeagueJob) -> bool:
+            try:
+                changed = self.poll(job)
+            except Exception as e: # pylint: disable=W0718
+                job.error = e
+                return False
+            job.error = None
+            return changed
+
+        changed = utils.map_threaded(poll, self.jobs, self.poll_workers)
+
+        return [job for job, c in zip(self.jobs, changed) if c]
+
+    def run(self, stop: threading.Event = None) -> None:
+
+        """
+        Ticks, then waits for `self.schedule`, until `stop` is set or the
+        process is interrupted; queued posts are delivered before returning
+
+        PARAMETERS
+        ----------
+        stop : threading.Event, default=None
+            event which ends the loop once set
+        """
+
+        stop = stop or threading.Event()
+
+        try:
+            while not stop.is_set():
+                self.tick()
+                stop.wait(self.schedule.interval())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.__deliveries is not None:
+                self.__deliveries.close()
+
+
+def _totals_match(standings: Standings, rosters: list[dict]) -> bool:
+
+    """
+    Checks if every team's exact points equal the season total of its roster,
+    `fpts` plus `fpts_decimal` hundredths
+    """
+
+    totals = {}
+    for roster in rosters:
+        settings = roster.get("settings") or {}
+        totals[roster["roster_id"]] = (settings.get("fpts") or 0) + \
+            (settings.get("fpts_decimal") or 0) / 100
+
+    return all(
+        abs(points - totals.get(int(roster_id), 0)) < 0.005
+        for roster_id, points in zip(
+            standings.result.roster_ids,
+            standings.result.points
+        )
+    )
+
+
+def main(argv: list[str] = None) -> None:
+
+    """
+    Polls the leagues listed in a file, one `league_id [webhook_url]` per
+    line, until interrupted
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("leagues", type=Path)
+    parser.add_argument("--backend", choices=["plotly", "svg", "raster"])
+    parser.add_argument("--out-dir", type=Path, default=Path("boards"))
+    parser.add_argument("--cache", type=Path, default=None)
+    parser.add_argument("--render-cache", type=Path, default=None)
+    parser.add_argument("--poll-workers", type=int, default=8)
+    parser.add_argument("--active", type=float, default=300)
+    parser.add_argument("--idle", type=float, default=3600)
+    args = parser.parse_args(argv)
+
+    jobs = [
+        LeagueJob(*line.split()[:2])
+        for line in args.leagues.read_text().splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+
+    Daemon(
+        jobs,
+        Schedule(args.active, args.idle),
+        poll_workers=args.poll_workers,
+        cache=None if args.cache is None else ResponseCache(args.cache),
+        backend=args.backend,
+        out_dir=args.out_dir,
+        render_cache=None if args.render_cache is None else \
+            RenderCache(args.render_cache),
+        on_update=lambda job: print(f"Updated league {job.league_id}")
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,23 @@
 Functions for delivering head-to-head information to Discord
 """
 
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
-from discord_webhook import DiscordWebhook, DiscordEmbed
-from requests import Response
+from . import telemetry
 
-def send_text(webhook_url: str, content: str) -> Response:
+if TYPE_CHECKING:
+    from requests import Response, Session
+
+BOARD_TITLE = "A new H2H board has been generated!"
+
+def send_text(webhook_url: str, content: str) -> "Response":
 
     """
     Sends a string over a Discord webhook request
@@ -26,12 +37,16 @@ def send_text(webhook_url: str, content: str) -> Response:
         a requests Response object
     """
 
+    from discord_webhook import DiscordWebhook # pylint: disable=C0415
+
     webhook = DiscordWebhook(url=webhook_url, content=content)
-    response = webhook.execute()
+    with telemetry.span("discord_post"):
+        response = webhook.execute()
+    telemetry.count("discord_requests")
 
     return response
 
-def send_image(webhook_url: str, content_path: str) -> Response:
+def send_image(webhook_url: str, content_path: str) -> "Response":
 
     """
     Sends an image over a Discord webhook request
@@ -50,6 +65,9 @@ def send_image(webhook_url: str, content_path: str) -> Response:
         a requests Response object
     """
 
+    # pylint: disable-next=C0415
+    from discord_webhook import DiscordEmbed, DiscordWebhook
+
     webhook = DiscordWebhook(url=webhook_url)
     filename = Path(content_path).name
 
@@ -58,10 +76,376 @@ def send_image(webhook_url: str, content_path: str) -> Response:
 
     embed = DiscordEmbed(
         url=webhook_url,
-        title="A new H2H board has been generated!"
+        title=BOARD_TITLE
     )
     embed.set_image(url=f"attachment://{filename}")
     webhook.add_embed(embed)
-    response = webhook.execute()
+    with telemetry.span("discord_post"):
+        response = webhook.execute()
+    telemetry.count("discord_requests")
 
     return response
+
+
+@dataclass
+class Message:
+
+    """
+    A post to a Discord webhook; text and an image are sent together in one
+    multipart request
+
+    ATTRIBUTES
+    ----------
+    webhook_url : str
+        string of the webhook URL
+
+    content : str, default=None
+        string content to publish, such as the output of
+        `utils.stringify_h2h_standings_df()`
+
+    image_path : str | Path, default=None
+        path of an image to publish as an embed, such as one written by
+        `graphics.draw_h2h_plot()`
+    """
+
+    webhook_url: str
+    content: str = field(default=None)
+    image_path: str | Path = field(default=None)
+
+
+@dataclass
+class Delivery:
+
+    """
+    Outcome of delivering a single `Message`
+
+    ATTRIBUTES
+    ----------
+    message : Message
+        the delivered message
+
+    response : Response, default=None
+        the final response from Discord; None if no response was received
+
+    attempts : int, default=0
+        number of requests made, including those retried after a 429
+
+    error : Exception, default=None
+        exception raised while sending or reading the response; None if the
+        message was sent without error
+    """
+
+    message: Message
+    response: "Response" = field(default=None)
+    attempts: int = field(default=0)
+    error: Exception = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+
+        """
+        Whether Discord accepted the message
+        """
+
+        return self.response is not None and self.response.ok
+
+
+@dataclass
+class DeliveryQueue:
+
+    """
+    Delivers messages to Discord webhooks through a thread pool sharing one
+    HTTP session, following Discord's rate limits
+
+    Messages to the same webhook are sent one at a time in the order they
+    were submitted, waiting out the webhook's rate-limit bucket whenever
+    Discord reports it empty, while different webhooks are posted to
+    concurrently; 429 responses are retried after their `retry_after`, and
+    global rate limits pause every webhook
+
+    ATTRIBUTES
+    ----------
+    max_workers : int, default=8
+        maximum number of webhooks posted to concurrently
+
+    max_retries : int, default=5
+        maximum number of times a message is retried after a 429 response
+
+    timeout : float, default=30
+        seconds to wait for each response
+
+    session : Session, default=None
+        `requests.Session` object instance shared by every request; one is
+        created when None
+
+    METHODS
+    -------
+    submit(message)
+        queues a message and returns a Future of its `Delivery`
+
+    send_many(messages)
+        queues messages and waits for every `Delivery`
+
+    close()
+        waits for queued messages, then shuts down the pool and session
+    """
+
+    max_workers: int = 8
+    max_retries: int = 5
+    timeout: float = 30
+    session: "Session" = field(default=None)
+    __pool: ThreadPoolExecutor = field(init=False, default=None, repr=False)
+    __lanes: dict = field(init=False, default_factory=dict, repr=False)
+    __reset_at: dict = field(init=False, default_factory=dict, repr=False)
+    __global_reset_at: float = field(init=False, default=0, repr=False)
+    __lock: threading.Lock = field(
+        init=False,
+        default_factory=threading.Lock,
+        repr=False
+    )
+
+    def __post_init__(self) -> None:
+
+        """
+        Create the thread pool and the shared session
+        """
+
+        if self.session is None:
+            from requests import Session # pylint: disable=C0415
+            self.session = Session()
+        self.__pool = ThreadPoolExecutor(self.max_workers)
+
+    def submit(self, message: Message) -> Future:
+
+        """
+        Queues a message behind any other message to the same webhook
+
+        PARAMETERS
+        ----------
+        message : Message
+            `Message` object instance to deliver
+
+        RETURNS
+        -------
+        future : Future
+            Future resolving to the message's `Delivery`; failures are
+            reported through `Delivery.error` rather than raised
+        """
+
+        future = Future()
+
+        with self.__lock:
+            lane = self.__lanes.get(message.webhook_url)
+            idle = lane is None
+            if idle:
+                lane = self.__lanes[message.webhook_url] = deque()
+            lane.append((message, future))
+
+        if idle:
+            self.__pool.submit(self.__drain, message.webhook_url)
+
+        return future
+
+    def send_many(self, messages: Iterable[Message]) -> list[Delivery]:
+
+        """
+        Delivers every message and waits for them all
+
+        PARAMETERS
+        ----------
+        messages : Iterable[Message]
+            `Message` object instances to deliver
+
+        RETURNS
+        -------
+        deliveries : list[Delivery]
+            one `Delivery` per message, in the order of `messages`
+        """
+
+        futures = [self.submit(message) for message in messages]
+
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+
+        """
+        Waits for every queued message, then shuts down the thread pool and
+        closes the session
+        """
+
+        self.__pool.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self) -> "DeliveryQueue":
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+
+        self.close()
+
+    def __drain(self, webhook_url: str) -> None:
+
+        """
+        Sends the queued messages of a webhook in order until its lane is
+        empty, then removes the lane
+        """
+
+        while True:
+            with self.__lock:
+                lane = self.__lanes[webhook_url]
+                if not lane:
+                    del self.__lanes[webhook_url]
+                    return
+                message, future = lane.popleft()
+
+            future.set_result(self.__deliver(message))
+
+    def __deliver(self, message: Message) -> Delivery:
+
+        """
+        Posts a message, waiting for its webhook's bucket and retrying after
+        429 responses
+        """
+
+        delivery = Delivery(message)
+
+        with telemetry.span("discord_post") as span:
+            while True:
+                self.__wait(message.webhook_url)
+                delivery.attempts += 1
+                telemetry.count("discord_requests")
+
+                # any error, such as a 429 with a malformed `retry_after`,
+                # fails only this message rather than the thread draining
+                # its webhook's lane
+                try:
+                    delivery.response = self.__post(message)
+                    self.__update_bucket(
+                        message.webhook_url,
+                        delivery.response
+                    )
+                except Exception as e: # pylint: disable=W0718
+                    delivery.error = e
+                    break
+
+                if delivery.response.status_code != 429 or \
+                        delivery.attempts > self.max_retries:
+                    break
+
+            span.set(attempts=delivery.attempts, ok=delivery.ok)
+
+        return delivery
+
+    def __wait(self, webhook_url: str) -> None:
+
+        """
+        Sleeps until both the webhook's bucket and any global rate limit have
+        reset
+        """
+
+        with self.__lock:
+            reset_at = max(
+                self.__reset_at.get(webhook_url, 0),
+                self.__global_reset_at
+            )
+
+        delay = reset_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def __update_bucket(self, webhook_url: str, response: "Response") -> None:
+
+        """
+        Records when the webhook's bucket resets, from the rate-limit headers
+        of a response or the body of a 429
+        """
+
+        headers = response.headers
+        now = time.monotonic()
+        reset_at = 0
+
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset_at = now + float(headers.get("X-RateLimit-Reset-After", 0))
+
+        if response.status_code == 429:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            retry_after = float(
+                body.get("retry_after", headers.get("Retry-After", 1))
+            )
+            reset_at = max(reset_at, now + retry_after)
+
+            if body.get("global") or headers.get("X-RateLimit-Global"):
+                with self.__lock:
+                    self.__global_reset_at = max(
+                        self.__global_reset_at,
+                        reset_at
+                    )
+
+        with self.__lock:
+            self.__reset_at[webhook_url] = reset_at
+
+    def __post(self, message: Message) -> "Response":
+
+        """
+        Makes a single request for a message; text and image share one
+        multipart request
+        """
+
+        payload = {"content": message.content}
+
+        if message.image_path is None:
+            return self.session.post(
+                message.webhook_url,
+                params={"wait": "true"},
+                json=payload,
+                timeout=self.timeout
+            )
+
+        filename = Path(message.image_path).name
+        payload["embeds"] = [{
+            "title": BOARD_TITLE,
+            "image": {"url": f"attachment://{filename}"}
+        }]
+
+        image_bytes = Path(message.image_path).stat().st_size
+        telemetry.count("discord_image_bytes", image_bytes)
+
+        with open(message.image_path, "rb") as img:
+            return self.session.post(
+                message.webhook_url,
+                params={"wait": "true"},
+                data={"payload_json": json.dumps(payload)},
+                files={"files[0]": (filename, img)},
+                timeout=self.timeout
+            )
+
+
+def send_many(
+        messages: Iterable[Message],
+        max_workers: int = 8
+    ) -> list[Delivery]:
+
+    """
+    Delivers every message through a `DeliveryQueue` which is closed
+    afterwards
+
+    PARAMETERS
+    ----------
+    messages : Iterable[Message]
+        `Message` object instances to deliver
+
+    max_workers : int, default=8
+        maximum number of webhooks posted to concurrently
+
+    RETURNS
+    -------
+    deliveries : list[Delivery]
+        one `Delivery` per message, in the order of `messages`
+    """
+
+    with DeliveryQueue(max_workers) as deliveries:
+        return deliveries.send_many(messages)
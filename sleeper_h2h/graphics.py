@@ -2,10 +2,79 @@
 Functions for making pretty visualizations of Standings objects
 """
 
-from pandas import DataFrame
-from plotly.graph_objects import Figure, Table
+import multiprocessing
+import queue
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+from xml.sax.saxutils import escape
 
-def draw_h2h_plot(h2h_board_df: DataFrame, write_dest=None) -> Figure:
+import numpy as np
+
+from . import telemetry
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from PIL.Image import Image
+    from plotly.graph_objects import Figure
+
+def __getattr__(name: str):
+
+    """
+    Imports Plotly's `Figure` and `Table` on first access as module
+    attributes, so that importing this module does not import Plotly
+    """
+
+    if name in ("Figure", "Table"):
+        from plotly import graph_objects # pylint: disable=C0415
+        return getattr(graph_objects, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+TITLE = "Each row represents a team's winrate against opponents in the columns"
+
+# native backend layout, in pixels before `scale`
+MARGIN = 20
+TITLE_HEIGHT = 40
+ROW_HEIGHT = 40
+TEAM_WIDTH = 150
+CELL_WIDTH = 100
+POINTS_WIDTH = 80
+FONT_SIZE = 14
+
+
+def winrate_colors(winrates: np.ndarray) -> list[str]:
+
+    """
+    Maps winrates to cell colors: green above .500, yellow at .500, red below
+    .500 and black for teams which never played each other
+
+    PARAMETERS
+    ----------
+    winrates : np.ndarray
+        float array of winrates, NaN where no games were played
+
+    RETURNS
+    -------
+    colors : list[str]
+        CSS color name of each winrate
+    """
+
+    winrates = np.asarray(winrates, dtype=float)
+
+    return np.select(
+        [winrates > 0.5, winrates == 0.5, winrates < 0.5],
+        ["green", "yellow", "red"],
+        "black"
+    ).tolist()
+
+
+def draw_h2h_plot(
+        h2h_board_df: "DataFrame",
+        write_dest=None,
+        backend: str = "plotly"
+    ) -> "Figure | str | Image":
 
     """
     Renders a Plotly Figure representing the head-to-head breakdown of a
@@ -14,8 +83,12 @@ def draw_h2h_plot(h2h_board_df: DataFrame, write_dest=None) -> Figure:
     Makes a Table showing an `(n+1)`x`(n+2)` matrix where `n` = league size
 
     The rows represent a given team's head-to-head winrate against all other
-    teams, where green, yellow, and red indicate 100%, 50%, and 0% winrates,
-    respectively
+    teams, where green, yellow, and red indicate winrates above, at, and
+    below 50%, respectively
+
+    The "svg" and "raster" backends draw the same grid natively in tens of
+    milliseconds, without Plotly or the Chromium process Kaleido starts for
+    `write_image()`
 
     PARAMETERS
     ----------
@@ -25,42 +98,83 @@ def draw_h2h_plot(h2h_board_df: DataFrame, write_dest=None) -> Figure:
     write_dest : str, default=None
         String path to call `Figure.write_image()`, with appropriate size for
         sending via Discord webhook request; must contain extension, see Plotly
-        documentation for which extensions are compatible
+        documentation for which extensions are compatible; the "svg" backend
+        writes SVG and the "raster" backend writes any format Pillow infers
+        from the extension, such as PNG
+
+    backend : str, default="plotly"
+        "plotly" for a Plotly Figure, "svg" for an SVG document drawn with
+        the standard library, or "raster" for an image drawn with Pillow,
+        which must be installed
 
     RETURNS
     -------
-    fig : Figure
-        A Plotly Figure with a Table plot
+    fig : Figure | str | Image
+        A Plotly Figure with a Table plot, an SVG string, or a Pillow Image,
+        depending on `backend`
+
+    RAISES
+    ------
+    exception : ValueError
+        ValueError is raised when `backend` is not recognized
+    """
+
+    with telemetry.span("draw_h2h_plot", backend=backend):
+        if backend == "svg":
+            return _draw_h2h_svg(h2h_board_df, write_dest)
+        if backend == "raster":
+            return _draw_h2h_raster(h2h_board_df, write_dest)
+        if backend != "plotly":
+            raise ValueError(
+                f"backend must be 'plotly', 'svg' or 'raster', got {backend!r}"
+            )
+
+        return _draw_h2h_plotly(h2h_board_df, write_dest)
+
+
+def _draw_h2h_plotly(
+        h2h_board_df: "DataFrame",
+        write_dest: str | Path = None
+    ) -> "Figure":
+
+    """
+    Draws the board as a Plotly table and writes it with Kaleido
     """
 
-    map_color = {"0.0": "red", "0.5": "yellow", "1.0": "green", "nan": "black"}
+    # Plotly takes longer to import than the rest of the package combined
+    from plotly.graph_objects import Figure, Table # pylint: disable=C0415
+
+    # cells are formatted column by column rather than on a copy of the board
+    teams = h2h_board_df.index.to_list()
+    header = ["Team", *h2h_board_df.columns[:-1], "Points"]
+    values = [teams]
+    colors = [["lightgrey"] * len(teams)]
 
-    h2h_board_df = h2h_board_df.copy(deep=True)\
-        .reset_index(drop=False, names=["Team"])\
-        .rename(columns={"points": "Points"})
+    for col in h2h_board_df.columns[:-1]:
+        colors.append(winrate_colors(h2h_board_df[col]))
+        values.append([str(rate) for rate in h2h_board_df[col].round(3)])
 
-    colors = [["lightgrey"] * len(h2h_board_df)]
-    for col in h2h_board_df.iloc[:,1:-1]:
-        h2h_board_df[col] = h2h_board_df[col].astype(str)
-        colors.append(h2h_board_df[col].map(map_color).to_list())
+    colors.append(["lightgrey"] * len(teams))
+    values.append([round(pt, 2) for pt in h2h_board_df["points"]])
 
-    colors.append(["lightgrey"] * len(h2h_board_df))
+    # winrate cells only show their color, like the native backends
+    fonts = [["black"] * len(teams), *colors[1:-1], ["black"] * len(teams)]
 
-    h2h_board_df["Points"] = [round(pt, 2) for pt in h2h_board_df["Points"]]
     fig = Figure(
         data=[
             Table(
-                columnwidth=[100] * len(h2h_board_df.columns[:-1]) + [80],
+                columnwidth=[100] * (len(header) - 1) + [80],
                 header={
-                    "values": h2h_board_df.columns.to_list(),
+                    "values": header,
                     "line_color": "darkslategray",
                     "fill_color": "paleturquoise",
                     "align": "left"
                 },
                 cells={
-                    "values": [h2h_board_df[col] for col in h2h_board_df],
+                    "values": values,
                     "line_color": "darkslategray",
                     "fill_color": colors,
+                    "font": {"color": fonts},
                     "height": 60,
                     "align": "left"
                 }
@@ -68,16 +182,408 @@ def draw_h2h_plot(h2h_board_df: DataFrame, write_dest=None) -> Figure:
         ]
     )
 
-    fig.update_layout(
-        title_text="Each row represents a team's winrate against" +
-        " opponents in the columns"
+    fig.update_layout(title_text=TITLE)
+
+    if write_dest:
+        with telemetry.span("kaleido_write_image"):
+            fig.write_image(write_dest, width=1740, height=830, scale=4)
+    return fig
+
+
+def _board_layout(h2h_board_df: "DataFrame") -> tuple[list, list]:
+
+    """
+    Returns the columns of the native board as `(x, width, header)` tuples,
+    and its rows as lists of `(text, fill, font)` cells, header row first
+    """
+
+    teams = h2h_board_df.index.to_list()
+    widths = [TEAM_WIDTH] + [CELL_WIDTH] * len(teams) + [POINTS_WIDTH]
+    headers = ["Team"] + teams + ["Points"]
+    xs = MARGIN + np.concatenate([[0], np.cumsum(widths)[:-1]])
+    columns = list(zip(xs.tolist(), widths, headers))
+
+    winrates = h2h_board_df[teams].to_numpy(dtype=float)
+    rows = [[(header, "paleturquoise", "black") for header in headers]]
+
+    for team, row, points in zip(
+            teams,
+            winrates,
+            h2h_board_df["points"]
+        ):
+        rows.append(
+            [(team, "lightgrey", "black")] +
+            [(None, color, color) for color in winrate_colors(row)] +
+            [(f"{points:.2f}", "lightgrey", "black")]
+        )
+
+    return columns, rows
+
+
+def _fit(text: str, width: float, measure) -> str:
+
+    """
+    Shortens `text` with an ellipsis until `measure(text)` fits in `width`
+    """
+
+    if measure(text) <= width:
+        return text
+
+    while text and measure(text + "…") > width:
+        text = text[:-1]
+
+    return text + "…"
+
+
+def _draw_h2h_svg(h2h_board_df: "DataFrame", write_dest=None) -> str:
+
+    """
+    Draws the head-to-head board as an SVG document, writing it to
+    `write_dest` if supplied
+    """
+
+    columns, rows = _board_layout(h2h_board_df)
+    width = columns[-1][0] + columns[-1][1] + MARGIN
+    height = TITLE_HEIGHT + ROW_HEIGHT * len(rows) + MARGIN
+    measure = lambda text: len(text) * FONT_SIZE * 0.6
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}"' +\
+        f' height="{height}" viewBox="0 0 {width} {height}"' +\
+        f' font-family="Arial, sans-serif" font-size="{FONT_SIZE}">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{MARGIN}" y="{TITLE_HEIGHT - 12}"' +\
+        f' font-size="{FONT_SIZE + 4}">{escape(TITLE)}</text>',
+    ]
+
+    for i, row in enumerate(rows):
+        y = TITLE_HEIGHT + i * ROW_HEIGHT
+        for (x, w, _), (text, fill, font) in zip(columns, row):
+            parts.append(
+                f'<rect x="{x}" y="{y}" width="{w}" height="{ROW_HEIGHT}"' +\
+                f' fill="{fill}" stroke="darkslategray"/>'
+            )
+            if text is not None:
+                parts.append(
+                    f'<text x="{x + 6}" y="{y + ROW_HEIGHT / 2}"' +\
+                    f' dominant-baseline="central" fill="{font}">' +\
+                    f'{escape(_fit(str(text), w - 12, measure))}</text>'
+                )
+
+    parts.append("</svg>")
+    svg = "\n".join(parts)
+
+    if write_dest:
+        with open(write_dest, "w", encoding="utf-8") as f:
+            f.write(svg)
+
+    return svg
+
+
+def _draw_h2h_raster(
+        h2h_board_df: "DataFrame",
+        write_dest=None,
+        scale: int = 2
+    ) -> "Image":
+
+    """
+    Draws the head-to-head board as a Pillow Image at `scale` times the
+    native layout, saving it to `write_dest` if supplied
+    """
+
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError as e:
+        raise ImportError(
+            "The raster backend requires Pillow; install it with" +\
+            " `pip install sleeper-h2h-tools[raster]`"
+        ) from e
+
+    columns, rows = _board_layout(h2h_board_df)
+    width = columns[-1][0] + columns[-1][1] + MARGIN
+    height = TITLE_HEIGHT + ROW_HEIGHT * len(rows) + MARGIN
+
+    img = Image.new("RGB", (width * scale, height * scale), "white")
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default(size=FONT_SIZE * scale)
+    title_font = ImageFont.load_default(size=(FONT_SIZE + 4) * scale)
+
+    draw.text(
+        (MARGIN * scale, (TITLE_HEIGHT - 12) * scale),
+        TITLE,
+        fill="black",
+        font=title_font,
+        anchor="ls"
     )
-    new_c = colors
-    new_c[0] = ["black"] * len(h2h_board_df)
-    new_c[-1] = ["black"] * len(h2h_board_df)
 
-    fig.update_traces(cells={"font": {"color": colors}})
+    for i, row in enumerate(rows):
+        y = TITLE_HEIGHT + i * ROW_HEIGHT
+        for (x, w, _), (text, fill, color) in zip(columns, row):
+            draw.rectangle(
+                [
+                    x * scale,
+                    y * scale,
+                    (x + w) * scale,
+                    (y + ROW_HEIGHT) * scale
+                ],
+                fill=fill,
+                outline="darkslategray",
+                width=scale
+            )
+            if text is not None:
+                draw.text(
+                    ((x + 6) * scale, (y + ROW_HEIGHT / 2) * scale),
+                    _fit(str(text), (w - 12) * scale, font.getlength),
+                    fill=color,
+                    font=font,
+                    anchor="lm"
+                )
 
     if write_dest:
-        fig.write_image(write_dest, width=1740, height=830, scale=4)
-    return fig
+        # fast zlib level; the flat colors still compress well
+        img.save(write_dest, compress_level=1)
+
+    return img
+
+
+def _render_worker(
+        tasks: multiprocessing.Queue,
+        results: multiprocessing.Queue
+    ) -> None:
+
+    """
+    Starts Kaleido once, then renders `(name, h2h_board_df, path)` tasks with
+    `draw_h2h_plot()` until a None task arrives; Kaleido is shut down before
+    the process exits
+    """
+
+    from plotly.graph_objects import Figure # pylint: disable=C0415
+
+    try:
+        Figure().to_image(format="png", width=10, height=10)
+
+        for name, h2h_board_df, path in iter(tasks.get, None):
+            try:
+                draw_h2h_plot(h2h_board_df, path)
+                results.put((name, path))
+            except Exception as e: # pylint: disable=W0718
+                results.put((name, e))
+    finally:
+        _shutdown_kaleido()
+
+
+def _shutdown_kaleido() -> None:
+
+    """
+    Stops the Kaleido process Plotly started in this process; the hook is
+    private to Plotly and Kaleido, so it is skipped when a release moves or
+    removes it and Kaleido is left to exit with the process
+    """
+
+    try:
+        from plotly.io._kaleido import scope # pylint: disable=C0415
+    except ImportError:
+        return
+
+    # scope is None when Kaleido is not installed
+    shutdown = getattr(scope, "_shutdown_kaleido", None)
+    if callable(shutdown):
+        shutdown()
+
+
+@dataclass
+class RendererPool:
+
+    """
+    A fixed number of worker processes which each keep a warm Kaleido
+    process, so that rendering many boards with the Plotly backend pays
+    Kaleido's start-up once per worker rather than once per image
+
+    ATTRIBUTES
+    ----------
+    workers : int, default=4
+        number of worker processes
+
+    METHODS
+    -------
+    start()
+        starts the worker processes and their Kaleido processes
+
+    render(boards, out_dir, fmt="png")
+        writes every board in parallel and returns the written paths
+
+    close()
+        stops every worker and its Kaleido process
+    """
+
+    workers: int = 4
+    __processes: list = field(init=False, default_factory=list, repr=False)
+    __tasks: multiprocessing.Queue = field(
+        init=False,
+        default=None,
+        repr=False
+    )
+    __results: multiprocessing.Queue = field(
+        init=False,
+        default=None,
+        repr=False
+    )
+
+    def start(self) -> "RendererPool":
+
+        """
+        Starts `self.workers` worker processes, which start Kaleido right away
+        """
+
+        if self.__processes:
+            return self
+
+        self.__tasks = multiprocessing.Queue()
+        self.__results = multiprocessing.Queue()
+        self.__processes = [
+            multiprocessing.Process(
+                target=_render_worker,
+                args=(self.__tasks, self.__results),
+                daemon=True
+            )
+            for _ in range(self.workers)
+        ]
+        for process in self.__processes:
+            process.start()
+
+        return self
+
+    def render(
+            self,
+            boards: "dict[str, DataFrame] | Iterable[tuple[str, DataFrame]]",
+            out_dir: str | Path,
+            fmt: str = "png"
+        ) -> dict[str, Path | Exception]:
+
+        """
+        Writes every board to `out_dir` with `draw_h2h_plot()`, spread over
+        the worker processes; may be called any number of times
+
+        PARAMETERS
+        ----------
+        boards : dict[str, DataFrame] | Iterable[tuple[str, DataFrame]]
+            mapping, or pairs, of file name stems to DataFrames generated by
+            `Standings.make_h2h_board_df()`
+
+        out_dir : str | Path
+            directory the images are written to; created as needed
+
+        fmt : str, default="png"
+            image format and file extension, see `Figure.write_image()`
+
+        RETURNS
+        -------
+        paths : dict[str, Path | Exception]
+            path of each written image, or the exception raised while
+            rendering it, keyed by name in the order of `boards`
+
+        RAISES
+        ------
+        exception : RuntimeError
+            RuntimeError is raised when a worker process dies
+        """
+
+        with telemetry.span("render_many", fmt=fmt) as span:
+            paths = self.__render(boards, out_dir, fmt)
+            span.set(boards=len(paths))
+
+        return paths
+
+    def __render(
+            self,
+            boards: "dict[str, DataFrame] | Iterable[tuple[str, DataFrame]]",
+            out_dir: str | Path,
+            fmt: str
+        ) -> dict[str, Path | Exception]:
+
+        """
+        Queues every board for the worker processes and collects the results
+        """
+
+        self.start()
+
+        out_dir = Path(out_dir).expanduser()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        boards = dict(boards)
+
+        for name, h2h_board_df in boards.items():
+            self.__tasks.put((name, h2h_board_df, out_dir / f"{name}.{fmt}"))
+
+        paths = {}
+        while len(paths) < len(boards):
+            try:
+                name, path = self.__results.get(timeout=1)
+                paths[name] = path
+            except queue.Empty as e:
+                if not all(p.is_alive() for p in self.__processes):
+                    self.close()
+                    raise RuntimeError("A renderer process died") from e
+
+        return {name: paths[name] for name in boards}
+
+    def close(self) -> None:
+
+        """
+        Asks every worker to shut Kaleido down and exit, then waits for them;
+        workers which do not exit are terminated
+        """
+
+        for _ in self.__processes:
+            self.__tasks.put(None)
+        for process in self.__processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self.__processes = []
+
+    def __enter__(self) -> "RendererPool":
+
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+
+        self.close()
+
+
+def render_many(
+        boards: "dict[str, DataFrame] | Iterable[tuple[str, DataFrame]]",
+        out_dir: str | Path,
+        workers: int = 4,
+        fmt: str = "png"
+    ) -> dict[str, Path | Exception]:
+
+    """
+    Writes many boards with the Plotly backend through a `RendererPool`
+    which is shut down afterwards; see `RendererPool.render()`
+
+    PARAMETERS
+    ----------
+    boards : dict[str, DataFrame] | Iterable[tuple[str, DataFrame]]
+        mapping, or pairs, of file name stems to DataFrames generated by
+        `Standings.make_h2h_board_df()`
+
+    out_dir : str | Path
+        directory the images are written to
+
+    workers : int, default=4
+        number of worker processes, each with its own Kaleido process
+
+    fmt : str, default="png"
+        image format and file extension
+
+    RETURNS
+    -------
+    paths : dict[str, Path | Exception]
+        path of each written image, or the exception raised while rendering
+        it, keyed by name
+    """
+
+    with RendererPool(workers) as pool:
+        return pool.render(boards, out_dir, fmt)
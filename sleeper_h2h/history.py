@@ -0,0 +1,232 @@
+"""
+All-time head-to-head records across the seasons of a Sleeper Fantasy Football
+league
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+from pandas import DataFrame
+
+from . import SLEEPER_API_URL, utils
+from .cache import ResponseCache
+from .sparse import SparseBoard
+from .standings import Metadata, Standings
+
+if TYPE_CHECKING:
+    from .api import SleeperLeague
+
+
+@dataclass
+class History:
+
+    """
+    A league's head-to-head record over every season, found by following
+    Sleeper's `previous_league_id` chain back from `league_id`
+
+    Seasons are fetched concurrently once the chain is known; with a
+    `ResponseCache`, every response of a completed season is stored
+    permanently, so later runs only request the current season
+
+    ATTRIBUTES
+    ----------
+    league_id : int | str
+        the ID of the league's most recent season
+
+    max_seasons : int, default=None
+        maximum number of seasons to follow back; every season when None
+
+    max_workers : int, default=None
+        maximum number of seasons fetched concurrently, and of concurrent
+        requests within each season; requests are made serially when None
+
+    cache : ResponseCache, default=None
+        `ResponseCache` object instance shared by every season
+
+    base_url : str, default=SLEEPER_API_URL
+        root of the Sleeper API, such as the `url` of a local `StandIn`
+        server
+
+    transport : Callable[[str], list | dict | Exception], default=None
+        function which makes every Sleeper API request, such as a `Recorder`
+        or `Replayer`; requests are made with `requests` when None
+
+    seasons : list[Standings], default=[]
+        one `Standings` object instance per season, most recent first
+
+    owner_ids : list[str], default=[]
+        user ID of every manager who owned a team in any season; a manager's
+        position in this list is their index in `win_counts` and `points`
+
+    win_counts : np.ndarray, default=None
+        `n`x`n` integer array where `[i, j]` counts the all-time wins of
+        manager `i` against manager `j`
+
+    points : np.ndarray, default=None
+        array of all-time points scored by each manager
+
+    h2h_board_df : DataFrame, default=DataFrame()
+        DataFrame of the all-time head-to-head winrate board, in the format of
+        `Standings.h2h_board_df`, sorted by all-time wins then points
+
+    METHODS
+    -------
+    make_h2h_board_df()
+        sums the win counts of every season by owner; assigns `owner_ids`,
+        `win_counts`, `points` and `h2h_board_df`
+
+    make_sparse_board()
+        returns the all-time record by owner as a `SparseBoard`
+    """
+
+    league_id: int | str
+    max_seasons: int = field(default=None)
+    max_workers: int = field(default=None)
+    cache: ResponseCache = field(default=None)
+    base_url: str = field(default=SLEEPER_API_URL)
+    transport: Callable[[str], list | dict | Exception] = field(default=None)
+    seasons: list[Standings] = field(init=False, default_factory=list)
+    owner_ids: list[str] = field(init=False, default_factory=list)
+    win_counts: np.ndarray = field(init=False, default=None)
+    points: np.ndarray = field(init=False, default=None)
+    h2h_board_df: DataFrame = field(init=False, default_factory=DataFrame)
+
+    def __post_init__(self) -> None:
+
+        """
+        Follow the chain of seasons, then fetch every season concurrently
+        """
+
+        self.seasons = utils.map_threaded(
+            self.__fetch,
+            self.__leagues(),
+            self.max_workers
+        )
+
+    def __leagues(self) -> list["SleeperLeague"]:
+
+        """
+        Returns the league of every season, most recent first; each league
+        response names the previous season, so the chain is walked serially
+        """
+
+        from .api import SleeperLeague # pylint: disable=C0415
+
+        leagues = []
+        league_id = str(self.league_id)
+
+        while league_id is not None and \
+                league_id not in (league.league_id for league in leagues) and \
+                (self.max_seasons is None or len(leagues) < self.max_seasons):
+            leagues.append(SleeperLeague(
+                league_id,
+                self.cache,
+                self.base_url,
+                self.transport
+            ))
+            league_id = leagues[-1].previous_league_id
+
+        return leagues
+
+    def __fetch(self, league: "SleeperLeague") -> Standings:
+
+        """
+        Instantiates a season's Standings object from the league requested
+        while walking the chain, then fetches every past week's matchups
+        """
+
+        metadata = Metadata(
+            league.league_id,
+            self.max_workers,
+            self.cache,
+            self.base_url,
+            self.transport,
+            league
+        )
+        standings = Standings(
+            league.league_id,
+            metadata,
+            max_workers=self.max_workers,
+            cache=self.cache,
+            base_url=self.base_url,
+            transport=self.transport
+        )
+        standings.fetch_matchups()
+
+        return standings
+
+    def make_h2h_board_df(self) -> None:
+
+        """
+        Generates the all-time head-to-head winrate board by summing the win
+        counts and points of every season by owner; rosters without an owner
+        are left out, and each manager is labelled by their most recent team
+
+        Assigns attributes `self.owner_ids`, `self.win_counts`, `self.points`
+        and `self.h2h_board_df`
+        """
+
+        metadata = [
+            standings._metadata # pylint: disable=W0212
+            for standings in self.seasons
+        ]
+        self.owner_ids = list(dict.fromkeys(
+            owner for season in metadata
+            for owner in season.owner_ids
+            if owner is not None
+        ))
+        index = {owner: i for i, owner in enumerate(self.owner_ids)}
+
+        self.win_counts = np.zeros((len(index),) * 2, dtype=int)
+        self.points = np.zeros(len(index))
+        names = {}
+
+        for standings, season in zip(self.seasons, metadata):
+            standings.make_h2h_board_df()
+            state = standings.board_state
+
+            owned = [
+                (index[owner], roster_id)
+                for owner, roster_id in zip(season.owner_ids, season.roster_ids)
+                if owner is not None
+            ]
+            rows = np.array([i for i, _ in owned], dtype=int)
+            columns = state.indices(roster_id for _, roster_id in owned)
+
+            # a manager owns one roster per season, so rows never repeat
+            self.win_counts[np.ix_(rows, rows)] += \
+                state.win_counts[np.ix_(columns, columns)]
+            self.points[rows] += state.points[columns]
+
+            for i, roster_id in owned:
+                names.setdefault(i, season.user_id_team_map[roster_id])
+
+        order = np.lexsort((-self.points, -self.win_counts.sum(axis=1)))
+        labels = utils.team_labels(names)
+        teams = [labels[i] for i in order]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wins = self.win_counts[np.ix_(order, order)]
+            self.h2h_board_df = DataFrame(
+                wins / (wins + wins.T),
+                index=teams,
+                columns=teams
+            )
+        self.h2h_board_df["points"] = self.points[order]
+
+    def make_sparse_board(self) -> SparseBoard:
+
+        """
+        Returns the all-time win counts and points of every owner as a
+        `SparseBoard`, which stores only the pairs of managers who played,
+        for league families too large for a dense board
+
+        RETURNS
+        -------
+        board : SparseBoard
+            SparseBoard object keyed by owner user ID, with each manager
+            labelled by their most recent team
+        """
+
+        return SparseBoard.from_standings(self.seasons, by_owner=True)
@@ -0,0 +1,283 @@
+"""
+Compact, array-backed results of head-to-head standings calculations, with
+DataFrames built only when requested
+"""
+
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+from pandas import DataFrame
+
+from . import simulation
+
+if TYPE_CHECKING:
+    from .standings import BoardState
+
+
+def sweep_order(win_counts: np.ndarray) -> np.ndarray:
+
+    """
+    Orders teams tied on wins by whether they swept each of the other tied
+    teams, taken in standings order; teams whose sweeps are identical keep
+    their standings order
+
+    PARAMETERS
+    ----------
+    win_counts : np.ndarray
+        `k`x`k` integer array of the tied teams' wins against each other, in
+        standings order
+
+    RETURNS
+    -------
+    order : np.ndarray
+        positions of the tied teams in head-to-head adjusted order
+    """
+
+    swept = (win_counts > 0) & (win_counts.T == 0)
+
+    # lexsort keys run from last to first priority, so the first tied team's
+    # column is passed last
+    return np.lexsort(~swept.T[::-1])
+
+
+class StandingsResult:
+
+    """
+    The standings, head-to-head board and head-to-head order of a league as
+    typed NumPy arrays; every array is in standings order, i.e. sorted by
+    wins, then losses, then points
+
+    `standings_df`, `h2h_board_df` and `h2h_standings_df` are built from the
+    arrays each time they are read and are never stored, so a resident result
+    costs a few hundred bytes per league rather than several DataFrames
+
+    ATTRIBUTES
+    ----------
+    week : int
+        the last week included
+
+    roster_ids : np.ndarray
+        int32 array of roster IDs
+
+    teams : tuple[str]
+        display label of every team
+
+    wins : np.ndarray
+        int16 array of wins
+
+    losses : np.ndarray
+        int16 array of losses
+
+    points : np.ndarray
+        float64 array of exact points
+
+    win_counts : np.ndarray
+        `n`x`n` int16 array where `[i, j]` counts the wins of team `i` against
+        team `j`
+
+    order : np.ndarray
+        positions of the teams in head-to-head adjusted order; None until
+        `rank_h2h()` is called
+
+    METHODS
+    -------
+    from_board_state(board_state, labels)
+        builds a ranked result from the matchups applied to a `BoardState`
+
+    winrates()
+        returns the head-to-head winrate matrix
+
+    rank_h2h()
+        reorders teams tied on wins by the head-to-head tiebreak rules;
+        assigns `order`
+    """
+
+    __slots__ = (
+        "week",
+        "roster_ids",
+        "teams",
+        "wins",
+        "losses",
+        "points",
+        "win_counts",
+        "order"
+    )
+
+    def __init__(
+            self,
+            week: int,
+            roster_ids: Iterable[int],
+            teams: Iterable[str],
+            wins: Iterable[int],
+            losses: Iterable[int],
+            points: Iterable[float],
+            win_counts: np.ndarray,
+            order: Iterable[int] = None
+        ) -> None:
+
+        self.week = week
+        self.roster_ids = np.asarray(roster_ids, dtype=np.int32)
+        self.teams = tuple(teams)
+        self.wins = np.asarray(wins, dtype=np.int16)
+        self.losses = np.asarray(losses, dtype=np.int16)
+        self.points = np.asarray(points, dtype=np.float64)
+        self.win_counts = np.asarray(win_counts, dtype=np.int16)
+        self.order = None if order is None else \
+            np.asarray(order, dtype=np.intp)
+
+    def __getstate__(self) -> dict:
+
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_board_state(
+            cls,
+            board_state: "BoardState",
+            labels: dict
+        ) -> "StandingsResult":
+
+        """
+        Builds a ranked result from the running totals of a `BoardState`,
+        counting wins and losses from its matchups, so tied matchups count as
+        neither, and ranking with `simulation.h2h_order()`
+
+        PARAMETERS
+        ----------
+        board_state : BoardState
+            `BoardState` object instance whose last applied week is
+            `board_state.week - 1`
+
+        labels : dict
+            dictionary mapping roster ID to display label, such as
+            `Metadata.user_id_team_map`
+
+        RETURNS
+        -------
+        result : StandingsResult
+            StandingsResult object with `order` assigned
+        """
+
+        roster_ids = np.asarray(board_state.roster_ids)
+        wins = board_state.win_counts.sum(axis=1)
+        losses = board_state.win_counts.sum(axis=0)
+        points = board_state.points
+
+        base = np.lexsort((-points, -losses, -wins))
+        order = simulation.h2h_order(
+            wins[None],
+            losses[None],
+            points[None],
+            board_state.win_counts[None]
+        )[0]
+
+        return cls(
+            board_state.week - 1,
+            roster_ids[base],
+            (labels[i] for i in roster_ids[base]),
+            wins[base],
+            losses[base],
+            points[base],
+            board_state.win_counts[np.ix_(base, base)],
+            np.argsort(base)[order]
+        )
+
+    @property
+    def nbytes(self) -> int:
+
+        """
+        Bytes held by the result's arrays
+        """
+
+        return sum(
+            array.nbytes for array in (
+                self.roster_ids,
+                self.wins,
+                self.losses,
+                self.points,
+                self.win_counts,
+                self.order
+            )
+            if array is not None
+        )
+
+    def winrates(self) -> np.ndarray:
+
+        """
+        Returns the head-to-head winrate matrix `wins / (wins + wins.T)` in
+        standings order, where pairs of teams which never played are NaN
+        """
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.win_counts / (self.win_counts + self.win_counts.T)
+
+    def rank_h2h(self) -> None:
+
+        """
+        Reorders teams tied on wins by whether they swept each of the other
+        tied teams, taken in standings order; teams whose sweeps are identical
+        keep their standings order
+
+        Assigns attribute `self.order`
+        """
+
+        order = np.arange(len(self.wins))
+
+        for wins in np.unique(self.wins):
+            ties = np.flatnonzero(self.wins == wins)
+            if len(ties) > 1:
+                order[ties] = ties[
+                    sweep_order(self.win_counts[np.ix_(ties, ties)])
+                ]
+
+        self.order = order
+
+    @property
+    def standings_df(self) -> DataFrame:
+
+        """
+        DataFrame of the standings with columns "team", "wins", "losses" and
+        "points"
+        """
+
+        return DataFrame({
+            "team": self.teams,
+            "wins": self.wins,
+            "losses": self.losses,
+            "points": self.points
+        })
+
+    @property
+    def h2h_board_df(self) -> DataFrame:
+
+        """
+        DataFrame of the head-to-head winrate board; read rowwise, each cell
+        represents the winrate of the row index's team against teams in the
+        columns; points are in the last column
+        """
+
+        df = DataFrame(self.winrates(), index=self.teams, columns=self.teams)
+        df["points"] = self.points
+
+        return df
+
+    @property
+    def h2h_standings_df(self) -> DataFrame:
+
+        """
+        DataFrame of the standings in head-to-head adjusted order, with an
+        "h2h_delta" column of places gained; empty until `rank_h2h()` is
+        called
+        """
+
+        if self.order is None:
+            return DataFrame()
+
+        df = self.standings_df.iloc[self.order].reset_index(drop=True)
+        df.insert(1, "h2h_delta", self.order - np.arange(len(self.order)))
+
+        return df
@@ -0,0 +1,490 @@
+"""
+A small HTTP service answering standings queries from an in-process LRU cache
+of computed boards, so that bots and dashboards do not build a new `Standings`
+object per request
+
+Endpoints, each accepting an optional `?week=N` for the standings as of the
+end of week `N`:
+    GET /leagues/<league_id>/standings          standings_df as JSON records
+    GET /leagues/<league_id>/h2h_board          h2h_board_df as JSON by team
+    GET /leagues/<league_id>/h2h_standings      h2h_standings_df as JSON records
+    GET /leagues/<league_id>/text               stringify_h2h_standings_df()
+    GET /leagues/<league_id>/board.svg          rendered board
+    GET /leagues/<league_id>/board.png          rendered board, needs Pillow
+    GET /stats                                  cache hits, misses and size
+
+Example:
+    sleeper-h2h serve --port 8080 --cache ~/.sleeper_h2h.sqlite
+"""
+
+import io
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qs, urlsplit
+
+from . import SLEEPER_API_URL, telemetry
+from .cache import ResponseCache
+from .result import StandingsResult
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "svg": "image/svg+xml",
+    "png": "image/png"
+}
+
+
+@dataclass
+class _Entry:
+
+    """
+    A cached result, when it expires, and the images rendered from it
+    """
+
+    result: StandingsResult
+    expires: float | None
+    images: dict = field(default_factory=dict)
+
+
+@dataclass
+class BoardCache:
+
+    """
+    A size-bounded LRU cache of computed results keyed by `(league_id, week)`,
+    where concurrent requests for a key which is not cached share a single
+    call of `compute`
+
+    A `week` of None stands for the current standings, which change as weeks
+    are scored, so those entries expire after `max_age` seconds; past weeks
+    are final and stay until evicted
+
+    ATTRIBUTES
+    ----------
+    compute : Callable[[str, int | None], StandingsResult]
+        function computing the result of a league as of a week, or as of now
+        when the week is None
+
+    max_size : int, default=256
+        maximum number of results kept; the least recently used is evicted
+
+    max_age : float, default=300
+        seconds for which current standings are served from the cache
+
+    hits : int, default=0
+        number of lookups answered from the cache, including those which
+        waited on another request's computation
+
+    misses : int, default=0
+        number of computations started
+
+    METHODS
+    -------
+    get(league_id, week=None)
+        returns the cached entry of a league, computing it on a miss
+
+    invalidate(league_id=None)
+        drops the entries of a league, or every entry when None
+    """
+
+    compute: Callable[[str, int | None], StandingsResult]
+    max_size: int = 256
+    max_age: float = 300
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    __entries: OrderedDict = field(
+        init=False,
+        default_factory=OrderedDict,
+        repr=False
+    )
+    __pending: dict = field(init=False, default_factory=dict, repr=False)
+    __lock: threading.Lock = field(
+        init=False,
+        default_factory=threading.Lock,
+        repr=False
+    )
+
+    def __len__(self) -> int:
+
+        return len(self.__entries)
+
+    def get(self, league_id: str, week: int = None) -> _Entry:
+
+        """
+        Returns the cached entry of `(league_id, week)`, computing it when it
+        is missing or expired; a request arriving while the same key is being
+        computed waits for that computation rather than starting another
+
+        PARAMETERS
+        ----------
+        league_id : str
+            the ID of the Sleeper Fantasy Football league
+
+        week : int, default=None
+            last week included; the current standings when None
+
+        RETURNS
+        -------
+        entry : _Entry
+            the result and its rendered images
+
+        RAISES
+        ------
+        exception : Exception
+            any exception raised by `compute` is raised by every request
+            waiting on it, and nothing is cached
+        """
+
+        key = (str(league_id), week)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and \
+                    (entry.expires is None or entry.expires > time.time()):
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                telemetry.count("board_cache_hits")
+                return entry
+
+            pending = self.__pending.get(key)
+            if pending is None:
+                pending = self.__pending[key] = Future()
+                self.misses += 1
+                telemetry.count("board_cache_misses")
+                owner = True
+            else:
+                self.hits += 1
+                telemetry.count("board_cache_hits")
+                owner = False
+
+        if not owner:
+            return pending.result()
+
+        try:
+            entry = _Entry(
+                self.compute(*key),
+                None if week is not None else time.time() + self.max_age
+            )
+        except Exception as e:
+            with self.__lock:
+                del self.__pending[key]
+            pending.set_exception(e)
+            raise
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+            del self.__pending[key]
+        pending.set_result(entry)
+
+        return entry
+
+    def invalidate(self, league_id: str = None) -> None:
+
+        """
+        Drops every entry of `league_id`, or every entry when None
+        """
+
+        with self.__lock:
+            if league_id is None:
+                self.__entries.clear()
+                return
+
+            for key in [k for k in self.__entries if k[0] == str(league_id)]:
+                del self.__entries[key]
+
+
+@dataclass
+class QueryService:
+
+    """
+    A threaded HTTP server answering standings queries through a
+    `BoardCache`; repeat queries are served from memory, and the first query
+    of a league fetches it from Sleeper once no matter how many requests
+    arrive at the same time
+
+    ATTRIBUTES
+    ----------
+    host : str, default="127.0.0.1"
+        address the server binds to
+
+    port : int, default=0
+        port the server binds to; a free port is chosen when 0
+
+    max_size : int, default=256
+        maximum number of computed results kept in memory
+
+    max_age : float, default=300
+        seconds for which current standings are served from memory
+
+    max_workers : int, default=None
+        maximum number of concurrent Sleeper API requests per computation;
+        requests are made serially when None
+
+    cache : ResponseCache, default=None
+        `ResponseCache` object instance shared by every computation
+
+    base_url : str, default=SLEEPER_API_URL
+        root of the Sleeper API, such as the `url` of a local `StandIn`
+        server
+
+    transport : Callable[[str], list | dict | Exception], default=None
+        function which makes every Sleeper API request, such as a `Recorder`
+        or `Replayer`; requests are made with `requests` when None
+
+    boards : BoardCache, default=None
+        `BoardCache` object instance holding every computed result
+
+    METHODS
+    -------
+    compute(league_id, week=None)
+        fetches a league and returns its ranked result
+
+    start()
+        starts serving in a background thread
+
+    stop()
+        shuts the server down
+    """
+
+    host: str = "127.0.0.1"
+    port: int = 0
+    max_size: int = 256
+    max_age: float = 300
+    max_workers: int = None
+    cache: ResponseCache = None
+    base_url: str = SLEEPER_API_URL
+    transport: Callable[[str], list | dict | Exception] = None
+    boards: BoardCache = field(init=False, default=None)
+    __server: ThreadingHTTPServer = field(init=False, default=None, repr=False)
+    __thread: threading.Thread = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+
+        """
+        Create the cache of computed results
+        """
+
+        self.boards = BoardCache(self.compute, self.max_size, self.max_age)
+
+    @property
+    def url(self) -> str:
+
+        """
+        Root URL of the service
+        """
+
+        return f"http://{self.host}:{self.port}"
+
+    def compute(self, league_id: str, week: int = None) -> StandingsResult:
+
+        """
+        Fetches a league and returns its ranked `StandingsResult`, as of the
+        end of `week` or as of now when None
+
+        RAISES
+        ------
+        exception : ValueError
+            ValueError is raised when `week` has not been played
+        """
+
+        from .standings import Standings # pylint: disable=C0415
+
+        standings = Standings(
+            league_id,
+            max_workers=self.max_workers,
+            cache=self.cache,
+            base_url=self.base_url,
+            transport=self.transport
+        )
+
+        if week is None:
+            standings.make_h2h_standings_df()
+            return standings.result
+
+        if not 1 <= week < standings._metadata.week: # pylint: disable=W0212
+            raise ValueError(f"week {week} has not been played")
+
+        return next(standings.iter_weekly(week, week))
+
+    def _respond(self, path: str) -> tuple[int, str, bytes]:
+
+        """
+        Returns the status code, content type and body for a request path
+        """
+
+        url = urlsplit(path)
+        parts = url.path.strip("/").split("/")
+
+        if parts == ["stats"]:
+            return self.__json({
+                "hits": self.boards.hits,
+                "misses": self.boards.misses,
+                "size": len(self.boards)
+            })
+
+        if len(parts) != 3 or parts[0] != "leagues":
+            return self.__json({"error": "not found"}, 404)
+
+        try:
+            week = parse_qs(url.query).get("week")
+            week = None if week is None else int(week[-1])
+            entry = self.boards.get(parts[1], week)
+        except ValueError as e:
+            return self.__json({"error": str(e)}, 400)
+        except Exception as e: # pylint: disable=W0718
+            # an unknown league is a 404 from Sleeper; anything else is a
+            # failure upstream
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            return self.__json(
+                {"error": f"{type(e).__name__}: {e}"},
+                404 if status == 404 else 502
+            )
+
+        return self.__view(entry, parts[2])
+
+    def __view(self, entry: _Entry, view: str) -> tuple[int, str, bytes]:
+
+        """
+        Returns the response of one endpoint for a cached entry, rendering
+        and caching board images on first request
+        """
+
+        result = entry.result
+
+        if view == "standings":
+            return self.__frame(result.standings_df.to_json(orient="records"))
+        if view == "h2h_board":
+            return self.__frame(result.h2h_board_df.to_json(orient="index"))
+        if view == "h2h_standings":
+            return self.__frame(
+                result.h2h_standings_df.to_json(orient="records")
+            )
+        if view == "text":
+            from .utils import stringify_h2h_standings_df # pylint: disable=C0415
+            return self.__json(
+                {"text": stringify_h2h_standings_df(result.h2h_standings_df)}
+            )
+
+        name, _, extension = view.partition(".")
+        if name != "board" or extension not in ("svg", "png"):
+            return self.__json({"error": "not found"}, 404)
+
+        image = entry.images.get(extension)
+        if image is None:
+            try:
+                image = entry.images[extension] = _render(result, extension)
+            except ImportError as e:
+                return self.__json({"error": str(e)}, 501)
+
+        return 200, CONTENT_TYPES[extension], image
+
+    @staticmethod
+    def __json(payload: dict, status: int = 200) -> tuple[int, str, bytes]:
+
+        return status, CONTENT_TYPES["json"], json.dumps(payload).encode()
+
+    @staticmethod
+    def __frame(body: str) -> tuple[int, str, bytes]:
+
+        return 200, CONTENT_TYPES["json"], body.encode()
+
+    def start(self) -> "QueryService":
+
+        """
+        Binds the server and serves requests in a daemon thread; assigns
+        `self.port` when it was 0
+        """
+
+        self.__server = ThreadingHTTPServer(
+            (self.host, self.port),
+            self.__handler()
+        )
+        self.__server.daemon_threads = True
+        self.port = self.__server.server_address[1]
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever,
+            daemon=True
+        )
+        self.__thread.start()
+
+        return self
+
+    def stop(self) -> None:
+
+        """
+        Stops serving and closes the socket
+        """
+
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+            self.__server = self.__thread = None
+
+    def __enter__(self) -> "QueryService":
+
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+
+        self.stop()
+
+    def __handler(self) -> type[BaseHTTPRequestHandler]:
+
+        """
+        Returns a request handler class bound to this QueryService
+        """
+
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            """
+            Answers GET requests through `QueryService._respond()`
+            """
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None: # pylint: disable=C0103
+
+                # pylint: disable-next=W0212
+                status, content_type, body = service._respond(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+
+                pass
+
+        return Handler
+
+
+def _render(result: StandingsResult, extension: str) -> bytes:
+
+    """
+    Renders a result's board as SVG, or as PNG with the raster backend
+    """
+
+    from .graphics import draw_h2h_plot # pylint: disable=C0415
+
+    if extension == "svg":
+        return draw_h2h_plot(result.h2h_board_df, backend="svg").encode()
+
+    buffer = io.BytesIO()
+    draw_h2h_plot(result.h2h_board_df, backend="raster").save(
+        buffer,
+        format="PNG",
+        compress_level=1
+    )
+
+    return buffer.getvalue()
@@ -0,0 +1,296 @@
+"""
+Vectorized Monte Carlo simulation of the rest of a season, ranked with the
+head-to-head tiebreak rules of `Standings.make_h2h_standings_df()`
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+
+CHUNK_SIZE = 10000
+
+
+@dataclass
+class NormalScoreModel:
+
+    """
+    Draws every team's weekly score from a normal distribution fitted to the
+    scores the team has posted so far
+
+    ATTRIBUTES
+    ----------
+    means : np.ndarray
+        mean weekly score of each team
+
+    stds : np.ndarray
+        standard deviation of each team's weekly scores
+
+    METHODS
+    -------
+    from_scores(scores)
+        fits a model to a `weeks`x`teams` array of past scores
+    """
+
+    means: np.ndarray
+    stds: np.ndarray
+
+    @classmethod
+    def from_scores(cls, scores: np.ndarray) -> "NormalScoreModel":
+
+        """
+        Fits a model to a `weeks`x`teams` array of past scores, such as
+        `SeasonSnapshot.scores`, where missing scores are NaN; a team with
+        fewer than two scores takes the spread of the whole league
+
+        RAISES
+        ------
+        exception : ValueError
+            ValueError is raised when a team has no score to fit
+        """
+
+        played = np.isfinite(scores)
+        counts = played.sum(axis=0)
+
+        if not counts.all():
+            raise ValueError("every team needs at least one past score")
+
+        filled = np.where(played, scores, 0)
+        means = filled.sum(axis=0) / counts
+        deviations = np.where(played, scores - means, 0)
+        stds = np.sqrt(
+            (deviations ** 2).sum(axis=0) / np.maximum(counts - 1, 1)
+        )
+
+        league_std = np.nanstd(scores, ddof=1) if played.sum() > 1 else 0
+        stds = np.where(counts > 1, stds, league_std)
+
+        return cls(means, stds)
+
+    def __call__(
+            self,
+            rng: np.random.Generator,
+            size: tuple[int, int, int]
+        ) -> np.ndarray:
+
+        """
+        Returns a `sims`x`weeks`x`teams` array of simulated scores
+        """
+
+        return rng.normal(self.means, self.stds, size)
+
+
+def schedule_opponents(
+        schedule: Iterable[list[tuple]],
+        roster_ids: list[int]
+    ) -> np.ndarray:
+
+    """
+    Converts weeks of scheduled matchups into each team's opponent per week
+
+    PARAMETERS
+    ----------
+    schedule : Iterable[list[tuple]]
+        one list of `(roster_id, matchup_id, points)` tuples per remaining
+        week, in the format of `MatchupStore.get()`; points are ignored
+
+    roster_ids : list[int]
+        roster IDs giving the order of the teams
+
+    RETURNS
+    -------
+    opponents : np.ndarray
+        `weeks`x`teams` integer array of each team's opponent index, or -1
+        for a team without exactly one opponent that week
+    """
+
+    index = {roster_id: i for i, roster_id in enumerate(roster_ids)}
+    weeks = []
+
+    for records in schedule:
+        matchups = {}
+        for roster_id, matchup, _ in records:
+            if matchup is not None:
+                matchups.setdefault(matchup, []).append(index[roster_id])
+
+        opponents = np.full(len(index), -1)
+        for teams in matchups.values():
+            if len(teams) == 2:
+                opponents[teams] = teams[::-1]
+        weeks.append(opponents)
+
+    return np.array(weeks, dtype=int).reshape(-1, len(index))
+
+
+def h2h_order(
+        wins: np.ndarray,
+        losses: np.ndarray,
+        points: np.ndarray,
+        win_counts: np.ndarray
+    ) -> np.ndarray:
+
+    """
+    Ranks teams in many seasons at once, following the rules of
+    `Standings.make_h2h_standings_df()`: teams are sorted by wins, losses and
+    points as Sleeper does, then teams tied on wins are reordered by whether
+    they swept each of the other tied teams, taken in that order
+
+    Each team's sweeps of its tied teams are packed into the bits of one
+    integer, with the first tied team in the most significant bit, so that a
+    single lexsort per season applies the rule to every group of ties
+
+    PARAMETERS
+    ----------
+    wins, losses, points : np.ndarray
+        `seasons`x`teams` arrays of each team's record and total points
+
+    win_counts : np.ndarray
+        `seasons`x`teams`x`teams` integer array where `[s, i, j]` counts the
+        wins of team `i` against team `j` in season `s`
+
+    RETURNS
+    -------
+    order : np.ndarray
+        `seasons`x`teams` integer array of team indices, from first seed to
+        last
+
+    RAISES
+    ------
+    exception : ValueError
+        ValueError is raised for more than 62 teams, whose sweeps no longer
+        fit in one integer
+    """
+
+    n_teams = wins.shape[-1]
+    if n_teams > 62:
+        raise ValueError(f"at most 62 teams can be ranked, got {n_teams}")
+
+    base = np.lexsort((-points, -losses, -wins), axis=-1)
+    position = np.argsort(base, axis=-1)
+
+    swept = (win_counts > 0) & (np.swapaxes(win_counts, 1, 2) == 0)
+    tied = wins[:, :, None] == wins[:, None, :]
+    weights = np.left_shift(1, n_teams - 1 - position)[:, None, :]
+    keys = np.where(~swept & tied, weights, 0).sum(axis=-1)
+
+    return np.lexsort((position, keys, -wins), axis=-1)
+
+
+def simulate_seeds(
+        wins: np.ndarray,
+        losses: np.ndarray,
+        points: np.ndarray,
+        win_counts: np.ndarray,
+        opponents: np.ndarray,
+        score_model: Callable[[np.random.Generator, tuple], np.ndarray],
+        n_sims: int = 10000,
+        seed: int = None,
+        max_workers: int = None
+    ) -> np.ndarray:
+
+    """
+    Simulates the remaining weeks of a season `n_sims` times and counts the
+    seed each team finishes with
+
+    Simulations are run in chunks of `CHUNK_SIZE` as `sims`x`weeks`x`teams`
+    arrays; every chunk has its own random stream spawned from `seed`, so the
+    result does not depend on `max_workers`
+
+    PARAMETERS
+    ----------
+    wins, losses, points : np.ndarray
+        arrays of each team's current record and total points
+
+    win_counts : np.ndarray
+        `teams`x`teams` integer array where `[i, j]` counts the wins of team
+        `i` against team `j`, such as `BoardState.win_counts`
+
+    opponents : np.ndarray
+        `weeks`x`teams` integer array returned by `schedule_opponents()`
+
+    score_model : Callable[[np.random.Generator, tuple], np.ndarray]
+        callable returning an array of simulated scores of the given
+        `sims`x`weeks`x`teams` shape, such as a `NormalScoreModel`; it must be
+        picklable when `max_workers` is greater than 1
+
+    n_sims : int, default=10000
+        number of simulated seasons
+
+    seed : int, default=None
+        seed for `np.random.SeedSequence()`
+
+    max_workers : int, default=None
+        maximum number of processes running chunks; chunks are run serially
+        in the calling process when None or 1
+
+    RETURNS
+    -------
+    probabilities : np.ndarray
+        `teams`x`teams` float array where `[i, k]` is the probability that
+        team `i` finishes as seed `k + 1`
+    """
+
+    state = tuple(
+        np.asarray(array)
+        for array in (wins, losses, points, win_counts, opponents)
+    )
+    sizes = [CHUNK_SIZE] * (n_sims // CHUNK_SIZE)
+    if n_sims % CHUNK_SIZE:
+        sizes.append(n_sims % CHUNK_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([state] * len(sizes), [score_model] * len(sizes), sizes, seeds)
+
+    if not max_workers or max_workers == 1 or len(sizes) < 2:
+        counts = list(map(_simulate_chunk, *args))
+    else:
+        with ProcessPoolExecutor(min(max_workers, len(sizes))) as pool:
+            counts = list(pool.map(_simulate_chunk, *args))
+
+    return np.sum(counts, axis=0) / n_sims
+
+
+def _simulate_chunk(
+        state: tuple[np.ndarray, ...],
+        score_model: Callable[[np.random.Generator, tuple], np.ndarray],
+        n_sims: int,
+        seed: np.random.SeedSequence
+    ) -> np.ndarray:
+
+    """
+    Simulates one chunk of seasons and returns a `teams`x`seeds` array of
+    counts
+    """
+
+    wins, losses, points, win_counts, opponents = state
+    n_weeks, n_teams = opponents.shape
+
+    played = opponents >= 0
+    against = np.where(played, opponents, np.arange(n_teams))
+
+    scores = np.asarray(
+        score_model(np.random.default_rng(seed), (n_sims, n_weeks, n_teams)),
+        dtype=float
+    )
+    theirs = np.take_along_axis(scores, against[None], axis=-1)
+    won = (scores > theirs) & played
+    lost = (scores < theirs) & played
+
+    # a team meets each opponent at most once per week, so the flat indices
+    # of one week never repeat and += needs no np.add.at
+    h2h = np.tile(win_counts.ravel(), (n_sims, 1))
+    pairs = np.arange(n_teams) * n_teams + against
+    for week in range(n_weeks):
+        h2h[:, pairs[week]] += won[:, week]
+
+    order = h2h_order(
+        wins + won.sum(axis=1),
+        losses + lost.sum(axis=1),
+        points + np.where(played, scores, 0).sum(axis=1),
+        h2h.reshape(n_sims, n_teams, n_teams)
+    )
+
+    return np.bincount(
+        (order * n_teams + np.arange(n_teams)).ravel(),
+        minlength=n_teams ** 2
+    ).reshape(n_teams, n_teams)
@@ -0,0 +1,351 @@
+"""
+Compact, versioned on-disk snapshots of a Sleeper Fantasy Football season
+"""
+
+import struct
+import zipfile
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+import numpy as np
+
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class SeasonSnapshot:
+
+    """
+    Stores everything a Standings object reads from Sleeper as plain NumPy
+    arrays, so a season can be saved to a single `.npz` file and rebuilt
+    without a network client or unpickling any objects
+
+    Teams are stored in the order of `League.get_standings()`; week `w` of the
+    season is row `w - 1` of `scores` and `matchup_ids`
+
+    ATTRIBUTES
+    ----------
+    league_id : str
+        the ID of the Sleeper Fantasy Football league
+
+    week : int
+        the current week of the season; `scores` holds every week before it
+
+    roster_ids : np.ndarray
+        integer array of each team's roster ID
+
+    teams : np.ndarray
+        string array of each team's name as returned by Sleeper
+
+    wins : np.ndarray
+        integer array of each team's wins
+
+    losses : np.ndarray
+        integer array of each team's losses
+
+    fpts : np.ndarray
+        integer array of each team's points, rounded down as Sleeper does
+
+    scores : np.ndarray
+        `weeks`x`teams` float array of weekly points; NaN if a team has no
+        matchup that week
+
+    matchup_ids : np.ndarray
+        `weeks`x`teams` integer array of weekly matchup IDs; -1 if a team has
+        no matchup that week
+
+    version : int, default=SNAPSHOT_VERSION
+        snapshot format version
+
+    METHODS
+    -------
+    from_metadata(metadata)
+        builds a snapshot from a `Metadata` object whose matchups are fetched
+
+    records(week)
+        returns a week as `(roster_id, matchup_id, points)` tuples
+
+    points()
+        returns each team's exact points over the season
+
+    weekly_highs()
+        returns the roster ID and score of each week's highest scorer
+
+    save(path)
+        writes the snapshot to an uncompressed `.npz` file
+
+    load(path, mmap=False)
+        reads a snapshot written by `save()`
+    """
+
+    league_id: str
+    week: int
+    roster_ids: np.ndarray
+    teams: np.ndarray
+    wins: np.ndarray
+    losses: np.ndarray
+    fpts: np.ndarray
+    scores: np.ndarray
+    matchup_ids: np.ndarray
+    version: int = field(default=SNAPSHOT_VERSION)
+
+    @classmethod
+    def from_metadata(cls, metadata) -> "SeasonSnapshot":
+
+        """
+        Builds a snapshot from a `Metadata` object; every week before
+        `metadata.week` is read through `metadata.matchups`, so weeks which
+        are not stored yet are fetched
+
+        PARAMETERS
+        ----------
+        metadata : Metadata
+            `Metadata` object instance whose `week` has been assigned, such as
+            `Standings._metadata`
+
+        RETURNS
+        -------
+        snapshot : SeasonSnapshot
+            snapshot of the season up to `metadata.week`
+        """
+
+        roster_ids = np.array(metadata.roster_ids, dtype=int)
+        weeks = [metadata.matchups.get(week) for week in range(1, metadata.week)]
+        records = [record for week in weeks for record in week]
+
+        # every record of the season is placed with one scatter per array
+        rows = np.repeat(np.arange(len(weeks)), [len(week) for week in weeks])
+        columns = _columns(
+            roster_ids,
+            np.fromiter((i[0] for i in records), int, len(records))
+        )
+
+        scores = np.full((len(weeks), len(roster_ids)), np.nan)
+        scores[rows, columns] = np.fromiter(
+            (i[2] for i in records),
+            float,
+            len(records)
+        )
+        matchup_ids = np.full((len(weeks), len(roster_ids)), -1, dtype=int)
+        matchup_ids[rows, columns] = np.fromiter(
+            (-1 if i[1] is None else i[1] for i in records),
+            int,
+            len(records)
+        )
+
+        return cls(
+            league_id=str(metadata.league_id),
+            week=metadata.week,
+            roster_ids=roster_ids,
+            teams=np.array(
+                [row[0] or "" for row in metadata.standings],
+                dtype=str
+            ),
+            wins=np.array([row[1] for row in metadata.standings], dtype=int),
+            losses=np.array([row[2] for row in metadata.standings], dtype=int),
+            fpts=np.array([row[3] for row in metadata.standings], dtype=int),
+            scores=scores,
+            matchup_ids=matchup_ids
+        )
+
+    def records(self, week: int) -> list[tuple]:
+
+        """
+        Returns a week of the snapshot in the format of `MatchupStore.get()`
+
+        PARAMETERS
+        ----------
+        week : int
+            week of the season, before `self.week`
+
+        RETURNS
+        -------
+        records : list[tuple]
+            list of `(roster_id, matchup_id, points)` tuples, skipping teams
+            without a matchup that week
+        """
+
+        return [
+            (
+                int(roster_id),
+                None if matchup == -1 else int(matchup),
+                float(points)
+            )
+            for roster_id, matchup, points in zip(
+                self.roster_ids,
+                self.matchup_ids[week - 1],
+                self.scores[week - 1]
+            )
+            if not np.isnan(points)
+        ]
+
+    def points(self) -> np.ndarray:
+
+        """
+        Returns the exact points of each team, summed over every week of
+        `scores`
+        """
+
+        return np.nansum(self.scores, axis=0)
+
+    def weekly_highs(self) -> tuple[np.ndarray, np.ndarray]:
+
+        """
+        Returns the highest scorer of each week
+
+        RETURNS
+        -------
+        roster_ids : np.ndarray
+            integer array of the roster ID of each week's highest scorer; the
+            first in standings order on a tie
+
+        scores : np.ndarray
+            float array of each week's highest score
+        """
+
+        # NaN is below every score, so teams without a matchup never lead
+        leaders = np.argmax(np.nan_to_num(self.scores, nan=-np.inf), axis=1)
+        weeks = np.arange(len(self.scores))
+
+        return self.roster_ids[leaders], self.scores[weeks, leaders]
+
+    def save(self, path: str | Path) -> None:
+
+        """
+        Writes the snapshot to an uncompressed `.npz` file, which `load()` can
+        memory-map
+
+        PARAMETERS
+        ----------
+        path : str | Path
+            destination path; NumPy appends `.npz` if it is missing
+        """
+
+        np.savez(
+            path,
+            **{
+                f.name: np.asarray(getattr(self, f.name))
+                for f in fields(self)
+            }
+        )
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = False) -> "SeasonSnapshot":
+
+        """
+        Reads a snapshot written by `save()`; no Python objects are unpickled
+
+        PARAMETERS
+        ----------
+        path : str | Path
+            path to the `.npz` file
+
+        mmap : bool, default=False
+            memory-map the arrays read-only instead of reading them into
+            memory
+
+        RETURNS
+        -------
+        snapshot : SeasonSnapshot
+            the loaded snapshot
+
+        RAISES
+        ------
+        exception : ValueError
+            ValueError is raised when the file was written by a newer snapshot
+            format version
+        """
+
+        if mmap:
+            arrays = _memmap_npz(path)
+        else:
+            with np.load(path, allow_pickle=False) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+
+        version = int(arrays["version"])
+        if version > SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Snapshot format version {version} is newer than the" +\
+                f" supported version {SNAPSHOT_VERSION}"
+            )
+
+        return cls(
+            league_id=str(arrays["league_id"]),
+            week=int(arrays["week"]),
+            roster_ids=arrays["roster_ids"],
+            teams=arrays["teams"],
+            wins=arrays["wins"],
+            losses=arrays["losses"],
+            fpts=arrays["fpts"],
+            scores=arrays["scores"],
+            matchup_ids=arrays["matchup_ids"],
+            version=version
+        )
+
+
+def _columns(roster_ids: np.ndarray, lookup: np.ndarray) -> np.ndarray:
+
+    """
+    Returns the column of each roster ID of `lookup` within `roster_ids`,
+    through a lookup table indexed by roster ID
+
+    RAISES
+    ------
+    exception : KeyError
+        KeyError is raised when a roster ID is not in `roster_ids`
+    """
+
+    size = max(roster_ids.max(initial=0), lookup.max(initial=0)) + 1
+    index = np.full(size, -1)
+    index[roster_ids] = np.arange(len(roster_ids))
+    columns = index[lookup]
+
+    if (columns < 0).any():
+        raise KeyError(int(lookup[columns < 0][0]))
+
+    return columns
+
+
+def _memmap_npz(path: str | Path) -> dict[str, np.ndarray]:
+
+    """
+    Memory-maps every array of an uncompressed `.npz` file by locating each
+    member's data within the zip archive
+    """
+
+    arrays = {}
+
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            name = info.filename.removesuffix(".npy")
+
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{info.filename} is compressed")
+
+            # local file header: 30 fixed bytes, then the name and extra field
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = struct.unpack("<HH", f.read(4))
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(f)
+            else:
+                header = np.lib.format.read_array_header_2_0(f)
+            shape, fortran_order, dtype = header
+
+            if not shape:
+                arrays[name] = np.fromfile(f, dtype=dtype, count=1)[0]
+                continue
+
+            arrays[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                shape=shape,
+                order="F" if fortran_order else "C",
+                offset=f.tell()
+            )
+
+    return arrays
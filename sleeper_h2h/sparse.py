@@ -0,0 +1,550 @@
+"""
+Sparse head-to-head boards for very large leagues and for boards combining
+many leagues, where most pairs of teams never meet
+
+Win counts are stored as coordinate arrays of the pairs which played, so
+memory and time grow with games played rather than with the square of the
+number of teams; dense boards are only built on request
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Hashable, Iterable
+
+import numpy as np
+from pandas import DataFrame
+
+from . import utils
+from .result import sweep_order
+from .standings import decided_games
+
+if TYPE_CHECKING:
+    from .standings import BoardState, Standings
+
+
+@dataclass
+class SparseBoard:
+
+    """
+    Head-to-head win counts and points of any number of teams, keyed by any
+    hashable value such as a roster ID, a `(league_id, roster_id)` pair or an
+    owner's user ID
+
+    Games are added to pending coordinate arrays and merged into sorted,
+    deduplicated `rows`, `cols` and `counts` arrays when first read
+
+    ATTRIBUTES
+    ----------
+    keys : list[Hashable], default=[]
+        key of every team; a team's position in this list is its index in
+        `points`, `rows` and `cols`
+
+    labels : dict, default={}
+        dictionary mapping key to display label; a key without a label is
+        shown as itself
+
+    points : np.ndarray
+        float array of total points scored by each team
+
+    rows, cols, counts : np.ndarray
+        coordinate arrays where team `rows[k]` beat team `cols[k]`
+        `counts[k]` times, sorted by row then column
+
+    METHODS
+    -------
+    from_standings(standings, by_owner=False)
+        combines the boards of many leagues or seasons
+
+    add_teams(keys, labels=None)
+        adds teams which are not on the board yet
+
+    indices(keys)
+        returns the integer indices of `keys`
+
+    add_games(winners, losers, counts=1)
+        adds wins of some teams against others
+
+    apply_week(records, league_id=None)
+        adds one week of matchups
+
+    add_board_state(board_state, keys=None, roster_ids=None, labels=None)
+        adds the win counts and points of a dense `BoardState`
+
+    wins(), losses()
+        return each team's decided wins and losses
+
+    submatrix(indices)
+        returns the dense win counts among a few teams
+
+    to_dense()
+        returns the dense `n`x`n` win counts
+
+    h2h_order()
+        returns the standings order and head-to-head adjusted order
+
+    h2h_standings_df()
+        returns the head-to-head adjusted standings without a dense board
+
+    h2h_board_df(keys=None)
+        returns the dense winrate board of every team, or of `keys`
+    """
+
+    keys: list[Hashable] = field(default_factory=list)
+    labels: dict = field(default_factory=dict)
+    points: np.ndarray = field(init=False, default=None)
+    __index: dict = field(init=False, default_factory=dict, repr=False)
+    __pending: list = field(init=False, default_factory=list, repr=False)
+    __coo: tuple = field(init=False, default=None, repr=False)
+    __codes: np.ndarray = field(init=False, default=None, repr=False)
+    __size: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self) -> None:
+
+        """
+        Index the initial keys and zero their points
+        """
+
+        keys, self.keys = self.keys, []
+        self.points = np.zeros(0)
+        self.__coo = tuple(np.zeros(0, dtype=np.int32) for _ in range(3))
+        self.__codes = np.zeros(0, dtype=np.int64)
+        self.add_teams(keys)
+
+    @classmethod
+    def from_standings(
+            cls,
+            standings: Iterable["Standings"],
+            by_owner: bool = False
+        ) -> "SparseBoard":
+
+        """
+        Combines the boards of many Standings objects into one board, such
+        as every league of a family or every season of a league
+
+        PARAMETERS
+        ----------
+        standings : Iterable[Standings]
+            Standings object instances; any without a board yet build one
+
+        by_owner : bool, default=False
+            key teams by their owner's user ID, so that a manager's teams in
+            every league or season are one team labelled by its first label,
+            and rosters without an owner are left out; teams are keyed by
+            `(league_id, roster_id)` and labelled "<team> (<league_id>)" when
+            False
+
+        RETURNS
+        -------
+        board : SparseBoard
+            SparseBoard object holding every game of every league
+        """
+
+        board = cls()
+
+        for season in standings:
+            if season.board_state is None:
+                season.make_h2h_board_df()
+            metadata = season._metadata # pylint: disable=W0212
+
+            if by_owner:
+                keys = metadata.owner_ids
+                labels = [
+                    metadata.user_id_team_map[i] for i in metadata.roster_ids
+                ]
+            else:
+                league_id = str(metadata.league_id)
+                keys = [(league_id, i) for i in metadata.roster_ids]
+                labels = [
+                    f"{metadata.user_id_team_map[i]} ({league_id})"
+                    for i in metadata.roster_ids
+                ]
+
+            owned = [key is not None for key in keys]
+            board.add_board_state(
+                season.board_state,
+                [key for key, own in zip(keys, owned) if own],
+                [i for i, own in zip(metadata.roster_ids, owned) if own],
+                [label for label, own in zip(labels, owned) if own]
+            )
+
+        if by_owner:
+            board.labels = utils.team_labels(board.labels)
+
+        return board
+
+    def add_teams(
+            self,
+            keys: Iterable[Hashable],
+            labels: Iterable[str] = None
+        ) -> np.ndarray:
+
+        """
+        Adds every key which is not on the board yet, with zero points and no
+        games, and returns the integer index of every key
+
+        PARAMETERS
+        ----------
+        keys : Iterable[Hashable]
+            keys of the teams
+
+        labels : Iterable[str], default=None
+            display label of each key; a key keeps the label it was first
+            added with
+
+        RETURNS
+        -------
+        indices : np.ndarray
+            integer array of indices, in the order of `keys`
+        """
+
+        keys = list(keys)
+        labels = [None] * len(keys) if labels is None else list(labels)
+        indices = np.empty(len(keys), dtype=int)
+
+        for i, (key, label) in enumerate(zip(keys, labels)):
+            index = self.__index.get(key)
+            if index is None:
+                index = self.__index[key] = len(self.keys)
+                self.keys.append(key)
+            if label is not None:
+                self.labels.setdefault(key, label)
+            indices[i] = index
+
+        if len(self.keys) > len(self.points):
+            self.points = np.concatenate(
+                [self.points, np.zeros(len(self.keys) - len(self.points))]
+            )
+
+        return indices
+
+    def indices(self, keys: Iterable[Hashable]) -> np.ndarray:
+
+        """
+        Returns the integer indices of `keys`
+
+        RAISES
+        ------
+        exception : KeyError
+            KeyError is raised when a key is not on the board
+        """
+
+        return np.array([self.__index[key] for key in keys], dtype=int)
+
+    def add_games(
+            self,
+            winners: np.ndarray,
+            losers: np.ndarray,
+            counts: np.ndarray | int = 1
+        ) -> None:
+
+        """
+        Adds wins of the teams at `winners` against the teams at `losers`
+
+        PARAMETERS
+        ----------
+        winners, losers : np.ndarray
+            integer arrays of team indices
+
+        counts : np.ndarray | int, default=1
+            number of wins of each pair
+        """
+
+        winners = np.asarray(winners, dtype=np.int32)
+        self.__pending.append((
+            winners,
+            np.asarray(losers, dtype=np.int32),
+            np.broadcast_to(np.asarray(counts, dtype=np.int32), winners.shape)
+        ))
+
+    def apply_week(
+            self,
+            records: list[tuple],
+            league_id: str = None
+        ) -> None:
+
+        """
+        Adds the points and decided games of one week; matchups with a tied
+        score, or without exactly two teams, add points but no win
+
+        PARAMETERS
+        ----------
+        records : list[tuple]
+            `(roster_id, matchup_id, points)` tuples from `MatchupStore.get()`
+
+        league_id : str, default=None
+            key teams by `(league_id, roster_id)` rather than by roster ID
+        """
+
+        keys = [
+            i[0] if league_id is None else (str(league_id), i[0])
+            for i in records
+        ]
+        rows = self.add_teams(keys)
+        scores = np.array([i[2] for i in records], dtype=float)
+
+        np.add.at(self.points, rows, scores)
+        self.add_games(*decided_games(rows, records, scores))
+
+    def add_board_state(
+            self,
+            board_state: "BoardState",
+            keys: Iterable[Hashable] = None,
+            roster_ids: Iterable[int] = None,
+            labels: Iterable[str] = None
+        ) -> None:
+
+        """
+        Adds the win counts and points of a dense `BoardState`; only its
+        nonzero win counts are read
+
+        PARAMETERS
+        ----------
+        board_state : BoardState
+            `BoardState` object instance
+
+        keys : Iterable[Hashable], default=None
+            key of each team of `roster_ids`; the roster IDs themselves when
+            None
+
+        roster_ids : Iterable[int], default=None
+            the teams of `board_state` to add; every team when None
+
+        labels : Iterable[str], default=None
+            display label of each key
+        """
+
+        roster_ids = board_state.roster_ids if roster_ids is None \
+            else list(roster_ids)
+        keys = roster_ids if keys is None else keys
+        columns = board_state.indices(roster_ids)
+        indices = self.add_teams(keys, labels)
+
+        wins = board_state.win_counts[np.ix_(columns, columns)]
+        winners, losers = np.nonzero(wins)
+
+        np.add.at(self.points, indices, board_state.points[columns])
+        self.add_games(
+            indices[winners],
+            indices[losers],
+            wins[winners, losers]
+        )
+
+    def __consolidate(self) -> None:
+
+        """
+        Merges pending games into `rows`, `cols` and `counts`, summing the
+        counts of repeated pairs, and refreshes the sorted pair codes used for
+        lookups
+        """
+
+        # codes depend on the number of teams, so new teams refresh them too
+        n = len(self.keys)
+        if not self.__pending and self.__size == n:
+            return
+
+        rows, cols, counts = (
+            np.concatenate([part[k] for part in [self.__coo, *self.__pending]])
+            for k in range(3)
+        )
+        codes = rows.astype(np.int64) * n + cols
+        codes, inverse = np.unique(codes, return_inverse=True)
+
+        self.__coo = (
+            (codes // n).astype(np.int32),
+            (codes % n).astype(np.int32),
+            np.bincount(inverse, counts, len(codes)).astype(np.int32)
+        )
+        self.__codes = codes
+        self.__size = n
+        self.__pending = []
+
+    @property
+    def rows(self) -> np.ndarray:
+
+        """
+        Index of the winning team of each pair
+        """
+
+        self.__consolidate()
+        return self.__coo[0]
+
+    @property
+    def cols(self) -> np.ndarray:
+
+        """
+        Index of the losing team of each pair
+        """
+
+        self.__consolidate()
+        return self.__coo[1]
+
+    @property
+    def counts(self) -> np.ndarray:
+
+        """
+        Number of wins of each pair
+        """
+
+        self.__consolidate()
+        return self.__coo[2]
+
+    @property
+    def nnz(self) -> int:
+
+        """
+        Number of pairs of teams with at least one decided game
+        """
+
+        return len(self.counts)
+
+    @property
+    def nbytes(self) -> int:
+
+        """
+        Bytes held by the board's arrays
+        """
+
+        return self.points.nbytes + self.rows.nbytes + self.cols.nbytes + \
+            self.counts.nbytes + self.__codes.nbytes
+
+    def wins(self) -> np.ndarray:
+
+        """
+        Returns the decided wins of each team
+        """
+
+        return np.bincount(self.rows, self.counts, len(self.keys)).astype(int)
+
+    def losses(self) -> np.ndarray:
+
+        """
+        Returns the decided losses of each team
+        """
+
+        return np.bincount(self.cols, self.counts, len(self.keys)).astype(int)
+
+    def submatrix(self, indices: Iterable[int]) -> np.ndarray:
+
+        """
+        Returns the dense win counts among a few teams, looked up by binary
+        search over the sorted pair codes
+
+        PARAMETERS
+        ----------
+        indices : Iterable[int]
+            integer indices of the teams, such as from `indices()`
+
+        RETURNS
+        -------
+        win_counts : np.ndarray
+            `k`x`k` integer array where `[i, j]` counts the wins of team
+            `indices[i]` against team `indices[j]`
+        """
+
+        self.__consolidate()
+        indices = np.asarray(indices, dtype=np.int64)
+        codes = (indices[:, None] * len(self.keys) + indices[None, :]).ravel()
+
+        found = np.searchsorted(self.__codes, codes)
+        hit = found < len(self.__codes)
+        hit[hit] = self.__codes[found[hit]] == codes[hit]
+
+        win_counts = np.zeros(len(codes), dtype=int)
+        win_counts[hit] = self.__coo[2][found[hit]]
+
+        return win_counts.reshape(len(indices), len(indices))
+
+    def to_dense(self) -> np.ndarray:
+
+        """
+        Returns the dense `n`x`n` win counts, in the order of `keys`
+        """
+
+        win_counts = np.zeros((len(self.keys),) * 2, dtype=int)
+        win_counts[self.rows, self.cols] = self.counts
+
+        return win_counts
+
+    def h2h_order(self) -> tuple[np.ndarray, np.ndarray]:
+
+        """
+        Ranks every team by wins, losses then points, and reorders teams tied
+        on wins by the head-to-head tiebreak rules of
+        `Standings.make_h2h_standings_df()`; only the win counts within each
+        tied group are made dense
+
+        RETURNS
+        -------
+        base : np.ndarray
+            team indices in standings order
+
+        order : np.ndarray
+            team indices in head-to-head adjusted order
+        """
+
+        wins = self.wins()
+        base = np.lexsort((-self.points, -self.losses(), -wins))
+        order = base.copy()
+
+        groups = np.flatnonzero(np.diff(wins[base])) + 1
+        for ties in np.split(np.arange(len(base)), groups):
+            if len(ties) > 1:
+                tied = base[ties]
+                order[ties] = tied[sweep_order(self.submatrix(tied))]
+
+        return base, order
+
+    def h2h_standings_df(self) -> DataFrame:
+
+        """
+        Returns the head-to-head adjusted standings with the columns of
+        `Standings.h2h_standings_df`, without building a dense board
+        """
+
+        base, order = self.h2h_order()
+        position = np.empty(len(base), dtype=int)
+        position[base] = np.arange(len(base))
+
+        return DataFrame({
+            "team": [self.__label(self.keys[i]) for i in order],
+            "h2h_delta": position[order] - np.arange(len(order)),
+            "wins": self.wins()[order],
+            "losses": self.losses()[order],
+            "points": self.points[order]
+        })
+
+    def h2h_board_df(self, keys: Iterable[Hashable] = None) -> DataFrame:
+
+        """
+        Returns the dense winrate board in the format of
+        `Standings.h2h_board_df`, sorted by wins, losses then points
+
+        PARAMETERS
+        ----------
+        keys : Iterable[Hashable], default=None
+            only include these teams; every team when None, which costs
+            memory in the square of the number of teams
+
+        RETURNS
+        -------
+        h2h_board_df : DataFrame
+            DataFrame of the head-to-head winrate board
+        """
+
+        base, _ = self.h2h_order()
+        if keys is not None:
+            wanted = np.zeros(len(self.keys), dtype=bool)
+            wanted[self.indices(keys)] = True
+            base = base[wanted[base]]
+
+        teams = [self.__label(self.keys[i]) for i in base]
+        wins = self.submatrix(base)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df = DataFrame(wins / (wins + wins.T), index=teams, columns=teams)
+        df["points"] = self.points[base]
+
+        return df
+
+    def __label(self, key: Hashable) -> str:
+
+        return self.labels.get(key, str(key))
@@ -0,0 +1,370 @@
+"""
+Local stand-in for the Sleeper API, serving recorded or synthetic leagues so
+that fetching, concurrency and caching can be measured without a network
+
+Example:
+    python -m sleeper_h2h.standin --teams 10 --weeks 14 --latency 0.05
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from .snapshot import SeasonSnapshot
+from .transport import route
+
+
+def snapshot_responses(snapshot: SeasonSnapshot) -> dict:
+
+    """
+    Converts a season snapshot into the responses of the Sleeper API
+    endpoints read by `Standings`, keyed by `route()`
+
+    PARAMETERS
+    ----------
+    snapshot : SeasonSnapshot
+        `SeasonSnapshot` object instance, such as one returned by
+        `synthetic.make_snapshot()`
+
+    RETURNS
+    -------
+    responses : dict
+        decoded JSON responses for the league, its rosters, its users and the
+        matchups of every week before `snapshot.week`
+    """
+
+    league = f"league/{snapshot.league_id}"
+    users, rosters = [], []
+
+    for roster_id, team, wins, losses, points in zip(
+            snapshot.roster_ids,
+            snapshot.teams,
+            snapshot.wins,
+            snapshot.losses,
+            np.nansum(snapshot.scores, axis=0)
+        ):
+        users.append({
+            "user_id": str(roster_id),
+            "display_name": str(team),
+            "metadata": {"team_name": str(team)}
+        })
+        rosters.append({
+            "roster_id": int(roster_id),
+            "owner_id": str(roster_id),
+            "settings": {
+                "wins": int(wins),
+                "losses": int(losses),
+                "ties": 0,
+                "fpts": int(points),
+                "fpts_decimal": int(round(points % 1 * 100))
+            }
+        })
+
+    responses = {
+        league: {
+            "league_id": snapshot.league_id,
+            "status": "in_season",
+            "total_rosters": len(rosters),
+            "settings": {"last_scored_leg": snapshot.week - 1}
+        },
+        f"{league}/rosters": rosters,
+        f"{league}/users": users
+    }
+
+    for week in range(1, snapshot.week):
+        responses[f"{league}/matchups/{week}"] = [
+            {"roster_id": roster_id, "matchup_id": matchup, "points": points}
+            for roster_id, matchup, points in snapshot.records(week)
+        ]
+
+    return responses
+
+
+@dataclass
+class StandIn:
+
+    """
+    A threaded local HTTP server which answers Sleeper API requests from a
+    dictionary of responses, with configurable latency and error injection
+
+    Pass `url` as the `base_url` of a `Standings` object to fetch from it
+
+    ATTRIBUTES
+    ----------
+    responses : dict
+        decoded JSON responses keyed by `route()`, such as those returned by
+        `snapshot_responses()` or recorded by a `Recorder`
+
+    latency : float, default=0
+        seconds every request waits before it is answered
+
+    jitter : float, default=0
+        maximum number of seconds added at random to `latency`
+
+    error_rate : float, default=0
+        probability that a request is answered with `error_status`
+
+    error_status : int, default=500
+        HTTP status code of injected errors
+
+    host : str, default="127.0.0.1"
+        address the server binds to
+
+    port : int, default=0
+        port the server binds to; a free port is chosen when 0
+
+    seed : int, default=None
+        seed for the latency and error injection
+
+    requests : int, default=0
+        number of requests received
+
+    errors : int, default=0
+        number of injected errors
+
+    METHODS
+    -------
+    from_recording(path, **kwargs)
+        serves the responses written by `Recorder.save()`
+
+    from_snapshots(snapshots, **kwargs)
+        serves one league per `SeasonSnapshot`
+
+    start()
+        starts serving in a background thread
+
+    stop()
+        shuts the server down
+    """
+
+    responses: dict
+    latency: float = 0
+    jitter: float = 0
+    error_rate: float = 0
+    error_status: int = 500
+    host: str = "127.0.0.1"
+    port: int = 0
+    seed: int = None
+    requests: int = field(init=False, default=0)
+    errors: int = field(init=False, default=0)
+    __bodies: dict = field(init=False, default_factory=dict, repr=False)
+    __server: ThreadingHTTPServer = field(init=False, default=None, repr=False)
+    __thread: threading.Thread = field(init=False, default=None, repr=False)
+    __lock: threading.Lock = field(
+        init=False,
+        default_factory=threading.Lock,
+        repr=False
+    )
+    __random: random.Random = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+
+        """
+        Encode every response once, so that serving is not bound by JSON
+        """
+
+        self.__bodies = {
+            key: json.dumps(payload).encode()
+            for key, payload in self.responses.items()
+        }
+        self.__random = random.Random(self.seed)
+
+    @classmethod
+    def from_recording(cls, path: str | Path, **kwargs) -> "StandIn":
+
+        """
+        Returns a StandIn serving the JSON file written by `Recorder.save()`;
+        keyword arguments are passed to the constructor
+        """
+
+        return cls(json.loads(Path(path).expanduser().read_text()), **kwargs)
+
+    @classmethod
+    def from_snapshots(
+            cls,
+            snapshots: Iterable[SeasonSnapshot],
+            **kwargs
+        ) -> "StandIn":
+
+        """
+        Returns a StandIn serving one league per snapshot; keyword arguments
+        are passed to the constructor
+        """
+
+        responses = {}
+        for snapshot in snapshots:
+            responses.update(snapshot_responses(snapshot))
+
+        return cls(responses, **kwargs)
+
+    @property
+    def url(self) -> str:
+
+        """
+        Root of the stand-in API, to be passed as a `base_url`
+        """
+
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self) -> "StandIn":
+
+        """
+        Binds the server and serves requests in a daemon thread; assigns
+        `self.port` when it was 0
+        """
+
+        self.__server = ThreadingHTTPServer(
+            (self.host, self.port),
+            self.__handler()
+        )
+        self.__server.daemon_threads = True
+        self.port = self.__server.server_address[1]
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever,
+            daemon=True
+        )
+        self.__thread.start()
+
+        return self
+
+    def stop(self) -> None:
+
+        """
+        Stops serving and closes the socket
+        """
+
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+            self.__server = self.__thread = None
+
+    def __enter__(self) -> "StandIn":
+
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+
+        self.stop()
+
+    def _respond(self, path: str) -> tuple[int, bytes]:
+
+        """
+        Returns the status code and body for a request path, after waiting
+        for the configured latency
+        """
+
+        with self.__lock:
+            self.requests += 1
+            delay = self.latency + self.__random.uniform(0, self.jitter)
+            failed = self.__random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if failed:
+            return self.error_status, b'{"error": "injected"}'
+
+        try:
+            return 200, self.__bodies[route(path)]
+        except (KeyError, ValueError):
+            return 404, b"null"
+
+    def __handler(self) -> type[BaseHTTPRequestHandler]:
+
+        """
+        Returns a request handler class bound to this StandIn
+        """
+
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            """
+            Answers GET requests through `StandIn._respond()`
+            """
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None: # pylint: disable=C0103
+
+                # pylint: disable-next=W0212
+                status, body = standin._respond(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+
+                pass
+
+        return Handler
+
+
+def main(argv: list[str] = None) -> None:
+
+    """
+    Serves a recording, or synthetic leagues with IDs 0 to `--leagues` - 1,
+    until interrupted
+    """
+
+    from . import synthetic
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--recording", type=Path, default=None)
+    parser.add_argument("--teams", type=int, default=10)
+    parser.add_argument("--weeks", type=int, default=14)
+    parser.add_argument("--leagues", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    options = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "host": args.host,
+        "port": args.port
+    }
+
+    if args.recording is not None:
+        standin = StandIn.from_recording(args.recording, **options)
+    else:
+        standin = StandIn.from_snapshots(
+            (
+                synthetic.make_snapshot(
+                    args.teams,
+                    args.weeks,
+                    seed=i,
+                    league_id=str(i)
+                )
+                for i in range(args.leagues)
+            ),
+            **options
+        )
+
+    with standin:
+        print(f"Serving the Sleeper API stand-in at {standin.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,352 @@ Fantasy Football leagues
 """
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 import numpy as np
-from pandas import DataFrame, concat, get_dummies
-from sleeper_wrapper import League
+from pandas import DataFrame
 
-from . import utils
+from . import SLEEPER_API_URL, simulation, telemetry, utils
+from .cache import ResponseCache
+from .result import StandingsResult
+from .snapshot import SeasonSnapshot
+
+if TYPE_CHECKING:
+    from sleeper_wrapper import League
+
+
+def _raise_for_error(payload: list | dict | Exception) -> list | dict:
+
+    """
+    Raises the HTTPError which `sleeper_wrapper` returns, rather than raises,
+    for unsuccessful requests; otherwise passes the payload through
+    """
+
+    if isinstance(payload, Exception):
+        raise payload
+
+    return payload
+
+
+@dataclass
+class MatchupStore:
+
+    """
+    Stores weekly matchups in memory so that each week is fetched from Sleeper
+    at most once, no matter how many Standings methods read it
+
+    ATTRIBUTES
+    ----------
+    league : League
+        `League` object instance used to fetch weeks which are not yet stored
+
+    hits : int, default=0
+        number of `get()` calls served from memory
+
+    misses : int, default=0
+        number of weeks which required a `League.get_matchups()` call, whether
+        through `get()` or `prefetch()`
+
+    METHODS
+    -------
+    get(week)
+        returns parsed matchup records for a week, fetching them on a miss
+
+    prefetch(weeks, max_workers=None)
+        fetches every week in `weeks` which is not yet stored, concurrently
+        when `max_workers` is supplied
+
+    put(week, records)
+        stores already parsed records for a week without fetching
+
+    invalidate(week=None)
+        drops a stored week, or every stored week when `week` is None
+    """
+
+    league: "League"
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    __weeks: dict = field(init=False, default_factory=dict, repr=False)
+
+    def get(self, week: int) -> list[tuple]:
+
+        """
+        Returns the parsed matchups of a week, only calling
+        `League.get_matchups()` if the week is not already stored
+
+        PARAMETERS
+        ----------
+        week : int
+            week of the season to look up
+
+        RETURNS
+        -------
+        records : list[tuple]
+            list of `(roster_id, matchup_id, points)` tuples, one per roster
+        """
+
+        if week in self.__weeks:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.__weeks[week] = self.__fetch(week)
+
+        return self.__weeks[week]
+
+    def prefetch(self, weeks: Iterable[int], max_workers: int = None) -> None:
+
+        """
+        Fetches every week in `weeks` which is not yet stored, using a bounded
+        thread pool so that latency tracks the slowest request rather than the
+        sum of all requests; each fetched week counts as a miss
+
+        PARAMETERS
+        ----------
+        weeks : Iterable[int]
+            weeks of the season to store
+
+        max_workers : int, default=None
+            maximum number of concurrent requests; weeks are fetched serially
+            when None
+
+        RAISES
+        ------
+        exception : Exception
+            the first error raised while fetching is re-raised to the caller,
+            in which case no week from this call is stored
+        """
+
+        missing = [week for week in weeks if week not in self.__weeks]
+
+        with telemetry.span("fetch_matchups", weeks=len(missing)):
+            fetched = utils.map_threaded(self.__fetch, missing, max_workers)
+
+        self.misses += len(missing)
+        self.__weeks.update(zip(missing, fetched))
+
+    def put(self, week: int, records: list[tuple]) -> None:
+
+        """
+        Stores parsed records for a week, such as those read from a
+        `SeasonSnapshot`, so that `get()` never fetches it
+
+        PARAMETERS
+        ----------
+        week : int
+            week of the season to store
+
+        records : list[tuple]
+            list of `(roster_id, matchup_id, points)` tuples, one per roster
+        """
+
+        self.__weeks[week] = records
+
+    def __fetch(self, week: int) -> list[tuple]:
+
+        """
+        Calls `League.get_matchups()` and parses the response into
+        `(roster_id, matchup_id, points)` tuples
+        """
+
+        return [
+            (i["roster_id"], i["matchup_id"], i["points"])
+            for i in _raise_for_error(self.league.get_matchups(week))
+        ]
+
+    def invalidate(self, week: int = None) -> None:
+
+        """
+        Drops stored matchups so that the next `get()` fetches them again
+
+        PARAMETERS
+        ----------
+        week : int, default=None
+            week of the season to drop; drops every stored week when None
+        """
+
+        if week is None:
+            self.__weeks.clear()
+        else:
+            self.__weeks.pop(week, None)
+
+
+def decided_games(
+        rows: np.ndarray,
+        records: list[tuple],
+        scores: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+
+    """
+    Returns the winner and loser of every decided game of one week; matchups
+    with a tied score, or without exactly two teams, are left out
+
+    PARAMETERS
+    ----------
+    rows : np.ndarray
+        integer array of each record's team index
+
+    records : list[tuple]
+        `(roster_id, matchup_id, points)` tuples from `MatchupStore.get()`
+
+    scores : np.ndarray
+        float array of each record's points
+
+    RETURNS
+    -------
+    winners, losers : tuple[np.ndarray, np.ndarray]
+        integer arrays of the team indices of each game's winner and loser
+    """
+
+    matchups = np.array(
+        [-1 if i[1] is None else i[1] for i in records],
+        dtype=int
+    )
+
+    # sorting by matchup then score leaves each pair as (loser, winner)
+    ids, counts = np.unique(matchups, return_counts=True)
+    paired = np.isin(matchups, ids[(counts == 2) & (ids >= 0)])
+    order = np.lexsort((scores[paired], matchups[paired]))
+    pairs = rows[paired][order].reshape(-1, 2)
+    pair_scores = scores[paired][order].reshape(-1, 2)
+    decided = pair_scores[:, 0] != pair_scores[:, 1]
+
+    return pairs[decided, 1], pairs[decided, 0]
+
+
+@dataclass
+class BoardState:
+
+    """
+    Running totals behind a head-to-head board, so that a new week can be
+    applied without replaying the whole season
+
+    Roster IDs are mapped to integer indices once, then every week is added to
+    preallocated NumPy arrays with vectorized operations; the winrate board is
+    only derived from the win counts on request
+
+    ATTRIBUTES
+    ----------
+    roster_ids : list[int]
+        roster ID of every team in the league; a team's position in this list
+        is its index in `win_counts` and `points`
+
+    week : int, default=1
+        the first week of the season which has not been applied yet
+
+    win_counts : np.ndarray, default=None
+        `n`x`n` integer array where `[i, j]` counts the wins of team `i`
+        against team `j`
+
+    points : np.ndarray, default=None
+        array of total points scored by each team
+
+    METHODS
+    -------
+    indices(roster_ids)
+        returns the integer indices of `roster_ids`
+
+    apply_week(records)
+        adds one week of matchups to `win_counts` and `points`
+
+    winrates(roster_ids)
+        returns the head-to-head winrate matrix, ordered by `roster_ids`
+    """
+
+    roster_ids: list[int]
+    week: int = field(default=1)
+    win_counts: np.ndarray = field(default=None)
+    points: np.ndarray = field(default=None)
+    __index: np.ndarray = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+
+        """
+        Initialize the roster ID lookup table and zeroed totals for every team
+        """
+
+        roster_ids = np.asarray(self.roster_ids, dtype=int)
+        self.__index = np.full(roster_ids.max(initial=0) + 1, -1)
+        self.__index[roster_ids] = np.arange(len(roster_ids))
+
+        if self.win_counts is None:
+            self.win_counts = np.zeros((len(roster_ids),) * 2, dtype=int)
+        if self.points is None:
+            self.points = np.zeros(len(roster_ids))
+
+    def indices(self, roster_ids: Iterable[int]) -> np.ndarray:
+
+        """
+        Returns the integer indices of `roster_ids` in `self.roster_ids`
+
+        PARAMETERS
+        ----------
+        roster_ids : Iterable[int]
+            roster IDs to look up
+
+        RETURNS
+        -------
+        indices : np.ndarray
+            integer array of indices, in the order of `roster_ids`
+
+        RAISES
+        ------
+        exception : KeyError
+            KeyError is raised when a roster ID is not in `self.roster_ids`
+        """
+
+        roster_ids = np.fromiter(roster_ids, dtype=int)
+        known = (roster_ids >= 0) & (roster_ids < len(self.__index))
+        indices = np.full(len(roster_ids), -1)
+        indices[known] = self.__index[roster_ids[known]]
+
+        if (indices < 0).any():
+            raise KeyError(int(roster_ids[indices < 0][0]))
+
+        return indices
+
+    def apply_week(self, records: list[tuple]) -> None:
+
+        """
+        Adds the results of week `self.week` then moves on to the next week;
+        matchups with a tied score, or without exactly two teams, add points
+        but no win
+
+        PARAMETERS
+        ----------
+        records : list[tuple]
+            `(roster_id, matchup_id, points)` tuples from `MatchupStore.get()`
+        """
+
+        rows = self.indices(i[0] for i in records)
+        scores = np.array([i[2] for i in records], dtype=float)
+
+        np.add.at(self.points, rows, scores)
+        np.add.at(self.win_counts, decided_games(rows, records, scores), 1)
+        self.week += 1
+
+    def winrates(self, roster_ids: Iterable[int]) -> np.ndarray:
+
+        """
+        Returns the head-to-head winrate matrix `wins / (wins + wins.T)`, where
+        pairs of teams which never played are NaN
+
+        PARAMETERS
+        ----------
+        roster_ids : Iterable[int]
+            roster IDs giving the order of the rows and columns
+
+        RETURNS
+        -------
+        winrates : np.ndarray
+            `n`x`n` float array where `[i, j]` is the winrate of team `i`
+            against team `j`
+        """
+
+        order = self.indices(roster_ids)
+        wins = self.win_counts[np.ix_(order, order)]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return wins / (wins + wins.T)
 
 
 @dataclass
@@ -23,8 +363,26 @@ class Metadata:
     __league_id : int | str
         the ID of the Sleeper Fantasy Football league
 
+    max_workers : int, default=None
+        maximum number of concurrent Sleeper API requests; rosters and users
+        are fetched serially when None
+
+    cache : ResponseCache, default=None
+        `ResponseCache` object instance through which every Sleeper API request
+        is served; nothing is cached when None
+
+    base_url : str, default=SLEEPER_API_URL
+        root of the Sleeper API, such as the `url` of a local `StandIn`
+        server
+
+    transport : Callable[[str], list | dict | Exception], default=None
+        function which makes every Sleeper API request, such as a `Recorder`
+        or `Replayer`; requests are made with `requests` when None
+
     league : League, default=None
-        `League` object instance
+        `SleeperLeague` object instance; one is created from the other
+        attributes when None, while passing one which was already requested
+        saves requesting the league again
 
     __rosters : list[dict], default=[]
         `League.get_rosters()` instance
@@ -33,26 +391,52 @@ class Metadata:
         `League.get_users()` instance
 
     standings : list[tuple], default=[]
-        `League.get_standings()` instance; the return type hint provided by
+        `(team, wins, losses, points)` string tuples sorted by wins, in the
+        format of `League.get_standings()`; the return type hint provided by
         the sleeper_wrapper library is incorrect, but its docstring is
 
+    roster_ids : list[int], default=[]
+        roster ID of each row of `standings`; every computation is keyed by
+        roster ID, and team names are only used as display labels
+
+    owner_ids : list[str], default=[]
+        user ID of the owner of each row of `standings`, which identifies a
+        manager across seasons; None for a roster without an owner or a
+        Metadata object read from a snapshot
+
     user_id_team_map : dict, default={}
-        Dictionary mapping user ID to team name; essentially merges the returns
-        of `League.map_rosterid_to_ownerid()` and
-        `League.map_users_to_team_name()`
+        Dictionary mapping roster ID to the team's display label, as returned
+        by `utils.team_labels()`; labels are unique within the league
 
     week : int, default=None
         the current week of the season; simply wins + losses + 1 for the first
         place team
+
+    matchups : MatchupStore, default=None
+        `MatchupStore` object instance shared by every Standings method which
+        reads weekly matchups
+
+    METHODS
+    -------
+    from_snapshot(snapshot)
+        builds a Metadata object from a `SeasonSnapshot` without any network
+        client
     """
 
     __league_id: int | str
-    league: League = field(init=False, default=None)
+    max_workers: int = field(default=None)
+    cache: ResponseCache = field(default=None)
+    base_url: str = field(default=SLEEPER_API_URL)
+    transport: Callable[[str], list | dict | Exception] = field(default=None)
+    league: "League" = field(default=None)
     __rosters: list[dict] = field(init=False, default_factory=list)
     __users: list[dict] = field(init=False, default_factory=list)
     standings: list[tuple] = field(init=False, default_factory=list)
+    roster_ids: list[int] = field(init=False, default_factory=list)
+    owner_ids: list[str] = field(init=False, default_factory=list)
     user_id_team_map: dict = field(init=False, default_factory=dict)
     week: int = field(init=False, default_factory=int)
+    matchups: MatchupStore = field(init=False, default=None)
 
     def __post_init__(self) -> None:
 
@@ -60,17 +444,148 @@ class Metadata:
         Initialize League metadata attributes
         """
 
-        self.league = League(self.__league_id)
-        self.__rosters = self.league.get_rosters()
-        self.__users = self.league.get_users()
-        self.standings = self.league.get_standings(
+        with telemetry.span("metadata", league_id=str(self.__league_id)):
+            self.__fetch_league()
+
+    def __fetch_league(self) -> None:
+
+        """
+        Requests the league, its rosters and its users, then ranks and
+        labels every roster
+        """
+
+        # sleeper_wrapper and requests are only needed to fetch, not to load a
+        # snapshot
+        from .api import SleeperLeague # pylint: disable=C0415
+
+        if self.league is None:
+            self.league = SleeperLeague(
+                self.__league_id,
+                self.cache,
+                self.base_url,
+                self.transport
+            )
+        self.__rosters, self.__users = utils.map_threaded(
+            lambda get: _raise_for_error(get()),
+            [self.league.get_rosters, self.league.get_users],
+            self.max_workers
+        )
+
+        # ranked as `League.get_standings()` does, down to the team name on a
+        # tie of wins, losses and points; teams without an owner sort last
+        names = self.league.map_users_to_team_name(self.__users)
+        rosters = sorted(
             self.__rosters,
-            self.__users
+            key=lambda roster: (
+                roster["settings"]["wins"],
+                roster["settings"]["losses"],
+                roster["settings"]["fpts"],
+                names.get(roster["owner_id"]) or ""
+            ),
+            reverse=True
         )
-        self.user_id_team_map = utils.merge_users_and_teams(
-            self.league.map_rosterid_to_ownerid(self.__rosters),
-            self.league.map_users_to_team_name(self.__users)
+
+        self.roster_ids = [roster["roster_id"] for roster in rosters]
+        self.owner_ids = [roster["owner_id"] for roster in rosters]
+        self.standings = [
+            (
+                names.get(roster["owner_id"]),
+                str(roster["settings"]["wins"]),
+                str(roster["settings"]["losses"]),
+                str(roster["settings"]["fpts"])
+            )
+            for roster in rosters
+        ]
+        self.user_id_team_map = utils.team_labels(
+            dict(zip(self.roster_ids, (row[0] for row in self.standings)))
         )
+        self.matchups = MatchupStore(self.league)
+
+    @property
+    def league_id(self) -> int | str:
+
+        """
+        The ID of the Sleeper Fantasy Football league
+        """
+
+        return self.__league_id
+
+    @classmethod
+    def from_snapshot(cls, snapshot: SeasonSnapshot) -> "Metadata":
+
+        """
+        Builds a Metadata object from a `SeasonSnapshot` without constructing
+        a `League` or making any request; every week of the snapshot is
+        preloaded into `matchups`, while `league`, rosters and users are left
+        empty
+
+        PARAMETERS
+        ----------
+        snapshot : SeasonSnapshot
+            `SeasonSnapshot` object instance, such as one returned by
+            `SeasonSnapshot.load()`
+
+        RETURNS
+        -------
+        metadata : Metadata
+            Metadata object equivalent to the one the snapshot was taken from
+        """
+
+        metadata = cls.__new__(cls)
+        metadata.__setstate__({
+            "_Metadata__league_id": snapshot.league_id,
+            "_Metadata__rosters": [],
+            "_Metadata__users": [],
+            "standings": [
+                (str(team), str(wins), str(losses), str(fpts))
+                for team, wins, losses, fpts in zip(
+                    snapshot.teams,
+                    snapshot.wins,
+                    snapshot.losses,
+                    snapshot.fpts
+                )
+            ],
+            "roster_ids": snapshot.roster_ids.tolist(),
+            "owner_ids": [None] * len(snapshot.roster_ids),
+            "user_id_team_map": utils.team_labels(
+                dict(zip(snapshot.roster_ids.tolist(), snapshot.teams.tolist()))
+            ),
+            "week": snapshot.week
+        })
+
+        for week in range(1, snapshot.week):
+            metadata.matchups.put(week, snapshot.records(week))
+
+        return metadata
+
+    def __setstate__(self, state: dict) -> None:
+
+        """
+        Restores a pickled Metadata object, backfilling any attributes added
+        after it was pickled
+        """
+
+        self.__dict__.update(state)
+        if "roster_ids" not in state:
+            # older pickles keyed teams by name, so their roster IDs are
+            # recovered by joining on the stripped name one last time
+            roster_map = {
+                team: roster_id
+                for roster_id, team in self.user_id_team_map.items()
+            }
+            self.roster_ids = [
+                roster_map[utils.remove_emojis(row[0])]
+                for row in self.standings
+            ]
+            self.user_id_team_map = utils.team_labels(self.user_id_team_map)
+        if "owner_ids" not in state:
+            owners = {
+                roster["roster_id"]: roster["owner_id"]
+                for roster in self.__rosters
+            }
+            self.owner_ids = [owners.get(i) for i in self.roster_ids]
+        if self.matchups is None:
+            self.matchups = MatchupStore(self.league)
 
 
 @dataclass
@@ -88,35 +603,77 @@ class Standings:
     _metadata : Metadata, default=None
         `Metadata` object instance
 
-    _standings_df : DataFrame, default=DataFrame()
+    max_workers : int, default=None
+        maximum number of concurrent Sleeper API requests used to fetch
+        rosters, users and every past week's matchups; requests are made
+        serially when None
+
+    cache : ResponseCache, default=None
+        `ResponseCache` object instance used to store Sleeper API responses on
+        disk between runs; completed weeks are stored permanently while
+        rosters, users and the current week expire after the cache's TTL
+
+    board_state : BoardState, default=None
+        `BoardState` object instance holding the win counts and points of
+        every applied week; pass the `board_state` of a previous run to only
+        apply weeks played since
+
+    base_url : str, default=SLEEPER_API_URL
+        root of the Sleeper API, such as the `url` of a local `StandIn`
+        server
+
+    transport : Callable[[str], list | dict | Exception], default=None
+        function which makes every Sleeper API request, such as a `Recorder`
+        or `Replayer`; requests are made with `requests` when None
+
+    result : StandingsResult, default=None
+        `StandingsResult` object instance holding the standings, board and
+        head-to-head order as arrays; assigned by `make_h2h_board_df()`
+
+    _standings_df : DataFrame
         DataFrame of the current standings, sorted by wins then points; this is
-        generated entirely by the `sleeper_wrapper` library which uses rounding
-        for points
+        read from the rosters returned by Sleeper, which round points
 
-    standings_df : DataFrame, default=DataFrame()
+    standings_df : DataFrame
         DataFrame of the current standings, sorted by wins then points; this
         uses `_standings_df` as a reference but instead calculates points by
         iterating over weekly matchups, resulting in no rounding
 
-    h2h_board_df : DataFrame, default=DataFrame()
+    h2h_board_df : DataFrame
         DataFrame of the head-to-head winrate board; read rowwise, each cell
         represents the winrate of the row index's team against teams in the
         columns; points are in the last column
 
-    h2h_standings_df : DataFrame, default=DataFrame()
+    h2h_standings_df : DataFrame
         DataFrame of the current standings, sorted by wins, then head-to-head
-        rules, then points; copy of `standings_df` and modified it according to
-        `h2h_board_df`
-    
+        rules, then points, with an "h2h_delta" column
+
+    The four DataFrames are built from `result` or `Metadata.standings` each
+    time they are read, and are empty until the board is generated
+
     METHODS
     -------
-    __get_standings_df_rounded_points(standings)
-        returns a DataFrame of the current standings with rounded points;
-        assigns `_standings_df`
+
+    fetch_matchups()
+        fetches every past week's matchups into the shared `MatchupStore`
+        without computing anything
+
+    from_snapshot(snapshot)
+        builds a Standings object from a `SeasonSnapshot` or a path to one
+
+    to_snapshot()
+        returns a `SeasonSnapshot` of the season up to the current week
+
+    __apply_weeks(week)
+        applies every matchup before `week` not yet in `board_state`;
+        assigns `board_state`
 
     _get_standings_df_exact_points()
-        returns a DataFrame of the current standings with exact points;
-        assigns `standings_df`
+        returns a DataFrame of the current standings with exact points
+
+    update_to_week(week)
+        applies only new weeks to the head-to-head board; assigns
+        `board_state` and `result`
 
     make_h2h_board_df()
         generates head-to-head winrate DataFrame from class instance;
@@ -124,112 +681,245 @@ class Standings:
 
     make_h2h_standings_df()
         generates a DataFrame of the current standings with head-to-head
-        adjustments applied; assigns `h2h_standings_df`
+        adjustments applied; assigns `result.order`
+
+    iter_weekly(start=1, end=None)
+        yields the standings as of the end of every week, in one pass over
+        the season
+
+    simulate_playoff_odds(n_sims, remaining_schedule, score_model)
+        returns each team's probability of finishing as every seed
 
     """
 
     league_id: int | str
     _metadata: Metadata = field(default=None)
-    _standings_df: DataFrame = field(init=False, default_factory=DataFrame)
-    standings_df: DataFrame = field(init=False, default_factory=DataFrame)
-    h2h_board_df: DataFrame = field(init=False, default_factory=DataFrame)
-    h2h_standings_df: DataFrame = field(init=False, default_factory=DataFrame)
+    max_workers: int = field(default=None)
+    cache: ResponseCache = field(default=None)
+    board_state: BoardState = field(default=None)
+    base_url: str = field(default=SLEEPER_API_URL)
+    transport: Callable[[str], list | dict | Exception] = field(default=None)
+    result: StandingsResult = field(init=False, default=None)
 
     def __post_init__(self) -> None:
 
         """
-        Initialize the Metadata object and rounded standings generated purely
-        by `sleeper_wrapper`
+        Initialize the Metadata object and the current week read from the
+        league's rosters
         """
 
         if not self._metadata:
-            self._metadata = Metadata(self.league_id)
-        self._standings_df = self.__get_standings_df_rounded_points(
-            self._metadata.standings
+            self._metadata = Metadata(
+                self.league_id,
+                self.max_workers,
+                self.cache,
+                self.base_url,
+                self.transport
+            )
+        _, wins, losses, _ = self._metadata.standings[0]
+        self._metadata.week = int(wins) + int(losses) + 1
+
+    @property
+    def _standings_df(self) -> DataFrame:
+
+        """
+        DataFrame of `Metadata.standings`, which uses integer rounding for
+        point calculations, labelled by `Metadata.user_id_team_map`
+        """
+
+        df = DataFrame(
+            self._metadata.standings,
+            columns=["team", "wins", "losses", "points"]
         )
+        df["team"] = [
+            self._metadata.user_id_team_map[roster_id]
+            for roster_id in self._metadata.roster_ids
+        ]
 
-    def __get_standings_df_rounded_points(
-            self,
-            standings: list[tuple]
-        ) -> DataFrame:
+        return df
+
+    @property
+    def standings_df(self) -> DataFrame:
 
         """
-        Returns a DataFrame directly from `League.get_standings()` which
-        uses integer rounding for point calculations
+        DataFrame of the current standings with exact points, built from
+        `self.result`
+        """
+
+        return DataFrame() if self.result is None else self.result.standings_df
 
-        This method should only be internally called by `__post_init__()` and
-        it assigns the attribute `self._standings_df`
+    @property
+    def h2h_board_df(self) -> DataFrame:
+
+        """
+        DataFrame of the head-to-head winrate board, built from `self.result`
         """
 
-        df = DataFrame(standings, columns=["team", "wins", "losses", "points"])
-        df["team"] = df["team"].apply(utils.remove_emojis)
+        return DataFrame() if self.result is None else self.result.h2h_board_df
 
-        self._metadata.week = int(df.iloc[0]["wins"]) +\
-            int(df.iloc[0]["losses"]) + 1
+    @property
+    def h2h_standings_df(self) -> DataFrame:
 
-        return df
+        """
+        DataFrame of the head-to-head adjusted standings, built from
+        `self.result`
+        """
+
+        if self.result is None:
+            return DataFrame()
+
+        return self.result.h2h_standings_df
+
+    def fetch_matchups(self) -> None:
+
+        """
+        Fetches the matchups of every week before `self._metadata.week` into
+        `self._metadata.matchups`, so that network I/O can be separated from
+        the computation done by `make_h2h_standings_df()`
+        """
+
+        self._metadata.matchups.prefetch(
+            range(1, self._metadata.week),
+            self.max_workers
+        )
+
+    @classmethod
+    def from_snapshot(
+            cls,
+            snapshot: SeasonSnapshot | str,
+            mmap: bool = False
+        ) -> "Standings":
+
+        """
+        Builds a Standings object from a season snapshot without any network
+        client
+
+        PARAMETERS
+        ----------
+        snapshot : SeasonSnapshot | str
+            `SeasonSnapshot` object instance, or a path to one written by
+            `SeasonSnapshot.save()`
+
+        mmap : bool, default=False
+            memory-map the snapshot's arrays when `snapshot` is a path
+
+        RETURNS
+        -------
+        standings : Standings
+            Standings object ready for `make_h2h_standings_df()`
+        """
+
+        if not isinstance(snapshot, SeasonSnapshot):
+            snapshot = SeasonSnapshot.load(snapshot, mmap=mmap)
+
+        return cls(snapshot.league_id, Metadata.from_snapshot(snapshot))
+
+    def to_snapshot(self) -> SeasonSnapshot:
+
+        """
+        Returns a `SeasonSnapshot` of every week before the current week,
+        fetching any week which is not stored yet
+        """
+
+        self.fetch_matchups()
+
+        return SeasonSnapshot.from_metadata(self._metadata)
+
+    def __apply_weeks(self, week: int) -> None:
+
+        """
+        Applies every week before `week` which `self.board_state` has not seen
+        yet, reading matchups through `self._metadata.matchups`; a state which
+        is already past `week` is discarded and the season is replayed
+
+        Assigns attribute `self.board_state`
+        """
+
+        if self.board_state is None or self.board_state.week > week:
+            self.board_state = BoardState(self._metadata.roster_ids)
+
+        weeks = range(self.board_state.week, week)
+        self._metadata.matchups.prefetch(weeks, self.max_workers)
+
+        with telemetry.span("apply_weeks", weeks=len(weeks)):
+            for j in weeks:
+                self.board_state.apply_week(self._metadata.matchups.get(j))
 
     def _get_standings_df_exact_points(self) -> DataFrame:
 
         """
         Returns a DataFrame representation of `League.get_standings()` but
-        without any rounding for point calculations; achieved by iterating over
-        weekly matchups
+        without any rounding for point calculations; achieved by summing weekly
+        matchup scores into `self.board_state`
 
-        This is internally called by `self.make_h2h_board_df()`
+        Assigns attributes `self.board_state` and `self.result`
         """
 
-        user_id_df = DataFrame(
-            self._metadata.user_id_team_map,
-            index=["team"]
-        ).T.reset_index(names="user_id")
+        self.update_to_week(self._metadata.week)
+
+        return self.result.standings_df
 
-        standings_df = self._standings_df.copy(deep=True)\
-            .merge(user_id_df, how="left", on="team")\
-            .drop(columns="points").set_index("user_id")
+    def update_to_week(self, week: int) -> None:
 
-        tot_pts = DataFrame(index=standings_df["team"])
+        """
+        Brings the head-to-head board up to date with every matchup before
+        `week`, applying only the weeks which `self.board_state` has not seen;
+        the result is identical to rebuilding the board from week 1
 
-        for j in range(1, self._metadata.week):
-            d = {}
+        Passing the `board_state` of a previous run to a new Standings object
+        lets a weekly job apply only the newest week
 
-            for i in self._metadata.league.get_matchups(j):
-                d.update(
-                    {
-                        self._metadata.user_id_team_map[i["roster_id"]]:
-                        (i["matchup_id"], i["points"])
-                    }
-                )
+        At the current week, wins, losses and standings order are Sleeper's;
+        at an earlier week they are counted from the matchups before `week`,
+        as in `iter_weekly()`, since Sleeper only reports current standings
+
+        PARAMETERS
+        ----------
+        week : int
+            the first week which is not included, at most the current week
+            `self._metadata.week`
+
+        RAISES
+        ------
+        exception : ValueError
+            ValueError is raised when `week` is after the current week
 
-            weekly_scores_df = DataFrame(
-                [
-                    {
-                        "team": team,
-                        "matchup": matchup,
-                        f"wk_{j}_score": score
-                    }
-                    for team, (matchup, score) in d.items()
-                ]
-            ).set_index("team")
-
-            tot_pts = tot_pts.merge(
-                weekly_scores_df.drop(columns="matchup"),
-                right_index=True,
-                left_index=True
+        Assigns attributes `self.board_state` and `self.result`
+        """
+
+        if not 1 <= week <= self._metadata.week:
+            raise ValueError(
+                f"week {week} is not between 1 and the current week" +\
+                f" {self._metadata.week}"
             )
 
-        tot_pts = tot_pts.iloc[:,].sum(axis=1).reset_index(drop=False)
-        tot_pts.columns = ["team", "points"]
-        tot_pts = tot_pts.merge(
-            standings_df.reset_index(drop=True),
-            on="team"
-        )
+        self.__apply_weeks(week)
 
-        return tot_pts[["team", "wins", "losses", "points"]]
+        with telemetry.span("h2h_board") as span:
+            if week < self._metadata.week:
+                self.result = StandingsResult.from_board_state(
+                    self.board_state,
+                    self._metadata.user_id_team_map
+                )
+                self.result.order = None
+            else:
+                roster_ids = self._metadata.roster_ids
+                index = self.board_state.indices(roster_ids)
+                self.result = StandingsResult(
+                    week - 1,
+                    roster_ids,
+                    (self._metadata.user_id_team_map[i] for i in roster_ids),
+                    [int(wins) for _, wins, _, _ in self._metadata.standings],
+                    [
+                        int(losses)
+                        for _, _, losses, _ in self._metadata.standings
+                    ],
+                    self.board_state.points[index],
+                    self.board_state.win_counts[np.ix_(index, index)]
+                )
+            span.set(teams=len(self.result.teams), bytes=self.result.nbytes)
 
     def make_h2h_board_df(self) -> None:
-        # pylint: disable=E1136,E1137
-        # disable unsubscriptable and unsupported assignment pylint errors
 
         """
         Generates a DataFrame representing the head-to-head breakdown of a
@@ -240,149 +930,201 @@ class Standings:
         The rows, labeled by the index, represent a given team's head-to-head
         winrate against all other teams
 
-        Assigns attributes `self.standings_df` and `self.h2h_board_df`
+        Assigns attributes `self.board_state` and `self.result`
         """
 
-        if self.standings_df.empty:
-            self.standings_df = self._get_standings_df_exact_points()
+        self.update_to_week(self._metadata.week)
 
-        wr_df = DataFrame(columns=["winners", "losers"])
+    def make_h2h_standings_df(self) -> None:
 
-        for j in range(1, self._metadata.week):
-            d = {}
+        """
+        Generates new head-to-head adjusted standings from the existing
+        board, with an additional column noting the leaderboard deltas for
+        affected teams
 
-            for i in self._metadata.league.get_matchups(j):
-                d.update(
-                    {
-                        self._metadata.user_id_team_map[i["roster_id"]]:
-                        (i["matchup_id"], i["points"])
-                    }
-                )
+        Teams tied on wins are reordered by whether they swept each of the
+        other tied teams, taken in their current standings order; teams whose
+        sweeps are identical keep their current order
 
-            weekly_scores_df = DataFrame(
-                [
-                    {
-                        "team": team,
-                        "matchup": matchup,
-                        f"wk_{j}_score": score
-                    }
-                    for team, (matchup, score) in d.items()
-                ]
-            ).set_index("team")
-
-            is_winner = weekly_scores_df.groupby('matchup')[f"wk_{j}_score"]\
-                .transform('max') == weekly_scores_df[f"wk_{j}_score"]
-
-            weekly_scores_df['result'] = np.where(
-                is_winner.values,
-                'beat',
-                'lost'
-            )
+        Assigns attribute `self.result.order`
+        """
 
-            matchup_pairs_df = weekly_scores_df[["result", "matchup"]]\
-                .query("result == 'beat'").reset_index(drop=False)\
-                .merge(weekly_scores_df[["matchup", "result"]]\
-                .query("result == 'lost'").reset_index(drop=False)\
-                .drop(columns="result"), on="matchup")\
-                .drop(columns=["matchup", "result"])\
-                .rename(columns={"team_x": "winners", "team_y": "losers"})
+        if self.result is None:
+            self.make_h2h_board_df()
 
-            wr_df = concat(
-                [
-                    wr_df,
-                    matchup_pairs_df
-                ],
-                ignore_index=True
-            ).reset_index(drop=True)
+        with telemetry.span("h2h_standings") as span:
+            self.result.rank_h2h()
+            span.set(teams=len(self.result.teams), bytes=self.result.nbytes)
 
-        teams = self.standings_df["team"].to_list()
+    def iter_weekly(
+            self,
+            start: int = 1,
+            end: int = None
+        ) -> Iterator[StandingsResult]:
 
-        bools = wr_df.pivot(columns=['losers'], values=['winners'])\
-            .droplevel(0, axis=1).reindex(teams, axis=1).notna()
-        bools.index = bools.index.map(wr_df['winners'])
+        """
+        Yields the standings, head-to-head board and head-to-head adjusted
+        standings as of the end of each week, in one pass over the season
+
+        Every week is fetched once, concurrently when `max_workers` is set,
+        then applied to a single `BoardState` so that each week is derived
+        from the previous one; each week is a compact `StandingsResult` whose
+        DataFrames are built on request. `self.board_state` is left as is
+
+        PARAMETERS
+        ----------
+        start : int, default=1
+            first week to yield; earlier weeks are applied but not yielded
+
+        end : int, default=None
+            last week to yield; the last played week when None
+
+        RETURNS
+        -------
+        weeks : Iterator[StandingsResult]
+            one ranked `StandingsResult` object instance per week from `start`
+            to `end`
+
+        RAISES
+        ------
+        exception : ValueError
+            ValueError is raised when `end` is not between 1 and the last
+            played week, since later weeks have no scores yet
+        """
 
-        summed_on_idx = bools.groupby(bools.index).sum()
-        summed_on_idx = summed_on_idx.reindex(teams).fillna(0)
+        if end is None:
+            end = self._metadata.week - 1
+        elif not 1 <= end < self._metadata.week:
+            raise ValueError(
+                f"end {end} is not between 1 and the last played week" +\
+                f" {self._metadata.week - 1}"
+            )
 
-        matrix = summed_on_idx/summed_on_idx.add(summed_on_idx.T)
-        matrix.columns.name = None
+        # the check above runs on the call rather than on the first week
+        return self.__iter_weekly(start, end)
 
-        out = matrix.merge(
-            self.standings_df.set_index("team"),
-            left_index=True,
-            right_index=True
-        ).drop(columns=["wins", "losses"])
+    def __iter_weekly(
+            self,
+            start: int,
+            end: int
+        ) -> Iterator[StandingsResult]:
 
-        self.h2h_board_df = out
+        """
+        Yields the weeks of `iter_weekly()` once `end` has been checked
+        """
 
-    def make_h2h_standings_df(self) -> None:
+        weeks = range(1, end + 1)
+        board_state = BoardState(self._metadata.roster_ids)
 
-        """
-        Generates new head-to-head adjusted standings from existing 
-        `self.h2h_board_df` and `self.standings_df` attributes, with an
-        additional column noting the leaderboard deltas for affected teams
+        self._metadata.matchups.prefetch(weeks, self.max_workers)
 
-        Assigns attribute `self.h2h_standings_df`
+        for week in weeks:
+            board_state.apply_week(self._metadata.matchups.get(week))
+            if week >= start:
+                yield StandingsResult.from_board_state(
+                    board_state,
+                    self._metadata.user_id_team_map
+                )
+
+    def simulate_playoff_odds(
+            self,
+            n_sims: int = 10000,
+            remaining_schedule: Iterable[list[tuple]] | int = None,
+            score_model: Callable = None,
+            playoff_teams: int = None,
+            seed: int = None,
+            max_workers: int = None
+        ) -> DataFrame:
+
+        """
+        Simulates the rest of the regular season with `simulation.
+        simulate_seeds()` and ranks every simulated season with the rules of
+        `make_h2h_standings_df()`
+
+        PARAMETERS
+        ----------
+        n_sims : int, default=10000
+            number of simulated seasons
+
+        remaining_schedule : Iterable[list[tuple]] | int, default=None
+            one list of `(roster_id, matchup_id, points)` tuples per remaining
+            week, or the last week of the regular season, in which case the
+            scheduled matchups from the current week to that week are fetched;
+            the current standings are final when None
+
+        score_model : Callable, default=None
+            callable taking a `np.random.Generator` and a
+            `sims`x`weeks`x`teams` shape, with teams in the order of
+            `self.result.roster_ids`, which is `Metadata.roster_ids` at the
+            current week, and returning simulated scores; a
+            `simulation.NormalScoreModel` fitted to the weeks before the
+            result is used when None
+
+        playoff_teams : int, default=None
+            number of seeds which make the playoffs; adds a "playoffs" column
+            when supplied
+
+        seed : int, default=None
+            seed of the simulation
+
+        max_workers : int, default=None
+            maximum number of processes simulating chunks of seasons; seasons
+            are simulated serially when None
+
+        RETURNS
+        -------
+        odds : DataFrame
+            DataFrame indexed by team in current standings order, where
+            column `k` is the probability of finishing as seed `k`
         """
 
-        if self.h2h_board_df.empty:
+        if self.result is None:
             self.make_h2h_board_df()
 
-        h2h_board_df = self.h2h_board_df.copy(deep=True)
-        standings_df = self.standings_df.copy(deep=True)
+        # teams are simulated in the order of the result, which differs from
+        # `Metadata.roster_ids` after `update_to_week()` to an earlier week
+        roster_ids = self.result.roster_ids.tolist()
+
+        if isinstance(remaining_schedule, int):
+            weeks = range(self.result.week + 1, remaining_schedule + 1)
+            self._metadata.matchups.prefetch(weeks, self.max_workers)
+            remaining_schedule = [self._metadata.matchups.get(j) for j in weeks]
+            # unplayed weeks must be fetched again once they are scored
+            for j in weeks:
+                if j >= self._metadata.week:
+                    self._metadata.matchups.invalidate(j)
+
+        if score_model is None:
+            # snapshot columns follow `Metadata.roster_ids`, as the board does
+            columns = self.board_state.indices(roster_ids)
+            score_model = simulation.NormalScoreModel.from_scores(
+                self.to_snapshot().scores[:self.result.week, columns]
+            )
 
-        h2h_board_df = h2h_board_df.T.iloc[:-1]
-        tiebreaks = []
+        opponents = simulation.schedule_opponents(
+            remaining_schedule or [],
+            roster_ids
+        )
 
-        for team in h2h_board_df:
-            tiebreaks.append(
-                [
-                    ind for ind, row in h2h_board_df[[team]].iterrows() if
-                    row[team] == 1
-                ]
+        with telemetry.span("simulate_playoff_odds", sims=n_sims):
+            probabilities = simulation.simulate_seeds(
+                self.result.wins,
+                self.result.losses,
+                self.result.points,
+                self.result.win_counts,
+                opponents,
+                score_model,
+                n_sims,
+                seed,
+                max_workers
             )
 
-        standings_df["tiebreaks"] = tiebreaks
-        out = []
-
-        for _, row in standings_df.iterrows():
-            team = row["team"]
-            if team not in out:
-                wins = row["wins"]
-                ties = standings_df.query(f"wins == '{wins}'").copy(deep=True)
-
-                if len(ties) > 1:
-                    dummies = get_dummies(ties["tiebreaks"].explode()).\
-                        groupby(level=0).sum()
-                    tie_dummies = ties.merge(
-                        dummies,
-                        left_index=True,
-                        right_index=True
-                    )
-
-                    for team in tie_dummies["team"]:
-                        if team not in tie_dummies.columns:
-                            tie_dummies[team] = [0] * len(tie_dummies)
-
-                    sorted_ties = tie_dummies.sort_values(
-                        by=tie_dummies["team"].to_list(),
-                        ascending=[False]*len(tie_dummies)
-                    )["team"].to_list()
-                    out += sorted_ties
-
-                else:
-                    out.append(team)
-
-        out_df = DataFrame(out, columns=["team"])
-        out_df["h2h_delta"] = [
-            standings_df[standings_df["team"] == team].\
-                index.values.astype(int)[0] -\
-            out_df[out_df["team"] == team].\
-                index.values.astype(int)[0]
-            for team in out_df["team"]
-        ]
-
-        self.h2h_standings_df = out_df.merge(
-            standings_df[["team", "wins", "losses", "points"]],
-            on="team"
+        odds = DataFrame(
+            probabilities,
+            index=list(self.result.teams),
+            columns=range(1, len(roster_ids) + 1)
         )
+        if playoff_teams is not None:
+            odds["playoffs"] = odds.iloc[:, :playoff_teams].sum(axis=1)
+
+        return odds
@@ -0,0 +1,173 @@
+"""
+Synthetic Sleeper Fantasy Football seasons for testing and benchmarking
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from .snapshot import SeasonSnapshot
+
+
+def round_robin(n_teams: int, n_weeks: int) -> np.ndarray:
+
+    """
+    Schedules a league with the circle method, so every team plays once per
+    week and opponents repeat only after every other team has been played
+
+    PARAMETERS
+    ----------
+    n_teams : int
+        even number of teams in the league
+
+    n_weeks : int
+        number of weeks to schedule
+
+    RETURNS
+    -------
+    opponents : np.ndarray
+        `weeks`x`teams` integer array of each team's opponent index
+    """
+
+    opponents = np.empty((n_weeks, n_teams), dtype=int)
+    circle = list(range(1, n_teams))
+
+    for week in range(n_weeks):
+        teams = [0] + circle
+        for i in range(n_teams // 2):
+            home, away = teams[i], teams[n_teams - 1 - i]
+            opponents[week, home] = away
+            opponents[week, away] = home
+        circle = circle[-1:] + circle[:-1]
+
+    return opponents
+
+
+def make_snapshot(
+        n_teams: int = 10,
+        n_weeks: int = 14,
+        tie_sizes: Iterable[int] = (3,),
+        seed: int = None,
+        league_id: str = "0"
+    ) -> SeasonSnapshot:
+
+    """
+    Generates a season with random scores in the format read by
+    `Metadata.from_snapshot()`, where each group in `tie_sizes` is made up of
+    teams which finish with the same number of wins
+
+    Ties are engineered by swapping the scores of matchups involving a tied
+    team until each group reaches the group's median wins; a group may fall
+    short of an exact tie only when it has too few games to swap, such as in
+    the first week or two of a season
+
+    PARAMETERS
+    ----------
+    n_teams : int, default=10
+        even number of teams in the league
+
+    n_weeks : int, default=14
+        number of weeks played; the snapshot's current week is `n_weeks + 1`
+
+    tie_sizes : Iterable[int], default=(3,)
+        size of each group of teams tied on wins; groups do not overlap
+
+    seed : int, default=None
+        seed for `np.random.default_rng()`
+
+    league_id : str, default="0"
+        ID given to the league
+
+    RETURNS
+    -------
+    snapshot : SeasonSnapshot
+        the generated season, with teams in standings order
+
+    RAISES
+    ------
+    exception : ValueError
+        ValueError is raised when `n_teams` is odd, `n_weeks` is less than 1,
+        or the groups in `tie_sizes` need more teams than the league has
+    """
+
+    tie_sizes = list(tie_sizes)
+
+    if n_teams < 2 or n_teams % 2:
+        raise ValueError(f"n_teams must be even, got {n_teams}")
+    if n_weeks < 1:
+        raise ValueError(f"n_weeks must be at least 1, got {n_weeks}")
+    if sum(tie_sizes) > n_teams:
+        raise ValueError(
+            f"tie_sizes {tie_sizes} need more than {n_teams} teams"
+        )
+
+    rng = np.random.default_rng(seed)
+    opponents = round_robin(n_teams, n_weeks)
+    scores = np.round(rng.normal(110, 25, (n_weeks, n_teams)).clip(30), 2)
+
+    groups = np.split(rng.permutation(n_teams), np.cumsum(tie_sizes))[:-1]
+    for group in groups:
+        _tie_group(scores, opponents, group)
+
+    won = scores > np.take_along_axis(scores, opponents, axis=1)
+    wins = won.sum(axis=0)
+    losses = (scores < np.take_along_axis(scores, opponents, axis=1))\
+        .sum(axis=0)
+    points = scores.sum(axis=0)
+
+    # Sleeper orders standings by wins, then losses, then points, as in
+    # `Metadata`
+    order = np.lexsort((-points, -losses, -wins))
+    matchup_ids = np.minimum(opponents, np.arange(n_teams)) + 1
+
+    return SeasonSnapshot(
+        league_id=league_id,
+        week=n_weeks + 1,
+        roster_ids=order + 1,
+        teams=np.array([f"Team {i + 1}" for i in order]),
+        wins=wins[order],
+        losses=losses[order],
+        fpts=np.floor(points[order]).astype(int),
+        scores=scores[:, order],
+        matchup_ids=matchup_ids[:, order]
+    )
+
+
+def _tie_group(
+        scores: np.ndarray,
+        opponents: np.ndarray,
+        group: np.ndarray
+    ) -> None:
+
+    """
+    Swaps the scores of matchups, in place, until every team in `group` has
+    the group's median number of wins, where possible
+    """
+
+    members = set(group.tolist())
+    weeks = np.arange(len(scores))
+
+    def wins(team: int) -> int:
+        return int(
+            (scores[:, team] > scores[weeks, opponents[:, team]]).sum()
+        )
+
+    target = int(np.median([wins(team) for team in group]))
+
+    for team in group:
+        for week in range(len(scores)):
+            surplus = wins(team) - target
+            if surplus == 0:
+                break
+
+            opponent = opponents[week, team]
+            ours, theirs = scores[week, team], scores[week, opponent]
+            if (ours > theirs) != (surplus > 0) or ours == theirs:
+                continue
+
+            # only trade with a tied team which needs the opposite swap
+            if opponent in members and \
+                    (wins(opponent) - target) * surplus >= 0:
+                continue
+
+            scores[week, team], scores[week, opponent] = theirs, ours
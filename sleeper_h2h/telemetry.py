@@ -0,0 +1,382 @@
+"""
+Opt-in instrumentation of where a run spends its time: spans with wall and
+CPU time for each stage, counters such as API calls and bytes, and the team
+counts and bytes of computed results
+
+Instrumentation is off until `enable()` is called; while off, `span()` and
+`count()` return immediately without recording anything
+
+Example:
+    with telemetry.collect() as report:
+        Standings(league_id).make_h2h_standings_df()
+    report.save("run.json")
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+PROMETHEUS_PREFIX = "sleeper_h2h"
+
+# spans kept for reports; older spans are dropped, while per-stage totals
+# cover every span, so long-running processes use bounded memory
+MAX_SPANS = 10000
+
+
+@dataclass
+class Span:
+
+    """
+    A single timed stage of a run
+
+    ATTRIBUTES
+    ----------
+    name : str
+        name of the stage, such as "metadata" or "draw_h2h_plot"
+
+    start : float
+        Unix time at which the stage started
+
+    wall : float, default=0
+        seconds of wall time spent in the stage
+
+    cpu : float, default=0
+        seconds of CPU time spent in the stage by its thread
+
+    attributes : dict, default={}
+        details of the stage, such as a league ID, or the team count and
+        bytes of a `StandingsResult`
+
+    METHODS
+    -------
+    set(**attributes)
+        adds attributes to the span
+    """
+
+    name: str
+    start: float
+    wall: float = field(default=0)
+    cpu: float = field(default=0)
+    attributes: dict = field(default_factory=dict)
+
+    def set(self, **attributes) -> None:
+
+        """
+        Adds attributes to the span
+        """
+
+        self.attributes.update(attributes)
+
+
+class _NullSpan:
+
+    """
+    Stand-in returned by `span()` while instrumentation is off; every method
+    does nothing
+    """
+
+    def __enter__(self) -> "_NullSpan":
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+
+        pass
+
+    def set(self, **attributes) -> None:
+
+        pass
+
+
+@dataclass
+class Telemetry:
+
+    """
+    Collects the spans and counters recorded while instrumentation is enabled;
+    safe to share between threads
+
+    ATTRIBUTES
+    ----------
+    hook : Callable[[Span], None], default=None
+        function called with every span as soon as it ends, such as one
+        forwarding spans to a tracing backend
+
+    max_spans : int, default=MAX_SPANS
+        number of most recent spans kept in `spans`
+
+    spans : deque[Span]
+        the last `max_spans` ended spans, in the order they ended
+
+    counters : dict, default={}
+        dictionary mapping counter name to its total
+
+    METHODS
+    -------
+    stages()
+        returns the calls, total and maximum time of each stage
+
+    report()
+        returns the spans, counters and per-stage totals as a dictionary
+
+    save(path)
+        writes `report()` as JSON
+
+    to_prometheus()
+        returns per-stage totals and counters in Prometheus text format
+    """
+
+    hook: Callable[[Span], None] = field(default=None)
+    max_spans: int = field(default=MAX_SPANS)
+    spans: deque = field(init=False, default=None)
+    counters: dict = field(init=False, default_factory=dict)
+    __stages: dict = field(init=False, default_factory=dict, repr=False)
+    __lock: threading.Lock = field(
+        init=False,
+        default_factory=threading.Lock,
+        repr=False
+    )
+
+    def __post_init__(self) -> None:
+
+        """
+        Create the bounded span buffer
+        """
+
+        self.spans = deque(maxlen=self.max_spans)
+
+    def _end(self, span: Span) -> None:
+
+        """
+        Records an ended span, adds it to its stage's totals and passes it to
+        `self.hook`
+        """
+
+        with self.__lock:
+            self.spans.append(span)
+            stage = self.__stages.setdefault(
+                span.name,
+                {"calls": 0, "wall": 0.0, "cpu": 0.0, "max_wall": 0.0}
+            )
+            stage["calls"] += 1
+            stage["wall"] += span.wall
+            stage["cpu"] += span.cpu
+            stage["max_wall"] = max(stage["max_wall"], span.wall)
+
+        if self.hook is not None:
+            self.hook(span)
+
+    def _count(self, name: str, value: float) -> None:
+
+        """
+        Adds `value` to a counter
+        """
+
+        with self.__lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def stages(self) -> dict:
+
+        """
+        Returns the number of spans, total wall and CPU time and longest wall
+        time of each stage, over every span including those no longer kept
+        """
+
+        with self.__lock:
+            return {name: dict(stage) for name, stage in self.__stages.items()}
+
+    def report(self) -> dict:
+
+        """
+        Returns the kept spans, every counter and the totals of each stage as
+        a JSON-serializable dictionary
+        """
+
+        stages = self.stages()
+
+        with self.__lock:
+            return {
+                "stages": stages,
+                "counters": dict(self.counters),
+                "spans": [asdict(span) for span in self.spans]
+            }
+
+    def save(self, path: str | Path) -> None:
+
+        """
+        Writes `report()` as JSON, or `to_prometheus()` when `path` ends with
+        ".prom"
+        """
+
+        path = Path(path).expanduser()
+
+        if path.suffix == ".prom":
+            path.write_text(self.to_prometheus())
+        else:
+            path.write_text(json.dumps(self.report(), indent=2, default=str))
+
+    def to_prometheus(self) -> str:
+
+        """
+        Returns the totals of each stage and every counter in the Prometheus
+        text exposition format, such as for a node exporter's textfile
+        collector
+        """
+
+        stages = self.stages()
+        with self.__lock:
+            counters = dict(self.counters)
+
+        lines = []
+        for metric, key, kind, help_text in (
+                ("stage_calls_total", "calls", "counter",
+                 "Number of runs of each stage"),
+                ("stage_wall_seconds", "wall", "counter",
+                 "Wall time spent in each stage"),
+                ("stage_cpu_seconds", "cpu", "counter",
+                 "CPU time spent in each stage"),
+                ("stage_wall_seconds_max", "max_wall", "gauge",
+                 "Longest wall time of a single run of each stage")
+            ):
+            name = f"{PROMETHEUS_PREFIX}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(
+                f'{name}{{stage="{stage}"}} {totals[key]}'
+                for stage, totals in stages.items()
+            )
+
+        for counter, value in counters.items():
+            name = f"{PROMETHEUS_PREFIX}_{counter}_total"
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+_NULL_SPAN = _NullSpan()
+_active: Telemetry | None = None
+
+
+def enable(
+        hook: Callable[[Span], None] = None,
+        max_spans: int = MAX_SPANS
+    ) -> Telemetry:
+
+    """
+    Turns instrumentation on for every thread of this process, replacing any
+    active `Telemetry`
+
+    PARAMETERS
+    ----------
+    hook : Callable[[Span], None], default=None
+        function called with every span as soon as it ends
+
+    max_spans : int, default=MAX_SPANS
+        number of most recent spans kept for reports
+
+    RETURNS
+    -------
+    telemetry : Telemetry
+        `Telemetry` object instance collecting from now on
+    """
+
+    global _active # pylint: disable=W0603
+    _active = Telemetry(hook, max_spans)
+
+    return _active
+
+
+def disable() -> Telemetry | None:
+
+    """
+    Turns instrumentation off and returns what was collected, if anything
+    """
+
+    global _active # pylint: disable=W0603
+    telemetry, _active = _active, None
+
+    return telemetry
+
+
+@contextmanager
+def collect(
+        hook: Callable[[Span], None] = None,
+        max_spans: int = MAX_SPANS
+    ) -> Iterator[Telemetry]:
+
+    """
+    Enables instrumentation for the duration of a `with` block, yielding the
+    `Telemetry` which collects it
+    """
+
+    telemetry = enable(hook, max_spans)
+    try:
+        yield telemetry
+    finally:
+        if _active is telemetry:
+            disable()
+
+
+@contextmanager
+def _timed(telemetry: Telemetry, name: str, attributes: dict) -> Iterator[Span]:
+
+    """
+    Times the body of a `with` block as a span of `telemetry`
+    """
+
+    span = Span(name, time.time(), attributes=attributes)
+    wall, cpu = time.perf_counter(), time.thread_time()
+
+    try:
+        yield span
+    finally:
+        span.wall = time.perf_counter() - wall
+        span.cpu = time.thread_time() - cpu
+        telemetry._end(span) # pylint: disable=W0212
+
+
+def span(name: str, **attributes):
+
+    """
+    Returns a context manager timing a stage while instrumentation is
+    enabled; it yields the `Span`, or an object whose methods do nothing
+    while instrumentation is off
+
+    PARAMETERS
+    ----------
+    name : str
+        name of the stage
+
+    **attributes
+        details of the stage, such as a league ID
+    """
+
+    telemetry = _active
+    if telemetry is None:
+        return _NULL_SPAN
+
+    return _timed(telemetry, name, attributes)
+
+
+def count(name: str, value: float = 1) -> None:
+
+    """
+    Adds `value` to a counter while instrumentation is enabled
+
+    PARAMETERS
+    ----------
+    name : str
+        name of the counter, such as "api_requests"
+
+    value : float, default=1
+        amount to add
+    """
+
+    telemetry = _active
+    if telemetry is not None:
+        telemetry._count(name, value) # pylint: disable=W0212
@@ -0,0 +1,179 @@
+"""
+Pluggable transports for `SleeperLeague`, which record Sleeper API responses
+to a JSON file and replay them without a network connection
+"""
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from . import telemetry
+
+if TYPE_CHECKING:
+    from requests import HTTPError
+
+
+def http_get(url: str) -> list | dict | Exception:
+
+    """
+    Requests `url` with `requests`, returning the error of an unsuccessful
+    request rather than raising it, as `sleeper_wrapper` does; the size of
+    every response body is counted as "api_bytes"
+    """
+
+    import requests # pylint: disable=C0415
+
+    response = requests.get(url)
+    telemetry.count("api_bytes", len(response.content))
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        return e
+
+    return response.json()
+
+
+def route(url: str) -> str:
+
+    """
+    Returns the part of a Sleeper API URL after the API root, such as
+    `league/1234/matchups/1`, so that responses recorded from one server can
+    be served by another
+
+    RAISES
+    ------
+    exception : ValueError
+        ValueError is raised when `url` does not request a league endpoint
+    """
+
+    path = url.split("?", 1)[0]
+    start = path.find("/league/")
+
+    if start == -1:
+        raise ValueError(f"{url} does not request a Sleeper league endpoint")
+
+    return path[start + 1:].rstrip("/")
+
+
+def not_found(url: str) -> "HTTPError":
+
+    """
+    Returns the HTTPError `sleeper_wrapper` would return for a 404 response
+    """
+
+    from requests import HTTPError, Response # pylint: disable=C0415
+
+    response = Response()
+    response.status_code = 404
+    response.url = url
+
+    return HTTPError(
+        f"404 Client Error: Not Found for url: {url}",
+        response=response
+    )
+
+
+@dataclass
+class Recorder:
+
+    """
+    A transport which requests every URL through another transport and keeps
+    each successful response, keyed by `route()`, for `save()` to write as
+    JSON; safe to share between threads
+
+    ATTRIBUTES
+    ----------
+    path : str | Path
+        path of the JSON file written by `save()`
+
+    transport : Callable[[str], list | dict | Exception], default=http_get
+        transport which makes the actual requests
+
+    responses : dict, default={}
+        recorded responses keyed by `route()`
+
+    METHODS
+    -------
+    save()
+        writes `responses` to `path`
+    """
+
+    path: str | Path
+    transport: Callable[[str], list | dict | Exception] = field(
+        default=http_get
+    )
+    responses: dict = field(init=False, default_factory=dict)
+    __lock: threading.Lock = field(
+        init=False,
+        default_factory=threading.Lock,
+        repr=False
+    )
+
+    def __call__(self, url: str) -> list | dict | Exception:
+
+        """
+        Requests `url` and records the response if it was successful
+        """
+
+        payload = self.transport(url)
+
+        if not isinstance(payload, Exception):
+            with self.__lock:
+                self.responses[route(url)] = payload
+
+        return payload
+
+    def save(self) -> None:
+
+        """
+        Writes every recorded response to `self.path`
+        """
+
+        with self.__lock:
+            text = json.dumps(self.responses, indent=1, sort_keys=True)
+
+        path = Path(self.path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+@dataclass
+class Replayer:
+
+    """
+    A transport which serves responses written by `Recorder.save()` without
+    any network request; URLs which were not recorded return a 404 HTTPError
+
+    ATTRIBUTES
+    ----------
+    path : str | Path
+        path of a JSON file written by `Recorder.save()`
+
+    responses : dict, default={}
+        recorded responses keyed by `route()`, read from `path`
+    """
+
+    path: str | Path
+    responses: dict = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+
+        """
+        Read the recorded responses
+        """
+
+        self.responses = json.loads(Path(self.path).expanduser().read_text())
+
+    def __call__(self, url: str) -> list | dict | Exception:
+
+        """
+        Returns the recorded response for `url`
+        """
+
+        try:
+            return self.responses[route(url)]
+        except (KeyError, ValueError):
+            return not_found(url)
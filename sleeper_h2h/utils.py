@@ -3,8 +3,35 @@ Utility functions that support sleeper-h2h-tools
 """
 
 import re
-
-from pandas import DataFrame
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+EMOJIS = re.compile(
+    "["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    u"\U00002500-\U00002BEF"  # chinese char
+    u"\U00002702-\U000027B0"
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    u"\U0001f926-\U0001f937"
+    u"\U00010000-\U0010ffff"
+    u"\u2640-\u2642" 
+    u"\u2600-\u2B55"
+    u"\u200d"
+    u"\u23cf"
+    u"\u23e9"
+    u"\u231a"
+    u"\ufe0f"  # dingbats
+    u"\u3030"
+    "]+",
+    re.UNICODE)
 
 def remove_emojis(data: str) -> str:
 
@@ -22,44 +49,23 @@ def remove_emojis(data: str) -> str:
         input string stripped of emojis then of whitespace
     """
 
-    emojis = re.compile(
-        "["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        u"\U00002500-\U00002BEF"  # chinese char
-        u"\U00002702-\U000027B0"
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        u"\U0001f926-\U0001f937"
-        u"\U00010000-\U0010ffff"
-        u"\u2640-\u2642" 
-        u"\u2600-\u2B55"
-        u"\u200d"
-        u"\u23cf"
-        u"\u23e9"
-        u"\u231a"
-        u"\ufe0f"  # dingbats
-        u"\u3030"
-        "]+",
-        re.UNICODE)
-    return re.sub(emojis, '', data).strip()
+    return EMOJIS.sub('', data).strip()
 
 def merge_users_and_teams(dict_1: dict, dict_2: dict) -> dict:
 
     """
-    Left joins 2 dictionaries where the values of the first and the keys of the
-    second are the attribute to merge on; uses DataFrames to accomplish this
+    Inner joins 2 dictionaries where the values of the first and the keys of
+    the second are the attribute to merge on, stripping emojis from the joined
+    values
 
     PARAMETERS
     ----------
     dict_1 : dict
-        dictionary to reference in left join; the keys will be preserved in the
+        dictionary to reference in the join; the keys will be preserved in the
         output
 
     dict_2 : dict
-        dictionary to merge with in left join; the values will be preserved in
+        dictionary to merge with in the join; the values will be preserved in
         the output
 
     RETURNS
@@ -69,13 +75,87 @@ def merge_users_and_teams(dict_1: dict, dict_2: dict) -> dict:
         `dict_2` respectively; the merged column is not preserved
     """
 
-    df_1 = DataFrame(dict_1.items(), columns=["keys", "merge"])
-    df_2 = DataFrame(dict_2.items(), columns=["merge", "values"])
+    return {
+        key: remove_emojis(dict_2[merge])
+        for key, merge in dict_1.items()
+        if merge in dict_2
+    }
+
+def team_labels(names: dict) -> dict:
+
+    """
+    Normalizes the team names of a league into display labels, once per team;
+    labels are stripped of emojis and made unique, so that two teams whose
+    names only differ by emojis are never shown as the same team
+
+    PARAMETERS
+    ----------
+    names : dict
+        dictionary mapping roster ID to team name; a name may be None for a
+        roster without an owner
+
+    RETURNS
+    -------
+    labels : dict
+        dictionary mapping roster ID to display label; a roster with an empty
+        label is shown as "Team <roster ID>", and the roster ID is appended
+        to any label shared by more than one team
+    """
+
+    labels = {
+        roster_id: remove_emojis(name or "") or f"Team {roster_id}"
+        for roster_id, name in names.items()
+    }
+    counts = Counter(labels.values())
+
+    return {
+        roster_id: label if counts[label] == 1 else f"{label} ({roster_id})"
+        for roster_id, label in labels.items()
+    }
+
+def map_threaded(
+        func: Callable,
+        items: Iterable,
+        max_workers: int = None
+    ) -> list:
+
+    """
+    Calls `func` on every item, using a bounded thread pool when `max_workers`
+    is supplied; intended for I/O bound calls such as Sleeper API requests
+
+    PARAMETERS
+    ----------
+    func : Callable
+        callable taking a single item as its only argument
+
+    items : Iterable
+        items to call `func` on
+
+    max_workers : int, default=None
+        maximum number of threads; items are processed serially in the calling
+        thread when None or 1
+
+    RETURNS
+    -------
+    results : list
+        return values of `func`, in the same order as `items`
+
+    RAISES
+    ------
+    exception : Exception
+        the first exception raised by `func`, in the order of `items`, is
+        re-raised in the calling thread
+    """
+
+    items = list(items)
+
+    if not max_workers or max_workers == 1 or len(items) < 2:
+        return [func(item) for item in items]
 
-    return df_1.merge(df_2, on="merge").set_index("keys")["values"]\
-        .apply(remove_emojis).to_dict()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(func, items))
 
-def stringify_h2h_standings_df(df: DataFrame) -> str:
+def stringify_h2h_standings_df(df: "DataFrame") -> str:
 
     """
     Parses an h2h DataFrame from a Standings object into a pretty string
@@ -0,0 +1,72 @@
+"""
+Unit tests for the `batch` module
+"""
+
+import unittest
+
+from sleeper_h2h import batch, synthetic
+from sleeper_h2h.standin import StandIn
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestBatch(unittest.TestCase):
+
+    """
+    TestCase for the `batch` module
+    """
+
+    def test_failures_reported_per_league(self) -> None:
+
+        """
+        Test if leagues which cannot be fetched are yielded as failed results
+        rather than stopping the batch
+        """
+
+        results = list(
+            batch.compute_many(["not-a-league", "also-not-a-league"], workers=1)
+        )
+
+        self.assertEqual(
+            sorted(result.league_id for result in results),
+            ["also-not-a-league", "not-a-league"]
+        )
+        for result in results:
+            with self.subTest():
+                self.assertIsNone(result.standings)
+                self.assertIsInstance(result.error, Exception)
+
+    def test_results_match_standings(self) -> None:
+
+        """
+        Test if every league computed in a worker process matches a Standings
+        object computed in this process
+        """
+
+        snapshots = [
+            synthetic.make_snapshot(8, 6, seed=i, league_id=str(i))
+            for i in range(3)
+        ]
+
+        with StandIn.from_snapshots(snapshots) as standin:
+            results = list(
+                batch.compute_many(["0", "1", "2"], 2, base_url=standin.url)
+            )
+
+        self.assertEqual(
+            sorted(result.league_id for result in results),
+            ["0", "1", "2"]
+        )
+        for result in results:
+            with self.subTest(league_id=result.league_id):
+                self.assertIsNone(result.error)
+                expected = Standings.from_snapshot(
+                    snapshots[int(result.league_id)]
+                )
+                expected.make_h2h_standings_df()
+                self.assertTrue(result.standings.h2h_standings_df.equals(
+                    expected.h2h_standings_df
+                ))
+                self.assertTrue(result.standings.h2h_board_df.equals(
+                    expected.h2h_board_df
+                ))
+                self.assertEqual(result.standings.board_state.week, 7)
@@ -0,0 +1,160 @@
+"""
+Unit tests for the `cache` module
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.cache import RenderCache, ResponseCache
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestRenderCache(unittest.TestCase):
+
+    """
+    TestCase for the `RenderCache` class of the `cache` module
+    """
+
+    def setUp(self) -> None:
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+        standings = Standings.from_snapshot(synthetic.make_snapshot(6, 4))
+        standings.make_h2h_board_df()
+        self.board = standings.h2h_board_df
+
+    def tearDown(self) -> None:
+
+        self.tmp_dir.cleanup()
+
+    def test_render_once_per_board(self) -> None:
+
+        """
+        Test if an unchanged board is served from disk, and if a changed board
+        or different options draw a new image
+        """
+
+        renders = RenderCache(self.path / "renders")
+        first = renders.render(self.board, backend="svg")
+        dest = renders.render(self.board, self.path / "board.svg", "svg")
+
+        self.assertEqual((renders.hits, renders.misses), (1, 1))
+        self.assertEqual(dest.read_bytes(), first.read_bytes())
+        self.assertEqual(
+            RenderCache.key(self.board.copy(), backend="svg"),
+            RenderCache.key(self.board, backend="svg")
+        )
+
+        changed = self.board.copy()
+        changed.iloc[0, -1] += 0.01
+        self.assertNotEqual(renders.render(changed, backend="svg"), first)
+        renders.render(self.board, backend="raster")
+        self.assertEqual(renders.misses, 3)
+
+    def test_evicts_least_recently_used(self) -> None:
+
+        """
+        Test if the oldest images are deleted once the directory is full,
+        keeping the newest
+        """
+
+        renders = RenderCache(self.path / "renders", max_bytes=1)
+        boards = []
+        for i in range(3):
+            board = self.board.copy()
+            board.iloc[0, -1] += i
+            boards.append(renders.render(board, backend="svg"))
+
+        self.assertEqual(list(renders.path.iterdir()), [boards[-1]])
+
+    def test_skips_files_being_drawn(self) -> None:
+
+        """
+        Test if eviction and `clear()` leave alone temporary files which
+        another writer is still drawing, and any directory
+        """
+
+        renders = RenderCache(self.path / "renders", max_bytes=1)
+        drawing = renders.path / "tmpk3j_x9a1.svg"
+        drawing.write_text("<svg")
+        (renders.path / "nested").mkdir()
+
+        stored = renders.render(self.board, backend="svg")
+        changed = self.board.copy()
+        changed.iloc[0, -1] += 1
+        renders.render(changed, backend="svg")
+
+        self.assertFalse(stored.exists())
+        self.assertTrue(drawing.exists())
+
+        renders.clear()
+        self.assertEqual(
+            sorted(p.name for p in renders.path.iterdir()),
+            ["nested", "tmpk3j_x9a1.svg"]
+        )
+
+
+class SleeperH2HTestResponseCache(unittest.TestCase):
+
+    """
+    TestCase for the `cache` module
+    """
+
+    def setUp(self) -> None:
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "responses.sqlite3"
+
+    def tearDown(self) -> None:
+
+        self.tmp_dir.cleanup()
+
+    def test_fetch_persists_between_instances(self) -> None:
+
+        """
+        Test if a response stored by one ResponseCache is served by another
+        instance reading the same file, without calling the request function
+        """
+
+        ResponseCache(self.path).fetch("url", lambda: [{"week": 1}])
+        cache = ResponseCache(self.path)
+
+        self.assertEqual(
+            cache.fetch("url", lambda: self.fail("request was made")),
+            [{"week": 1}]
+        )
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_ttl_and_permanent_entries(self) -> None:
+
+        """
+        Test if expired entries are requested again while permanent entries
+        are not, until cleared by URL prefix
+        """
+
+        cache = ResponseCache(self.path, ttl=-1)
+        cache.fetch("rosters", lambda: ["old"])
+        cache.fetch("matchups/1", lambda: ["final"], permanent=True)
+
+        self.assertEqual(cache.fetch("rosters", lambda: ["new"]), ["new"])
+        self.assertEqual(cache.get("matchups/1"), ["final"])
+
+        cache.set("matchups%/1", ["literal"], permanent=True)
+        cache.clear("matchups/")
+        self.assertIsNone(cache.get("matchups/1"))
+        self.assertEqual(cache.get("matchups%/1"), ["literal"])
+
+    def test_errors_not_stored(self) -> None:
+
+        """
+        Test if an error returned by the request function is passed through
+        without being stored
+        """
+
+        cache = ResponseCache(self.path)
+        error = ValueError("404")
+
+        self.assertIs(cache.fetch("url", lambda: error), error)
+        self.assertIsNone(cache.get("url"))
@@ -0,0 +1,142 @@
+"""
+Unit tests for the `cli` module
+"""
+
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from sleeper_h2h import cli, synthetic
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestCLI(unittest.TestCase):
+
+    """
+    TestCase for the `cli` module
+    """
+
+    def setUp(self) -> None:
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "season.npz"
+        synthetic.make_snapshot(8, 6, seed=3).save(self.path)
+
+    def tearDown(self) -> None:
+
+        self.tmp_dir.cleanup()
+
+    def run_cli(self, *argv: str) -> str:
+
+        """
+        Runs the CLI in this process and returns what it printed
+        """
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(cli.main(list(argv)), 0)
+
+        return out.getvalue()
+
+    def test_text_paths_skip_plotly(self) -> None:
+
+        """
+        Test if the standings subcommand runs without importing Plotly,
+        Kaleido or the HTTP stack
+        """
+
+        code = (
+            "import sys\n"
+            "from sleeper_h2h import cli\n"
+            f"cli.main(['standings', '--snapshot', r'{self.path}'])\n"
+            "heavy = {'plotly', 'kaleido', 'requests', 'sleeper_wrapper'}\n"
+            "print(sorted(heavy & set(sys.modules)), file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        self.assertEqual(result.stderr.strip(), "[]")
+        self.assertIn("Team", result.stdout)
+
+    def test_subcommands(self) -> None:
+
+        """
+        Test if the standings, board and render subcommands agree with the
+        Standings object read from the same snapshot
+        """
+
+        standings = Standings.from_snapshot(self.path)
+        standings.make_h2h_standings_df()
+
+        records = json.loads(
+            self.run_cli("standings", "--snapshot", str(self.path),
+                         "--format", "json")
+        )
+        self.assertEqual(
+            [record["h2h_delta"] for record in records],
+            standings.h2h_standings_df["h2h_delta"].tolist()
+        )
+
+        board = self.run_cli("board", "--snapshot", str(self.path),
+                             "--format", "csv")
+        self.assertEqual(len(board.splitlines()), 9)
+
+        output = Path(self.tmp_dir.name) / "board.svg"
+        self.run_cli("render", "--snapshot", str(self.path), str(output),
+                     "--backend", "svg")
+        self.assertTrue(output.read_text().startswith("<svg"))
+
+    def test_post_render_cleans_up(self) -> None:
+
+        """
+        Test if the image rendered for `post --render` is attached to the
+        message and removed once it has been sent
+        """
+
+        bodies = []
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_POST(self) -> None: # pylint: disable=C0103
+
+                length = int(self.headers["Content-Length"])
+                bodies.append(self.rfile.read(length))
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args) -> None:
+
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        webhook = f"http://127.0.0.1:{server.server_address[1]}/hook"
+
+        tmp_root = Path(self.tmp_dir.name) / "tmp"
+        tmp_root.mkdir()
+
+        try:
+            with mock.patch.object(tempfile, "tempdir", str(tmp_root)):
+                self.run_cli("post", "--snapshot", str(self.path), webhook,
+                             "--render", "svg")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(len(bodies), 1)
+        self.assertIn(b'filename="h2h_board.svg"', bodies[0])
+        self.assertEqual(list(tmp_root.iterdir()), [])
@@ -4,11 +4,62 @@ Unit tests which depend on instantiating a Standings object
 
 import unittest
 
-from sleeper_h2h import graphics, utils
+import numpy as np
+from pandas import DataFrame, get_dummies
+
+from sleeper_h2h import graphics, synthetic, utils
+from sleeper_h2h.result import StandingsResult
 from sleeper_h2h.standings import Standings
 from .utils import read_metadata_from_signed_pickle
 
 
+def sort_ties_by_dummies(
+        standings_df: DataFrame,
+        h2h_board_df: DataFrame
+    ) -> DataFrame:
+
+    """
+    Reference implementation of the head-to-head tiebreak which sorts the
+    one-hot encoded sweeps of every tie group with `sort_values()`
+    """
+
+    swept = h2h_board_df.T.iloc[:-1]
+    standings_df = standings_df.copy()
+    standings_df["tiebreaks"] = [
+        [ind for ind, won in swept[team].items() if won == 1]
+        for team in swept
+    ]
+    out = []
+
+    for _, row in standings_df.iterrows():
+        if row["team"] in out:
+            continue
+
+        ties = standings_df[standings_df["wins"] == row["wins"]]
+        if len(ties) == 1:
+            out.append(row["team"])
+            continue
+
+        dummies = get_dummies(ties["tiebreaks"].explode()).\
+            groupby(level=0).sum()
+        tie_dummies = ties.merge(dummies, left_index=True, right_index=True)
+        for team in tie_dummies["team"]:
+            if team not in tie_dummies.columns:
+                tie_dummies[team] = 0
+
+        out += tie_dummies.sort_values(
+            by=tie_dummies["team"].to_list(),
+            ascending=[False] * len(tie_dummies)
+        )["team"].to_list()
+
+    position = {team: i for i, team in enumerate(standings_df["team"])}
+
+    return DataFrame({
+        "team": out,
+        "h2h_delta": [position[team] - i for i, team in enumerate(out)]
+    })
+
+
 class SleeperH2HTestDependsClass(unittest.TestCase):
 
     """
@@ -61,3 +112,83 @@ class SleeperH2HTestDependsClass(unittest.TestCase):
 
                 standing_row = str(ind + 1) + ". " + team
                 self.assertIn(standing_row, out)
+
+
+class SleeperH2HTestTiebreaks(unittest.TestCase):
+
+    """
+    TestCase comparing the head-to-head tiebreak of `StandingsResult` with
+    the reference implementation `sort_ties_by_dummies()`
+    """
+
+    def assert_matches_reference(self, result: StandingsResult) -> None:
+
+        """
+        Asserts that a ranked result orders teams and computes deltas as the
+        reference implementation does
+        """
+
+        expected = sort_ties_by_dummies(
+            result.standings_df,
+            result.h2h_board_df
+        )
+        self.assertEqual(
+            result.h2h_standings_df["team"].tolist(),
+            expected["team"].tolist()
+        )
+        self.assertEqual(
+            result.h2h_standings_df["h2h_delta"].tolist(),
+            expected["h2h_delta"].tolist()
+        )
+
+    def test_partial_sweeps(self) -> None:
+
+        """
+        Test a four-way tie where some series are split, so each team sweeps
+        only some of the others, next to an untied leader and last place
+        """
+
+        # teams 1 to 4 are tied; [i, j] counts the wins of i against j
+        win_counts = np.array([
+            [0, 2, 2, 2, 2, 2],
+            [0, 0, 1, 0, 2, 1],
+            [0, 1, 0, 2, 1, 1],
+            [0, 2, 0, 0, 0, 1],
+            [0, 0, 1, 1, 0, 1],
+            [0, 1, 1, 1, 1, 0]
+        ])
+        result = StandingsResult(
+            9,
+            range(1, 7),
+            ["Lead", "A", "B", "C", "D", "Last"],
+            [8, 5, 5, 5, 5, 3],
+            [1, 4, 4, 4, 4, 6],
+            [1000.0, 950.0, 940.0, 930.0, 920.0, 800.0],
+            win_counts
+        )
+        result.rank_h2h()
+
+        self.assertEqual(
+            result.h2h_standings_df["team"].tolist(),
+            ["Lead", "C", "B", "D", "A", "Last"]
+        )
+        self.assertEqual(
+            result.h2h_standings_df["h2h_delta"].tolist(),
+            [0, 2, 0, 1, -3, 0]
+        )
+        self.assert_matches_reference(result)
+
+    def test_multi_way_ties(self) -> None:
+
+        """
+        Test seasons with several groups of three to five teams tied on wins
+        """
+
+        for tie_sizes in [(3, 3), (4,), (5,), (2, 3, 4)]:
+            for seed in range(10):
+                with self.subTest(tie_sizes=tie_sizes, seed=seed):
+                    standings = Standings.from_snapshot(
+                        synthetic.make_snapshot(12, 11, tie_sizes, seed=seed)
+                    )
+                    standings.make_h2h_standings_df()
+                    self.assert_matches_reference(standings.result)
@@ -0,0 +1,202 @@
+"""
+Unit tests for the `daemon` module
+"""
+
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.cache import ResponseCache
+from sleeper_h2h.daemon import Daemon, LeagueJob, Schedule
+from sleeper_h2h.standin import snapshot_responses
+from sleeper_h2h.standings import Standings
+from sleeper_h2h.transport import route
+
+
+class SleeperH2HTestDaemon(unittest.TestCase):
+
+    """
+    TestCase for the `daemon` module
+    """
+
+    def setUp(self) -> None:
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.responses = snapshot_responses(
+            synthetic.make_snapshot(6, 5, seed=8, league_id="1")
+        )
+        self.requests = []
+
+    def tearDown(self) -> None:
+
+        self.tmp_dir.cleanup()
+
+    def transport(self, url: str) -> list | dict:
+
+        """
+        Serves `self.responses`, which the tests edit between ticks
+        """
+
+        self.requests.append(route(url))
+
+        return self.responses[route(url)]
+
+    def score(self, week: int, index: int, points: float) -> None:
+
+        """
+        Adds points to a team's score of a week, and to its roster's total as
+        Sleeper does
+        """
+
+        record = self.responses[f"league/1/matchups/{week}"][index]
+        record["points"] = round(record["points"] + points, 2)
+
+        roster = next(
+            roster for roster in self.responses["league/1/rosters"]
+            if roster["roster_id"] == record["roster_id"]
+        )
+        total = round(
+            roster["settings"]["fpts"] +
+            roster["settings"]["fpts_decimal"] / 100 + points,
+            2
+        )
+        roster["settings"]["fpts"] = int(total)
+        roster["settings"]["fpts_decimal"] = round(total % 1 * 100)
+
+    def play_week(self, week: int) -> None:
+
+        """
+        Adds a scored week which repeats the matchups of week 1
+        """
+
+        self.responses[f"league/1/matchups/{week}"] = [
+            dict(i, points=0.0) for i in self.responses["league/1/matchups/1"]
+        ]
+        for roster in self.responses["league/1/rosters"]:
+            roster["settings"]["wins"] += 1
+        self.responses["league/1"]["settings"]["last_scored_leg"] = week
+        for index, record in enumerate(self.responses["league/1/matchups/1"]):
+            self.score(week, index, record["points"])
+
+    def assert_fresh(self, job: LeagueJob) -> None:
+
+        """
+        Asserts that a job's board equals one computed without any cache
+        """
+
+        fresh = Standings("1", transport=self.transport)
+        fresh.make_h2h_standings_df()
+        self.assertTrue(fresh.h2h_board_df.equals(job.standings.h2h_board_df))
+        self.assertTrue(
+            fresh.h2h_standings_df.equals(job.standings.h2h_standings_df)
+        )
+
+    def test_recompute_only_on_change(self) -> None:
+
+        """
+        Test if unchanged leagues are only polled, and if a corrected or new
+        week gives the same board as a full recompute
+        """
+
+        job = LeagueJob("1")
+        daemon = Daemon(
+            [job],
+            transport=self.transport,
+            backend="svg",
+            out_dir=self.tmp_dir.name
+        )
+
+        self.assertEqual(daemon.tick(), [job])
+        self.assertTrue(job.image_path.exists())
+
+        self.requests.clear()
+        self.assertEqual(daemon.tick(), [])
+        self.assertEqual(
+            self.requests,
+            ["league/1", "league/1/rosters", "league/1/matchups/5"]
+        )
+
+        # a stat correction to the week which was already applied
+        self.score(5, 0, 100)
+        self.assertEqual(daemon.tick(), [job])
+
+        # a new week, applied on top of the previous board
+        self.play_week(6)
+        self.assertEqual(daemon.tick(), [job])
+        self.assertEqual(job.updates, 3)
+        self.assertEqual(job.standings.board_state.week, 7)
+        self.assert_fresh(job)
+
+    def test_corrections_to_past_weeks(self) -> None:
+
+        """
+        Test if a correction to a week before the latest one is picked up,
+        alone or alongside a new week, even though completed weeks are cached
+        permanently
+        """
+
+        cache = ResponseCache(Path(self.tmp_dir.name) / "responses.sqlite3")
+        job = LeagueJob("1")
+        daemon = Daemon([job], cache=cache, transport=self.transport)
+        daemon.tick()
+
+        self.score(2, 1, -40)
+        self.assertEqual(daemon.tick(), [job])
+        self.assert_fresh(job)
+
+        self.score(3, 2, 25.5)
+        self.play_week(6)
+        self.assertEqual(daemon.tick(), [job])
+        self.assertEqual(job.standings.board_state.week, 7)
+        self.assert_fresh(job)
+
+        # with the cache refreshed, the next week extends the board again
+        self.play_week(7)
+        self.requests.clear()
+        self.assertEqual(daemon.tick(), [job])
+        self.assertNotIn("league/1/matchups/3", self.requests)
+        self.assert_fresh(job)
+
+    def test_failed_recompute_keeps_state(self) -> None:
+
+        """
+        Test if a recompute which fails leaves the previous board untouched,
+        and if the league is recomputed on the next tick
+        """
+
+        job = LeagueJob("1")
+        daemon = Daemon([job], transport=self.transport)
+        daemon.tick()
+        previous = job.standings
+        points = previous.board_state.points.copy()
+
+        self.play_week(6)
+        daemon.backend = "unknown"
+        self.assertEqual(daemon.tick(), [])
+        self.assertIsInstance(job.error, ValueError)
+        self.assertEqual(previous.board_state.week, 6)
+        self.assertEqual(previous.board_state.points.tolist(), points.tolist())
+
+        daemon.backend = None
+        self.assertEqual(daemon.tick(), [job])
+        self.assert_fresh(job)
+
+    def test_schedule(self) -> None:
+
+        """
+        Test if polls are frequent inside game windows and never scheduled
+        past the start of the next window
+        """
+
+        schedule = Schedule(active=60, idle=3600)
+        eastern = datetime.timezone(datetime.timedelta(hours=-5))
+
+        sunday = datetime.datetime(2024, 11, 10, 13, tzinfo=eastern)
+        wednesday = datetime.datetime(2024, 11, 13, 12, tzinfo=eastern)
+        kickoff = datetime.datetime(2024, 11, 14, 18, 30, tzinfo=eastern)
+
+        self.assertEqual(schedule.interval(sunday), 60)
+        self.assertEqual(schedule.interval(wednesday), 3600)
+        self.assertEqual(schedule.interval(kickoff), 1800)
@@ -0,0 +1,105 @@
+"""
+Unit tests for the `discord` module
+"""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sleeper_h2h import discord
+
+
+class SleeperH2HTestDeliveryQueue(unittest.TestCase):
+
+    """
+    TestCase for the `discord.DeliveryQueue` class, posting to a local server
+    which rate limits the first request to every webhook
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+
+        cls.requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_POST(self) -> None: # pylint: disable=C0103
+
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                first = not any(p == self.path for p, _ in cls.requests)
+                cls.requests.append((self.path, body))
+
+                if self.path.startswith("/malformed"):
+                    status, payload = 429, b'{"retry_after": "soon"}'
+                elif first:
+                    status, payload = 429, b'{"retry_after": 0.05}'
+                else:
+                    status, payload = 200, b"{}"
+
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(payload)))
+                self.send_header("X-RateLimit-Remaining", "1")
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args) -> None:
+
+                pass
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_send_many(self) -> None:
+
+        """
+        Test if rate limited messages are retried, if messages to a webhook
+        keep their order, and if text and image share one multipart request
+        """
+
+        messages = [
+            discord.Message(f"{self.url}/a", content="first"),
+            discord.Message(f"{self.url}/b", content="other"),
+            discord.Message(
+                f"{self.url}/a",
+                content="second",
+                image_path="examples/h2h_plot-example.png"
+            ),
+        ]
+        deliveries = discord.send_many(messages, max_workers=2)
+
+        self.assertTrue(all(d.ok for d in deliveries))
+        self.assertEqual([d.attempts for d in deliveries], [2, 2, 1])
+
+        bodies = [body for path, body in self.requests if path.startswith("/a")]
+        self.assertIn(b"first", bodies[1])
+        self.assertIn(b"second", bodies[2])
+        self.assertIn(b"attachment://h2h_plot-example.png", bodies[2])
+        self.assertIn(b'filename="h2h_plot-example.png"', bodies[2])
+
+    def test_malformed_rate_limit(self) -> None:
+
+        """
+        Test if a 429 response which cannot be read fails only its message,
+        and if later messages to the same webhook are still sent
+        """
+
+        with discord.DeliveryQueue(max_workers=2) as queue:
+            futures = [
+                queue.submit(discord.Message(f"{self.url}/malformed", "x")),
+                queue.submit(discord.Message(f"{self.url}/malformed", "y")),
+                queue.submit(discord.Message(f"{self.url}/c", "z"))
+            ]
+            deliveries = [future.result(timeout=10) for future in futures]
+
+        self.assertIsInstance(deliveries[0].error, ValueError)
+        self.assertIsInstance(deliveries[1].error, ValueError)
+        self.assertEqual(deliveries[0].response.status_code, 429)
+        self.assertEqual([d.attempts for d in deliveries[:2]], [1, 1])
+        self.assertTrue(deliveries[2].ok)
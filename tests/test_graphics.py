@@ -0,0 +1,110 @@
+"""
+Unit tests for the `graphics` module
+"""
+
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sleeper_h2h import graphics, synthetic
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestGraphics(unittest.TestCase):
+
+    """
+    TestCase for the native backends of the `graphics` module
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+
+        standings = Standings.from_snapshot(
+            synthetic.make_snapshot(8, 10, seed=5)
+        )
+        standings.make_h2h_board_df()
+        cls.board = standings.h2h_board_df
+
+    def test_winrate_colors(self) -> None:
+
+        """
+        Test if winrates are colored by whether they are above, at or below
+        .500, and if NaN is black
+        """
+
+        self.assertEqual(
+            graphics.winrate_colors([1.0, 2 / 3, 0.5, 1 / 3, 0.0, math.nan]),
+            ["green", "green", "yellow", "red", "red", "black"]
+        )
+
+    def test_draw_svg(self) -> None:
+
+        """
+        Test if the SVG backend draws one cell per board entry plus headers
+        """
+
+        svg = graphics.draw_h2h_plot(self.board, backend="svg")
+        n = len(self.board)
+
+        self.assertTrue(svg.startswith("<svg"))
+        self.assertEqual(svg.count("<rect"), 1 + (n + 1) * (n + 2))
+
+    def test_draw_raster(self) -> None:
+
+        """
+        Test if the raster backend writes a PNG of the expected size
+        """
+
+        try:
+            from PIL import Image # pylint: disable=C0415
+        except ImportError:
+            self.skipTest("Pillow is not installed")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "board.png"
+            img = graphics.draw_h2h_plot(self.board, path, backend="raster")
+
+            with Image.open(path) as written:
+                self.assertEqual(written.size, img.size)
+
+        with self.assertRaises(ValueError):
+            graphics.draw_h2h_plot(self.board, backend="pdf")
+
+    def test_render_many(self) -> None:
+
+        """
+        Test if a renderer pool writes every board and reports a board which
+        fails as its exception, without stopping the batch
+        """
+
+        boards = {"a": self.board, "bad": self.board.drop(columns="points")}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with graphics.RendererPool(workers=2) as pool:
+                paths = pool.render(boards, tmp_dir)
+                again = pool.render({"b": self.board}, tmp_dir, fmt="svg")
+
+            self.assertEqual(list(paths), ["a", "bad"])
+            self.assertTrue(paths["a"].is_file())
+            self.assertIsInstance(paths["bad"], KeyError)
+            self.assertEqual(again["b"].suffix, ".svg")
+
+    def test_shutdown_kaleido(self) -> None:
+
+        """
+        Test if Kaleido is shut down through Plotly's scope, and if a scope
+        without the private hook is skipped rather than raising
+        """
+
+        import plotly.io._kaleido # pylint: disable=C0415
+
+        scope = mock.Mock(spec=["_shutdown_kaleido"])
+        with mock.patch.object(plotly.io._kaleido, "scope", scope):
+            graphics._shutdown_kaleido() # pylint: disable=W0212
+        scope._shutdown_kaleido.assert_called_once_with()
+
+        for scope in (None, object()):
+            with mock.patch.object(plotly.io._kaleido, "scope", scope):
+                graphics._shutdown_kaleido() # pylint: disable=W0212
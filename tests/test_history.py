@@ -0,0 +1,106 @@
+"""
+Unit tests for the `history` module
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.cache import ResponseCache
+from sleeper_h2h.history import History
+from sleeper_h2h.standin import StandIn, snapshot_responses
+
+
+class SleeperH2HTestHistory(unittest.TestCase):
+
+    """
+    TestCase for the `history` module
+    """
+
+    def setUp(self) -> None:
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.snapshots = [
+            synthetic.make_snapshot(6, 5, seed=i, league_id=str(i))
+            for i in range(1, 4)
+        ]
+
+        responses = {}
+        for snapshot in self.snapshots:
+            responses.update(snapshot_responses(snapshot))
+        for i in (1, 2):
+            responses[f"league/{i}"]["status"] = "complete"
+            responses[f"league/{i + 1}"]["previous_league_id"] = str(i)
+
+        self.standin = StandIn(responses).start()
+
+    def tearDown(self) -> None:
+
+        self.standin.stop()
+        self.tmp_dir.cleanup()
+
+    def test_all_time_board(self) -> None:
+
+        """
+        Test if the chain of seasons is followed and the all-time win counts
+        are the sum of every season's, matched up by owner
+        """
+
+        history = History("3", max_workers=4, base_url=self.standin.url)
+        history.make_h2h_board_df()
+
+        self.assertEqual(
+            [season.league_id for season in history.seasons],
+            ["3", "2", "1"]
+        )
+
+        expected = np.zeros((6, 6), dtype=int)
+        for season in history.seasons:
+            order = season.board_state.indices(
+                [int(owner) for owner in history.owner_ids]
+            )
+            expected += season.board_state.win_counts[np.ix_(order, order)]
+
+        self.assertEqual(history.win_counts.tolist(), expected.tolist())
+        self.assertEqual(history.win_counts.sum(), 3 * 5 * 3)
+
+        sparse = history.make_sparse_board()
+        owners = sparse.indices(history.owner_ids)
+        self.assertEqual(
+            sparse.submatrix(owners).tolist(),
+            history.win_counts.tolist()
+        )
+        np.testing.assert_allclose(sparse.points[owners], history.points)
+        self.assertAlmostEqual(
+            history.h2h_board_df["points"].sum(),
+            sum(np.nansum(snapshot.scores) for snapshot in self.snapshots)
+        )
+        self.assertEqual(
+            len(History("3", 2, base_url=self.standin.url).seasons),
+            2
+        )
+
+    def test_past_seasons_cached_permanently(self) -> None:
+
+        """
+        Test if a second run only requests the current season once every
+        entry which can expire has expired, and if walking the chain of
+        seasons does not request any league twice
+        """
+
+        cache = ResponseCache(Path(self.tmp_dir.name) / "cache.sqlite3", 0)
+        History("3", cache=cache, base_url=self.standin.url)
+        requests = self.standin.requests
+
+        History("3", cache=cache, base_url=self.standin.url)
+
+        # the current league, then its rosters and users
+        self.assertEqual(self.standin.requests - requests, 3)
+
+        # without a cache, each league is still requested once
+        requests = self.standin.requests
+        History("3", base_url=self.standin.url)
+        self.assertEqual(self.standin.requests - requests, 3 * (3 + 5))
@@ -69,6 +69,35 @@ class SleeperH2HTestUtils(unittest.TestCase):
             list(merged_d.values())
         )
 
+    def test_map_threaded(self) -> None:
+
+        """
+        Test if threaded results keep the order of their inputs and if a worker
+        error is raised to the caller
+        """
+
+        items = list(range(32))
+        random.shuffle(items)
+
+        self.assertEqual(
+            utils.map_threaded(lambda x: x * 2, items, max_workers=8),
+            [x * 2 for x in items]
+        )
+
+        with self.assertRaises(ZeroDivisionError):
+            utils.map_threaded(lambda x: 1 / x, items, max_workers=8)
+
+    def test_team_labels(self) -> None:
+
+        """
+        Test if teams whose names only differ by emojis keep distinct labels
+        """
+
+        self.assertEqual(
+            utils.team_labels({1: "Kings 👑", 2: "Kings", 3: None, 4: "Aces"}),
+            {1: "Kings (1)", 2: "Kings (2)", 3: "Team 3", 4: "Aces"}
+        )
+
     def test_remove_emojis(self) -> None:
 
         """
@@ -0,0 +1,47 @@
+"""
+Unit tests for the `result` module
+"""
+
+import pickle
+import unittest
+
+import numpy as np
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.result import StandingsResult
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestStandingsResult(unittest.TestCase):
+
+    """
+    TestCase for the `StandingsResult` class
+    """
+
+    def test_lazy_frames(self) -> None:
+
+        """
+        Test if a Standings object stores only typed arrays, builds its
+        DataFrames on request, and survives pickling
+        """
+
+        snapshot = synthetic.make_snapshot(8, 6, (3,), seed=4)
+        standings = Standings.from_snapshot(snapshot)
+        self.assertTrue(standings.h2h_board_df.empty)
+
+        standings.make_h2h_standings_df()
+        result = standings.result
+
+        self.assertIsInstance(result, StandingsResult)
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(result.win_counts.dtype, np.int16)
+        self.assertIsNot(standings.h2h_board_df, standings.h2h_board_df)
+        self.assertEqual(
+            standings.h2h_standings_df["team"].tolist(),
+            [result.teams[i] for i in result.order]
+        )
+
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertTrue(
+            restored.h2h_standings_df.equals(standings.h2h_standings_df)
+        )
@@ -0,0 +1,101 @@
+"""
+Unit tests for the `service` module
+"""
+
+import json
+import time
+import unittest
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.service import BoardCache, QueryService
+from sleeper_h2h.standin import StandIn
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestService(unittest.TestCase):
+
+    """
+    TestCase for the `service` module
+    """
+
+    def test_board_cache(self) -> None:
+
+        """
+        Test if concurrent misses share one computation, if the least recently
+        used entry is evicted, and if current standings expire
+        """
+
+        calls = []
+
+        def compute(league_id: str, week: int) -> tuple:
+            calls.append((league_id, week))
+            time.sleep(0.05)
+            return league_id, week
+
+        boards = BoardCache(compute, max_size=2, max_age=0)
+
+        with ThreadPoolExecutor(8) as executor:
+            entries = list(executor.map(lambda _: boards.get("1", 3), range(8)))
+
+        self.assertEqual(calls, [("1", 3)])
+        self.assertTrue(all(entry is entries[0] for entry in entries))
+        self.assertEqual((boards.hits, boards.misses), (7, 1))
+
+        boards.get("2", 3)
+        boards.get("1", 3)
+        boards.get("3", 3)
+        self.assertEqual(len(boards), 2)
+        boards.get("2", 3)
+        self.assertEqual(calls.count(("2", 3)), 2)
+
+        boards.get("1")
+        boards.get("1")
+        self.assertEqual(calls.count(("1", None)), 2)
+
+    def test_endpoints(self) -> None:
+
+        """
+        Test if every endpoint answers from one computation per key, and if
+        bad weeks and unknown leagues are client errors
+        """
+
+        snapshot = synthetic.make_snapshot(6, 5, seed=3, league_id="1")
+        expected = Standings.from_snapshot(snapshot)
+        expected.make_h2h_standings_df()
+
+        with StandIn.from_snapshots([snapshot]) as standin, \
+                QueryService(base_url=standin.url) as service:
+            def get(path: str) -> tuple[int, bytes]:
+                with urllib.request.urlopen(service.url + path) as response:
+                    return response.status, response.read()
+
+            for path in ("standings", "h2h_board", "text", "board.svg"):
+                self.assertEqual(get(f"/leagues/1/{path}")[0], 200)
+
+            _, body = get("/leagues/1/h2h_standings")
+            self.assertEqual(
+                [row["team"] for row in json.loads(body)],
+                expected.h2h_standings_df["team"].tolist()
+            )
+
+            _, body = get("/leagues/1/standings?week=2")
+            self.assertTrue(all(
+                row["wins"] + row["losses"] == 2 for row in json.loads(body)
+            ))
+            requests_made = standin.requests
+            self.assertEqual(get("/leagues/1/text")[0], 200)
+            self.assertEqual(get("/leagues/1/h2h_board?week=2")[0], 200)
+            self.assertEqual(standin.requests, requests_made)
+            self.assertEqual(service.boards.misses, 2)
+
+            for path, status in (
+                    ("/leagues/1/text?week=9", 400),
+                    ("/leagues/2/text", 404),
+                    ("/leagues/1/board.gif", 404)
+                ):
+                with self.assertRaises(urllib.error.HTTPError) as error:
+                    get(path)
+                self.assertEqual(error.exception.code, status)
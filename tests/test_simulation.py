@@ -0,0 +1,122 @@
+"""
+Unit tests for the `simulation` module
+"""
+
+import copy
+import unittest
+
+import numpy as np
+
+from sleeper_h2h import simulation, synthetic
+from sleeper_h2h.result import StandingsResult
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestSimulation(unittest.TestCase):
+
+    """
+    TestCase for the `simulation` module
+    """
+
+    def test_h2h_order_matches_standings(self) -> None:
+
+        """
+        Test if the vectorized ranking agrees with `make_h2h_standings_df()`
+        on seasons with several multi-way ties
+        """
+
+        for seed in range(20):
+            snapshot = synthetic.make_snapshot(10, 8, (3, 3), seed=seed)
+            standings = Standings.from_snapshot(snapshot)
+            standings.make_h2h_standings_df()
+            order = standings.board_state.indices(snapshot.roster_ids)
+
+            ranked = simulation.h2h_order(
+                snapshot.wins[None],
+                snapshot.losses[None],
+                standings.standings_df["points"].to_numpy()[None],
+                standings.board_state.win_counts[np.ix_(order, order)][None]
+            )[0]
+
+            self.assertEqual(
+                standings.standings_df["team"].iloc[ranked].tolist(),
+                standings.h2h_standings_df["team"].tolist()
+            )
+
+    def test_simulate_playoff_odds(self) -> None:
+
+        """
+        Test if seed probabilities are distributions which are reproducible
+        from a seed, and certain when no week remains
+        """
+
+        snapshot = synthetic.make_snapshot(8, 5, seed=2)
+        standings = Standings.from_snapshot(snapshot)
+        schedule = [
+            [
+                (int(snapshot.roster_ids[team]), min(team, opponent) + 1, 0)
+                for team, opponent in enumerate(week)
+            ]
+            for week in synthetic.round_robin(8, 9)[5:]
+        ]
+
+        odds = standings.simulate_playoff_odds(
+            25000,
+            schedule,
+            playoff_teams=4,
+            seed=5
+        )
+        seeds = odds.drop(columns="playoffs")
+
+        self.assertTrue(np.allclose(seeds.sum(axis=0), 1))
+        self.assertTrue(np.allclose(seeds.sum(axis=1), 1))
+        self.assertAlmostEqual(odds["playoffs"].sum(), 4)
+        self.assertTrue(odds.equals(
+            standings.simulate_playoff_odds(25000, schedule, None, 4, seed=5)
+        ))
+
+        standings.make_h2h_standings_df()
+        final = standings.simulate_playoff_odds(10)
+        self.assertEqual(
+            final.idxmax(axis=0).tolist(),
+            standings.h2h_standings_df["team"].tolist()
+        )
+
+    def test_simulate_after_earlier_week(self) -> None:
+
+        """
+        Test if odds simulated after `update_to_week()` to an earlier week go
+        to the teams which play the remaining schedule
+        """
+
+        standings = Standings.from_snapshot(
+            synthetic.make_snapshot(8, 10, seed=4)
+        )
+        standings.update_to_week(6)
+        result = standings.result
+
+        # only rosters 2 and 4 play, and roster 2 always wins
+        schedule = [[(2, 1, 500.0), (4, 1, 0.0)]] * 4
+        winner = result.roster_ids.tolist().index(2)
+
+        def score_model(_, size: tuple) -> np.ndarray:
+
+            scores = np.zeros(size)
+            scores[..., winner] = 500
+            return scores
+
+        odds = standings.simulate_playoff_odds(10, schedule, score_model)
+
+        board_state = copy.deepcopy(standings.board_state)
+        for records in schedule:
+            board_state.apply_week(records)
+        final = StandingsResult.from_board_state(
+            board_state,
+            standings._metadata.user_id_team_map # pylint: disable=W0212
+        )
+
+        self.assertEqual(
+            odds.idxmax(axis=0).tolist(),
+            [final.teams[i] for i in final.order]
+        )
+        self.assertEqual(odds.index.tolist(), list(result.teams))
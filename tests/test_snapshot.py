@@ -0,0 +1,122 @@
+"""
+Unit tests for the `snapshot` module
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from sleeper_h2h.snapshot import SeasonSnapshot
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestSeasonSnapshot(unittest.TestCase):
+
+    """
+    TestCase for the `snapshot` module
+    """
+
+    def setUp(self) -> None:
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "season.npz"
+        self.snapshot = SeasonSnapshot(
+            league_id="1234",
+            week=3,
+            roster_ids=np.array([2, 1, 3, 4]),
+            teams=np.array(["b", "a", "c", "d"]),
+            wins=np.array([2, 1, 1, 0]),
+            losses=np.array([0, 1, 1, 2]),
+            fpts=np.array([200, 180, 150, 140]),
+            scores=np.array([
+                [110.5, 100.0, 80.0, 70.25],
+                [90.0, 80.0, 70.0, np.nan],
+            ]),
+            matchup_ids=np.array([[1, 1, 2, 2], [1, 2, 1, -1]])
+        )
+
+    def tearDown(self) -> None:
+
+        self.tmp_dir.cleanup()
+
+    def test_save_and_load(self) -> None:
+
+        """
+        Test if a saved snapshot loads back with identical arrays, whether or
+        not it is memory-mapped
+        """
+
+        self.snapshot.save(self.path)
+
+        for mmap in (False, True):
+            with self.subTest(mmap=mmap):
+                loaded = SeasonSnapshot.load(self.path, mmap=mmap)
+
+                self.assertEqual(loaded.league_id, "1234")
+                self.assertEqual(loaded.week, 3)
+                self.assertEqual(loaded.teams.tolist(), ["b", "a", "c", "d"])
+                np.testing.assert_array_equal(
+                    loaded.scores,
+                    self.snapshot.scores
+                )
+                self.assertEqual(loaded.records(2), self.snapshot.records(2))
+
+    def test_records_skip_missing_teams(self) -> None:
+
+        """
+        Test if teams without a matchup are skipped and unpaired teams have
+        no matchup ID
+        """
+
+        self.snapshot.matchup_ids[1, 2] = -1
+
+        self.assertEqual(
+            self.snapshot.records(2),
+            [(2, 1, 90.0), (1, 2, 80.0), (3, None, 70.0)]
+        )
+
+    def test_reductions_and_round_trip(self) -> None:
+
+        """
+        Test if points and weekly highs reduce the score array, skipping
+        missing teams, and if a Standings object rebuilds the same arrays
+        """
+
+        np.testing.assert_array_equal(
+            self.snapshot.points(),
+            [200.5, 180.0, 150.0, 70.25]
+        )
+        roster_ids, scores = self.snapshot.weekly_highs()
+        self.assertEqual(roster_ids.tolist(), [2, 2])
+        self.assertEqual(scores.tolist(), [110.5, 90.0])
+
+        rebuilt = Standings.from_snapshot(self.snapshot).to_snapshot()
+        np.testing.assert_array_equal(rebuilt.scores, self.snapshot.scores)
+        np.testing.assert_array_equal(
+            rebuilt.matchup_ids,
+            self.snapshot.matchup_ids
+        )
+
+    def test_standings_from_snapshot(self) -> None:
+
+        """
+        Test if a Standings object built from a saved snapshot computes its
+        board without any network client, and if it snapshots back to the
+        same arrays
+        """
+
+        self.snapshot.save(self.path)
+        standings = Standings.from_snapshot(str(self.path), mmap=True)
+        standings.make_h2h_standings_df()
+
+        self.assertIsNone(standings._metadata.league) # pylint: disable=W0212
+        self.assertEqual(standings.h2h_board_df.loc["b", "a"], 1.0)
+        self.assertEqual(standings.standings_df["points"].tolist(), [
+            200.5, 180.0, 150.0, 70.25
+        ])
+        np.testing.assert_array_equal(
+            standings.to_snapshot().matchup_ids,
+            self.snapshot.matchup_ids
+        )
@@ -0,0 +1,84 @@
+"""
+Unit tests for the `sparse` module
+"""
+
+import unittest
+
+import numpy as np
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.result import StandingsResult
+from sleeper_h2h.sparse import SparseBoard
+from sleeper_h2h.standings import BoardState, Standings
+
+
+class SleeperH2HTestSparseBoard(unittest.TestCase):
+
+    """
+    TestCase for the `sparse` module
+    """
+
+    def test_matches_dense_board(self) -> None:
+
+        """
+        Test if a board built from matchups agrees with `BoardState` and with
+        the head-to-head ranking of a dense result
+        """
+
+        for seed in range(5):
+            snapshot = synthetic.make_snapshot(10, 9, (3, 3), seed=seed)
+            labels = dict(zip(snapshot.roster_ids.tolist(), snapshot.teams))
+            board = SparseBoard(labels=labels)
+            state = BoardState(snapshot.roster_ids.tolist())
+
+            for week in range(1, snapshot.week):
+                board.apply_week(snapshot.records(week))
+                state.apply_week(snapshot.records(week))
+
+            self.assertEqual(
+                board.submatrix(board.indices(state.roster_ids)).tolist(),
+                state.win_counts.tolist()
+            )
+            self.assertLessEqual(board.nnz, (snapshot.week - 1) * 5)
+
+            dense = StandingsResult.from_board_state(state, labels)
+            self.assertEqual(
+                board.h2h_standings_df()["team"].tolist(),
+                dense.h2h_standings_df["team"].tolist()
+            )
+            self.assertEqual(
+                board.h2h_standings_df()["h2h_delta"].tolist(),
+                dense.h2h_standings_df["h2h_delta"].tolist()
+            )
+
+    def test_league_of_leagues(self) -> None:
+
+        """
+        Test if boards of several leagues combine without any pair of teams
+        from different leagues, and if a subset of teams is made dense
+        """
+
+        standings = [
+            Standings.from_snapshot(
+                synthetic.make_snapshot(8, 7, seed=i, league_id=str(i))
+            )
+            for i in range(4)
+        ]
+        board = SparseBoard.from_standings(standings)
+
+        self.assertEqual(len(board.keys), 32)
+        self.assertEqual(board.wins().sum(), 4 * 7 * 4)
+        self.assertTrue(all(
+            board.keys[i][0] == board.keys[j][0]
+            for i, j in zip(board.rows, board.cols)
+        ))
+        self.assertTrue(np.array_equal(
+            board.to_dense()[board.rows, board.cols],
+            board.counts
+        ))
+
+        keys = [("0", 1), ("1", 1)]
+        subset = board.h2h_board_df(keys)
+        self.assertEqual(subset.shape, (2, 3))
+        self.assertTrue(subset.iloc[:, :2].isna().all().all())
+        self.assertEqual(len(board.h2h_standings_df()), 32)
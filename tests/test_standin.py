@@ -0,0 +1,90 @@
+"""
+Unit tests for the `standin` module
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from requests import HTTPError
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.standin import StandIn
+from sleeper_h2h.standings import Standings
+from sleeper_h2h.transport import Recorder, Replayer, route
+
+
+class SleeperH2HTestStandIn(unittest.TestCase):
+
+    """
+    TestCase for the `standin` and `transport` modules
+    """
+
+    def setUp(self) -> None:
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "recording.json"
+        self.snapshot = synthetic.make_snapshot(8, 5, seed=3, league_id="42")
+
+    def tearDown(self) -> None:
+
+        self.tmp_dir.cleanup()
+
+    def test_route(self) -> None:
+
+        """
+        Test if URLs of different servers share a route
+        """
+
+        self.assertEqual(
+            route("https://api.sleeper.app/v1/league/42/matchups/3"),
+            route("http://127.0.0.1:8000/v1/league/42/matchups/3?x=1")
+        )
+
+        with self.assertRaises(ValueError):
+            route("https://api.sleeper.app/v1/user/42")
+
+    def test_fetch_record_and_replay(self) -> None:
+
+        """
+        Test if Standings fetched from the stand-in match the snapshot it
+        serves, and if a recording of the fetch replays without a server
+        """
+
+        expected = Standings.from_snapshot(self.snapshot)
+        expected.make_h2h_standings_df()
+        recorder = Recorder(self.path)
+
+        with StandIn.from_snapshots([self.snapshot]) as standin:
+            standings = Standings(
+                "42",
+                max_workers=4,
+                base_url=standin.url,
+                transport=recorder
+            )
+            standings.make_h2h_standings_df()
+
+        recorder.save()
+        replayed = Standings("42", transport=Replayer(self.path))
+        replayed.make_h2h_standings_df()
+
+        self.assertEqual(standin.requests, 8)
+        for std in (standings, replayed):
+            self.assertEqual(
+                std.h2h_standings_df.to_numpy().tolist(),
+                expected.h2h_standings_df.to_numpy().tolist()
+            )
+
+    def test_error_injection(self) -> None:
+
+        """
+        Test if injected errors and unknown leagues are raised as HTTPErrors
+        """
+
+        with StandIn.from_snapshots([self.snapshot], error_rate=1) as standin:
+            with self.assertRaisesRegex(HTTPError, "500"):
+                Standings("42", base_url=standin.url)
+
+        with StandIn.from_snapshots([self.snapshot]) as standin:
+            with self.assertRaisesRegex(HTTPError, "404"):
+                Standings("7", base_url=standin.url)
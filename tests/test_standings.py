@@ -0,0 +1,296 @@
+"""
+Unit tests for the `standings` module
+"""
+
+import copy
+import math
+import random
+import unittest
+
+import numpy as np
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.standin import snapshot_responses
+from sleeper_h2h.standings import BoardState, MatchupStore, Metadata, Standings
+from sleeper_h2h.transport import route
+
+
+class SleeperH2HTestMatchupStore(unittest.TestCase):
+
+    """
+    TestCase for the `MatchupStore` class
+    """
+
+    class CountingLeague:
+
+        """
+        Stand-in for a `League` which counts `get_matchups()` calls
+        """
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def get_matchups(self, week: int) -> list[dict]:
+            self.calls += 1
+            return [{"roster_id": 1, "matchup_id": 1, "points": week * 1.5}]
+
+    def test_each_week_fetched_once(self) -> None:
+
+        """
+        Test if repeated lookups of the same weeks only fetch each week once
+        and are counted as hits
+        """
+
+        league = self.CountingLeague()
+        store = MatchupStore(league)
+
+        for _ in range(2):
+            for week in range(1, 4):
+                store.get(week)
+
+        self.assertEqual(league.calls, 3)
+        self.assertEqual((store.hits, store.misses), (3, 3))
+        self.assertEqual(store.get(2), [(1, 1, 3.0)])
+
+    def test_invalidate(self) -> None:
+
+        """
+        Test if invalidated weeks are fetched again on the next lookup
+        """
+
+        league = self.CountingLeague()
+        store = MatchupStore(league)
+        store.get(1)
+        store.get(2)
+
+        store.invalidate(1)
+        store.get(1)
+        store.get(2)
+        self.assertEqual(league.calls, 3)
+
+        store.invalidate()
+        store.get(2)
+        self.assertEqual(league.calls, 4)
+
+    def test_prefetch_concurrent(self) -> None:
+
+        """
+        Test if concurrently prefetched weeks are stored in order and are then
+        served as hits
+        """
+
+        league = self.CountingLeague()
+        store = MatchupStore(league)
+        store.prefetch(range(1, 9), max_workers=4)
+
+        self.assertEqual(league.calls, 8)
+        self.assertEqual(
+            [store.get(week)[0][2] for week in range(1, 9)],
+            [week * 1.5 for week in range(1, 9)]
+        )
+        self.assertEqual((store.hits, store.misses), (8, 8))
+
+
+class SleeperH2HTestMetadata(unittest.TestCase):
+
+    """
+    TestCase for the `Metadata` class
+    """
+
+    def test_standings_order(self) -> None:
+
+        """
+        Test if rosters are ranked as `League.get_standings()` ranks them,
+        including teams tied on wins, losses and points, which are ordered by
+        team name
+        """
+
+        snapshot = synthetic.make_snapshot(8, 4, tie_sizes=(), seed=2)
+        responses = snapshot_responses(snapshot)
+        rosters = responses["league/0/rosters"]
+        for roster in rosters[2:6]:
+            roster["settings"].update(wins=2, losses=2, fpts=400)
+        random.Random(0).shuffle(rosters)
+
+        metadata = Metadata(
+            "0",
+            transport=lambda url: copy.deepcopy(responses[route(url)])
+        )
+
+        self.assertEqual(
+            metadata.standings,
+            metadata.league.get_standings(rosters, responses["league/0/users"])
+        )
+        self.assertEqual(
+            [row[0] for row in metadata.standings[2:6]],
+            sorted(snapshot.teams[2:6], reverse=True)
+        )
+
+
+class SleeperH2HTestBoardState(unittest.TestCase):
+
+    """
+    TestCase for the `BoardState` class
+    """
+
+    roster_ids = [1, 2, 3, 4]
+    weeks = [
+        [(1, 1, 100.0), (2, 1, 90.5), (3, 2, 80.0), (4, 2, 80.0)],
+        [(1, 1, 70.0), (3, 1, 75.0), (2, 2, 60.0), (4, 2, 50.25)],
+        [(1, 1, 99.0), (2, 1, 98.0), (3, None, 10.0), (4, None, 20.0)],
+    ]
+
+    def test_apply_week(self) -> None:
+
+        """
+        Test if wins and points accumulate per matchup, and if tied or
+        unpaired matchups add points but no wins
+        """
+
+        state = BoardState(self.roster_ids)
+        for records in self.weeks:
+            state.apply_week(records)
+
+        self.assertEqual(state.week, 4)
+        self.assertEqual(state.win_counts.tolist(), [
+            [0, 2, 0, 0],
+            [0, 0, 0, 1],
+            [1, 0, 0, 0],
+            [0, 0, 0, 0],
+        ])
+        self.assertEqual(state.points.tolist(), [269.0, 248.5, 165.0, 150.25])
+
+    def test_winrates(self) -> None:
+
+        """
+        Test if winrates are ordered by the requested roster IDs and are NaN
+        for teams which never played each other
+        """
+
+        state = BoardState(self.roster_ids)
+        for records in self.weeks:
+            state.apply_week(records)
+
+        winrates = state.winrates([3, 1, 2, 4])
+
+        self.assertEqual(winrates[1, 2], 1.0)
+        self.assertEqual(winrates[1, 0], 0.0)
+        self.assertTrue(all(math.isnan(winrates[i, i]) for i in range(4)))
+        self.assertTrue(math.isnan(winrates[0, 3]))
+
+        with self.assertRaises(KeyError):
+            state.indices([5])
+
+
+class SleeperH2HTestStandings(unittest.TestCase):
+
+    """
+    TestCase for the `Standings` class
+    """
+
+    def test_iter_weekly(self) -> None:
+
+        """
+        Test if the weekly standings count one game per team per week and if
+        the last week agrees with `make_h2h_standings_df()` without touching
+        the Standings object's own board state
+        """
+
+        for seed in range(10):
+            snapshot = synthetic.make_snapshot(10, 9, (3, 3), seed=seed)
+            standings = Standings.from_snapshot(snapshot)
+            weeks = list(standings.iter_weekly(start=3))
+
+            self.assertEqual([week.week for week in weeks], list(range(3, 10)))
+            self.assertIsNone(standings.board_state)
+            for week in weeks:
+                games = week.standings_df[["wins", "losses"]].sum(axis=1)
+                self.assertTrue((games == week.week).all())
+                self.assertEqual(week.h2h_standings_df["h2h_delta"].sum(), 0)
+
+            standings.make_h2h_standings_df()
+            self.assertTrue(weeks[-1].h2h_board_df.equals(standings.h2h_board_df))
+            self.assertTrue(
+                weeks[-1].h2h_standings_df.equals(standings.h2h_standings_df)
+            )
+
+    def test_iter_weekly_bounds(self) -> None:
+
+        """
+        Test if an end week outside the played weeks raises on the call,
+        before any week is fetched
+        """
+
+        standings = Standings.from_snapshot(synthetic.make_snapshot(6, 4))
+
+        self.assertEqual(len(list(standings.iter_weekly(end=4))), 4)
+        for end in (0, 5, 12):
+            with self.assertRaises(ValueError):
+                standings.iter_weekly(end=end)
+
+    def test_duplicate_team_names(self) -> None:
+
+        """
+        Test if teams whose names only differ by emojis keep distinct labels
+        in the head-to-head board, and if points are exact
+        """
+
+        snapshot = synthetic.make_snapshot(4, 3, tie_sizes=(), seed=1)
+        snapshot.teams[:2] = ["Kings 👑", "Kings"]
+        standings = Standings.from_snapshot(snapshot)
+        standings.make_h2h_standings_df()
+
+        self.assertEqual(
+            standings.h2h_board_df.index.tolist()[:2],
+            [f"Kings ({i})" for i in snapshot.roster_ids[:2]]
+        )
+        self.assertEqual(
+            standings.standings_df["points"].tolist(),
+            np.nansum(snapshot.scores, axis=0).tolist()
+        )
+
+    def test_incremental_update_matches_rebuild(self) -> None:
+
+        """
+        Test if boards updated from an earlier week, or from the saved
+        `board_state` of a previous run, equal a full rebuild, and if a past
+        week counts only the matchups before it
+        """
+
+        for seed in range(5):
+            snapshot = synthetic.make_snapshot(8, 6, (3,), seed=seed)
+            rebuilt = Standings.from_snapshot(snapshot)
+            rebuilt.make_h2h_standings_df()
+
+            standings = Standings.from_snapshot(snapshot)
+            standings.update_to_week(4)
+            past = next(standings.iter_weekly(3, 3))
+
+            self.assertEqual(standings._metadata.week, 7) # pylint: disable=W0212
+            self.assertTrue(
+                standings.standings_df.equals(past.standings_df)
+            )
+            self.assertTrue(
+                (standings.standings_df[["wins", "losses"]].sum(axis=1) == 3)
+                .all()
+            )
+
+            resumed = Standings.from_snapshot(snapshot)
+            resumed.board_state = copy.deepcopy(standings.board_state)
+            resumed.make_h2h_standings_df()
+            standings.make_h2h_board_df()
+            standings.make_h2h_standings_df()
+
+            for updated in (standings, resumed):
+                self.assertTrue(
+                    updated.standings_df.equals(rebuilt.standings_df)
+                )
+                self.assertTrue(
+                    updated.h2h_board_df.equals(rebuilt.h2h_board_df)
+                )
+                self.assertTrue(
+                    updated.h2h_standings_df.equals(rebuilt.h2h_standings_df)
+                )
+
+            with self.assertRaises(ValueError):
+                standings.update_to_week(8)
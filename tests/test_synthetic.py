@@ -0,0 +1,57 @@
+"""
+Unit tests for the `synthetic` module
+"""
+
+import unittest
+
+import numpy as np
+
+from sleeper_h2h import synthetic
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestSynthetic(unittest.TestCase):
+
+    """
+    TestCase for the `synthetic` module
+    """
+
+    def test_round_robin(self) -> None:
+
+        """
+        Test if every team plays exactly once per week and never repeats an
+        opponent before playing every other team
+        """
+
+        opponents = synthetic.round_robin(10, 9)
+
+        for week in opponents:
+            self.assertEqual(sorted(week), list(range(10)))
+            self.assertEqual(week[week].tolist(), list(range(10)))
+        for team in range(10):
+            self.assertEqual(
+                sorted(opponents[:, team]),
+                [i for i in range(10) if i != team]
+            )
+
+    def test_make_snapshot(self) -> None:
+
+        """
+        Test if a generated season has standings consistent with its scores
+        and a multi-way tie which Standings can resolve
+        """
+
+        snapshot = synthetic.make_snapshot(12, 10, tie_sizes=(4,), seed=7)
+        standings = Standings.from_snapshot(snapshot)
+        standings.make_h2h_standings_df()
+
+        self.assertEqual(standings._metadata.week, 11) # pylint: disable=W0212
+        self.assertEqual((snapshot.wins + snapshot.losses).tolist(), [10] * 12)
+        self.assertGreaterEqual(
+            np.unique(snapshot.wins, return_counts=True)[1].max(),
+            4
+        )
+        self.assertEqual(standings.h2h_standings_df["h2h_delta"].sum(), 0)
+
+        with self.assertRaises(ValueError):
+            synthetic.make_snapshot(9, 10)
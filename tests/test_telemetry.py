@@ -0,0 +1,97 @@
+"""
+Unit tests for the `telemetry` module
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from sleeper_h2h import synthetic, telemetry
+from sleeper_h2h.standin import StandIn
+from sleeper_h2h.standings import Standings
+
+
+class SleeperH2HTestTelemetry(unittest.TestCase):
+
+    """
+    TestCase for the `telemetry` module
+    """
+
+    def test_disabled_records_nothing(self) -> None:
+
+        """
+        Test if spans and counters are no-ops until instrumentation is enabled
+        """
+
+        self.assertIsNone(telemetry.disable())
+
+        with telemetry.span("stage", league_id="1") as span:
+            span.set(rows=1)
+        telemetry.count("api_requests")
+
+        with telemetry.collect() as report:
+            pass
+        self.assertEqual((list(report.spans), report.counters), ([], {}))
+
+    def test_collect_standings_run(self) -> None:
+
+        """
+        Test if a run reports its stages, API calls and DataFrame sizes
+        through the hook, a JSON report and Prometheus text
+        """
+
+        snapshot = synthetic.make_snapshot(6, 4, seed=1, league_id="1")
+        ended = []
+
+        with StandIn.from_snapshots([snapshot]) as standin, \
+                telemetry.collect(ended.append) as report:
+            Standings("1", base_url=standin.url).make_h2h_standings_df()
+
+        stages = report.stages()
+        self.assertEqual(ended, list(report.spans))
+        self.assertEqual(stages["api_request"]["calls"], standin.requests)
+        self.assertEqual(report.counters["api_requests"], standin.requests)
+        self.assertGreater(report.counters["api_bytes"], 0)
+        self.assertTrue({"metadata", "apply_weeks"} <= set(stages))
+
+        board = [span for span in report.spans if span.name == "h2h_board"]
+        self.assertEqual(board[0].attributes["teams"], 6)
+        self.assertGreater(board[0].attributes["bytes"], 0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "report.json"
+            report.save(path)
+            self.assertEqual(
+                json.loads(path.read_text())["counters"],
+                report.counters
+            )
+
+        self.assertIn(
+            'sleeper_h2h_stage_calls_total{stage="metadata"} 1',
+            report.to_prometheus()
+        )
+
+    def test_spans_bounded(self) -> None:
+
+        """
+        Test if only the most recent spans are kept while stage totals count
+        every span
+        """
+
+        with telemetry.collect(max_spans=3) as report:
+            for i in range(10):
+                with telemetry.span("stage", i=i):
+                    pass
+
+        self.assertEqual(
+            [span.attributes["i"] for span in report.spans],
+            [7, 8, 9]
+        )
+        stage = report.stages()["stage"]
+        self.assertEqual(stage["calls"], 10)
+        self.assertLessEqual(stage["max_wall"], stage["wall"])
+        self.assertIn(
+            'sleeper_h2h_stage_wall_seconds_max{stage="stage"}',
+            report.to_prometheus()
+        )